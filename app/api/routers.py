@@ -1,8 +1,11 @@
 from fastapi import APIRouter
 from app.api.v1 import api_router
 from app.api.v2 import api_router as api_router_v2
+from app.modules.admin.router import router as admin_router
 from app.core.config import settings
 
 router = APIRouter()
 router.include_router(api_router, prefix=settings.API_V1_STR)
 router.include_router(api_router_v2, prefix=settings.API_V2_STR)
+# 내부 관리용 (문서 미노출)
+router.include_router(admin_router, prefix="/internal", tags=["internal"], include_in_schema=False)
@@ -17,6 +17,29 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     API_V2_STR: str = "/api/v2"
     DATA_DIR: str = os.getenv("DATA_DIR", "./data")
+    # 내부 관리 API 토큰 (X-Admin-Token 헤더로 전달, 설정하지 않으면 관리 API 비활성화)
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+
+    # 장 마감 후 일봉이 확정(적재)된 것으로 보기까지의 대기 시간(분)
+    MARKET_SETTLE_MINUTES: int = int(os.getenv("MARKET_SETTLE_MINUTES", 120))
+    # 거래소 휴장일 파일 (비어 있으면 app/modules/common/data/market_holidays.json)
+    MARKET_HOLIDAYS_PATH: str = os.getenv("MARKET_HOLIDAYS_PATH", "")
+    # 휴장일 표가 이 일수 이내에 끝나면 시작 시 경고
+    MARKET_HOLIDAY_WARN_DAYS: int = int(os.getenv("MARKET_HOLIDAY_WARN_DAYS", 90))
+
+    # 디스크 캐시(L2) 네임스페이스별 최대 크기(bytes) / 파일 보관 기간(일, 0 이면 제한 없음) / 정리 주기(초)
+    DISK_CACHE_MAX_BYTES: int = int(os.getenv("DISK_CACHE_MAX_BYTES", 2 * 1024**3))
+    DISK_CACHE_MAX_AGE_DAYS: int = int(os.getenv("DISK_CACHE_MAX_AGE_DAYS", 180))
+    DISK_CACHE_PRUNE_INTERVAL_SECONDS: int = int(os.getenv("DISK_CACHE_PRUNE_INTERVAL_SECONDS", 60 * 10))
+
+    # Cache warm-up settings
+    WARMUP_ENABLED: bool = os.getenv("WARMUP_ENABLED", "True").lower() == "true"
+    WARMUP_TICKERS: str = os.getenv("WARMUP_TICKERS", "")  # 예: "kr:005930,us:AAPL"
+    WARMUP_TOP_N: int = int(os.getenv("WARMUP_TOP_N", 30))
+    WARMUP_INTERVAL_SECONDS: int = int(os.getenv("WARMUP_INTERVAL_SECONDS", 60 * 30))
+    WARMUP_CONCURRENCY: int = int(os.getenv("WARMUP_CONCURRENCY", 4))
+    # 조회 통계 반감기 (초, 오래전 조회 횟수는 점점 줄어들어 최근 인기 종목이 우선됨)
+    WARMUP_STATS_HALF_LIFE_SECONDS: int = int(os.getenv("WARMUP_STATS_HALF_LIFE_SECONDS", 60 * 60 * 24))
 
     # RDS settings
     RDS_HOST: str = os.getenv("RDS_HOST", "")
@@ -24,6 +47,8 @@ class Settings(BaseSettings):
     RDS_PASSWORD: str = os.getenv("RDS_PASSWORD", "")
     RDS_DB: str = os.getenv("RDS_DB", "")
     RDS_PORT: int = os.getenv("RDS_PORT", 3306)
+    # 테이블 정의 파일 캐시 버전 (스키마 변경 배포 시 올림)
+    DB_SCHEMA_VERSION: str = os.getenv("DB_SCHEMA_VERSION", "1")
 
     class Config:
         env_file = f".env.{ENV}"
@@ -45,6 +70,12 @@ class DatabaseConfig:
     DB_URL: str
     DB_POOL_RECYCLE: int = 3600
     DB_ECHO: bool = True
+    # SQLAlchemy 컴파일 캐시 크기 (create_engine query_cache_size)
+    DB_QUERY_CACHE_SIZE: int = 500
+    # kwargs 조건 쿼리의 형태별 문장 캐시 크기 (0 이면 사용 안 함)
+    DB_STATEMENT_CACHE_SIZE: int = 512
+    # 이 시간(초) 이상 유휴 상태였던 connection 만 checkout 시 연결 확인
+    DB_PING_IDLE_SECONDS: int = 60
 
 
 class DevConfig(DatabaseConfig):
@@ -17,6 +17,13 @@ class InvalidTokenException(AuthException):
         super().__init__(message="유효하지 않은 토큰입니다", status_code=401, error_code="INVALID_TOKEN")
 
 
+class AdminDisabledException(AuthException):
+    def __init__(self):
+        super().__init__(
+            message="관리 API 토큰이 설정되지 않아 사용할 수 없습니다", status_code=403, error_code="ADMIN_DISABLED"
+        )
+
+
 class UserException(CustomException):
     """사용자 관련 기본 예외 클래스"""
 
@@ -75,6 +82,42 @@ class DataNotFoundException(FinancialException):
         )
 
 
+class InvalidCursorException(FinancialException):
+    """페이지 커서를 해석할 수 없는 경우의 예외"""
+
+    def __init__(self, cursor: str):
+        super().__init__(
+            message="유효하지 않은 페이지 커서입니다",
+            status_code=400,
+            error_code="INVALID_CURSOR",
+            extra={"cursor": cursor},
+        )
+
+
+class InvalidDateRangeException(FinancialException):
+    """조회 기간이 잘못된 경우의 예외"""
+
+    def __init__(self, start_date, end_date):
+        super().__init__(
+            message="시작일이 종료일보다 늦습니다",
+            status_code=400,
+            error_code="INVALID_DATE_RANGE",
+            extra={"start_date": str(start_date), "end_date": str(end_date)},
+        )
+
+
+class InvalidIntervalException(FinancialException):
+    """조회 주기로 집계할 수 없는 봉 간격인 경우의 예외"""
+
+    def __init__(self, interval: str, frequency: str):
+        super().__init__(
+            message=f"{frequency} 데이터는 {interval} 간격으로 집계할 수 없습니다",
+            status_code=400,
+            error_code="INVALID_INTERVAL",
+            extra={"interval": interval, "frequency": frequency},
+        )
+
+
 class AnalysisException(FinancialException):
     """분석 중 발생하는 예외"""
 
@@ -82,3 +125,19 @@ class AnalysisException(FinancialException):
         super().__init__(
             message=f"{analysis_type} 분석 중 오류가 발생했습니다: {detail}", status_code=500, error_code="ANALYSIS_ERROR"
         )
+
+
+class CacheException(CustomException):
+    """캐시 관련 기본 예외 클래스"""
+
+    pass
+
+
+class CacheNamespaceNotFoundException(CacheException):
+    def __init__(self, namespace: str):
+        super().__init__(
+            message=f"{namespace} 캐시 네임스페이스가 존재하지 않습니다.",
+            status_code=404,
+            error_code="CACHE_NAMESPACE_NOT_FOUND",
+            extra={"namespace": namespace},
+        )
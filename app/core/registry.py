@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ServiceRegistry:
+    """워커(프로세스) 단위 서비스 인스턴스 관리
+
+    서비스는 워커당 한 번만 생성되어 요청 간에 캐시와 executor 를 공유하고,
+    FastAPI lifespan 종료 시 `close()` 를 통해 정리된다.
+    """
+
+    def __init__(self):
+        self._factories: Dict[Type, Callable[[], Any]] = {}
+        self._instances: Dict[Type, Any] = {}
+
+    def register(self, service_cls: Type[T], factory: Optional[Callable[[], T]] = None) -> None:
+        """서비스 등록 (인스턴스는 startup 또는 최초 조회 시 생성)"""
+        self._factories[service_cls] = factory or service_cls
+
+    def get(self, service_cls: Type[T]) -> T:
+        """서비스 인스턴스 조회 (없으면 생성)"""
+        instance = self._instances.get(service_cls)
+        if instance is None:
+            factory = self._factories.get(service_cls, service_cls)
+            instance = factory()
+            self._instances[service_cls] = instance
+            logger.info(f"Service created: {service_cls.__module__}.{service_cls.__name__}")
+        return instance
+
+    @property
+    def instances(self) -> List[Any]:
+        return list(self._instances.values())
+
+    async def startup(self) -> None:
+        """등록된 서비스 사전 생성"""
+        for service_cls in self._factories:
+            self.get(service_cls)
+
+    async def shutdown(self) -> None:
+        """생성된 서비스 정리 (생성 역순)"""
+        for service_cls, instance in reversed(list(self._instances.items())):
+            close = getattr(instance, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error closing service {service_cls.__name__}: {str(e)}")
+        self._instances.clear()
+
+
+service_registry = ServiceRegistry()
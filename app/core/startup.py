@@ -0,0 +1,38 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    """워커 시작 단계별 소요 시간 (모듈 import, DB 초기화, lifespan 시작)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.ready_seconds: float | None = None
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def ready(self) -> None:
+        """요청 처리 준비 완료 시점 기록 및 로그 출력"""
+        self.ready_seconds = time.perf_counter() - self.started
+        summary = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in self.phases)
+        logger.info(f"Worker ready in {self.ready_seconds:.3f}s ({summary})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ready_seconds": round(self.ready_seconds, 4) if self.ready_seconds is not None else None,
+            "phases": [{"name": name, "seconds": round(seconds, 4)} for name, seconds in self.phases],
+        }
+
+
+startup_report = StartupReport()
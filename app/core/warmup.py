@@ -0,0 +1,293 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.registry import ServiceRegistry, service_registry
+from app.modules.common.enum import Country
+
+logger = logging.getLogger(__name__)
+
+Target = Tuple[Country, str]
+
+# 재무 API 의 국가 코드(FinancialCountry) -> Country
+_FINANCIAL_COUNTRIES = {"KOR": Country.KR, "USA": Country.US, "JPN": Country.JP, "HKG": Country.HK}
+
+# 저장할 최대 종목 수
+_MAX_STORED_TARGETS = 1000
+
+# 감쇠 후 이 값보다 작은 조회 횟수는 삭제
+_MIN_COUNT = 0.01
+
+# 다른 워커의 warm-up 종료를 확인하는 간격 (초)
+_LOCK_POLL_SECONDS = 5
+
+
+def _parse_country(value: Optional[str]) -> Optional[Country]:
+    if not value:
+        return None
+    if value.upper() in _FINANCIAL_COUNTRIES:
+        return _FINANCIAL_COUNTRIES[value.upper()]
+    try:
+        return Country(value.lower())
+    except ValueError:
+        return None
+
+
+def parse_tickers(value: str) -> List[Target]:
+    """설정 문자열 파싱 ("kr:005930,us:AAPL")"""
+    targets = []
+    for item in value.split(","):
+        ctry, _, ticker = item.strip().partition(":")
+        country = _parse_country(ctry)
+        if country is None or not ticker:
+            if item.strip():
+                logger.warning(f"Invalid warm-up ticker: {item}")
+            continue
+        targets.append((country, ticker.strip()))
+    return targets
+
+
+@contextmanager
+def _directory_lock(directory: str):
+    """디렉터리 단위 배타 잠금 (fcntl.flock, 워커 간 파일 read-modify-write 직렬화)"""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+class AccessStats:
+    """종목별 최근 조회 횟수 (워커 재시작 시 유지되도록 파일로 저장)
+
+    조회 횟수는 half_life 초마다 절반으로 감쇠하므로 오래전에 많이 조회된 종목보다 최근 조회된 종목이 우선된다.
+    워커마다 마지막 저장 이후 기록한 횟수만 저장된 통계에 합산하므로 여러 워커가 서로의 통계를 덮어쓰지 않는다.
+    """
+
+    def __init__(self, path: str, half_life: float):
+        self.path = path
+        self.half_life = half_life
+        self._counts: Counter = Counter()
+        self._pending: Counter = Counter()
+        self._decayed_at = time.time()
+
+    def record(self, ctry: Country, ticker: str) -> None:
+        self._counts[(ctry, ticker)] += 1
+        self._pending[(ctry, ticker)] += 1
+
+    def top(self, n: int) -> List[Target]:
+        self.decay()
+        return [target for target, _ in self._counts.most_common(n)]
+
+    def decay(self, now: Optional[float] = None) -> None:
+        """마지막 감쇠 이후 경과 시간만큼 조회 횟수 감쇠"""
+        now = time.time() if now is None else now
+        factor = 0.5 ** (max(now - self._decayed_at, 0.0) / self.half_life)
+        self._decayed_at = now
+        for counts in (self._counts, self._pending):
+            for target, count in list(counts.items()):
+                count *= factor
+                if count < _MIN_COUNT:
+                    del counts[target]
+                else:
+                    counts[target] = count
+
+    def _read(self, now: float) -> Counter:
+        """저장된 조회 횟수를 now 까지 감쇠하여 조회 (파일이 없으면 빈 Counter)"""
+        counts: Counter = Counter()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return counts
+        factor = 0.5 ** (max(now - float(saved["saved_at"]), 0.0) / self.half_life)
+        for item in saved["items"]:
+            country = _parse_country(item.get("ctry"))
+            count = float(item.get("count", 0)) * factor
+            if country is not None and count >= _MIN_COUNT:
+                counts[(country, item["ticker"])] += count
+        return counts
+
+    def load(self) -> None:
+        """저장된 조회 횟수를 저장 이후 경과 시간만큼 감쇠하여 합산"""
+        try:
+            self._counts.update(self._read(time.time()))
+        except Exception as e:
+            logger.warning(f"Failed to load access stats: {str(e)}")
+
+    def save(self) -> None:
+        """마지막 저장 이후 기록한 조회 횟수를 저장된 통계에 합산 (합산 결과를 다른 워커의 조회까지 포함한 통계로 사용)"""
+        try:
+            self.decay()
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            with _directory_lock(directory):
+                merged = self._read(self._decayed_at)
+                merged.update(self._pending)
+                top = merged.most_common(_MAX_STORED_TARGETS)
+                items = [
+                    {"ctry": ctry.value, "ticker": ticker, "count": round(count, 4)} for (ctry, ticker), count in top
+                ]
+                # 임시 파일에 쓴 뒤 rename (읽는 쪽이 쓰는 중인 파일을 보지 않도록)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump({"saved_at": self._decayed_at, "items": items}, f)
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+            self._counts = Counter(dict(top))
+            self._pending.clear()
+        except Exception as e:
+            logger.warning(f"Failed to save access stats: {str(e)}")
+
+
+class WarmupLock:
+    """워커 간 warm-up 순차 실행용 파일 잠금 (fcntl.flock, 프로세스가 종료되면 OS 가 해제)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        """잠금 시도 (대기하지 않음, 이미 보유 중이면 True)"""
+        if self._fd is not None:
+            return True
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.warning(f"Failed to open warm-up lock: {str(e)}")
+            return False
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+class CacheWarmer:
+    """공유 캐시 사전 적재
+
+    lifespan 시작 시 백그라운드로 한 번 실행한 뒤 WARMUP_INTERVAL_SECONDS 마다 반복한다.
+    대상은 WARMUP_TICKERS 와 최근 조회 상위 WARMUP_TOP_N 종목(WARMUP_STATS_HALF_LIFE_SECONDS 반감기로 감쇠)이며,
+    서비스 레지스트리에 등록된 서비스 중 `warmup(ctry, ticker)` 를 가진 서비스를 호출한다.
+    메모리 캐시(L1)는 워커마다 따로 있으므로 모든 워커가 warm-up 하되, warm-up 잠금(DATA_DIR/warmup/warmup.lock)으로
+    한 번에 한 워커씩 실행한다. 먼저 실행한 워커가 마감된 월을 L2(디스크) 캐시에 채우므로
+    이후 워커는 디스크에서 읽고, DB 동시 부하는 워커 수와 관계없이 한 워커 분량으로 유지된다.
+    """
+
+    def __init__(self, registry: ServiceRegistry):
+        self.registry = registry
+        self.access_stats = AccessStats(
+            os.path.join(settings.DATA_DIR, "warmup", "access_stats.json"), settings.WARMUP_STATS_HALF_LIFE_SECONDS
+        )
+        self.lock = WarmupLock(os.path.join(settings.DATA_DIR, "warmup", "warmup.lock"))
+        self.last_run: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def targets(self) -> List[Target]:
+        """warm-up 대상 종목 (설정 종목 우선, 중복 제거)"""
+        targets = parse_tickers(settings.WARMUP_TICKERS) + self.access_stats.top(settings.WARMUP_TOP_N)
+        return list(dict.fromkeys(targets))
+
+    async def run_once(self) -> Dict[str, Any]:
+        """대상 종목 캐시 적재 (동시 실행 수 제한)"""
+        targets = self.targets()
+        services = [service for service in self.registry.instances if hasattr(service, "warmup")]
+        semaphore = asyncio.Semaphore(settings.WARMUP_CONCURRENCY)
+        failures = []
+
+        async def warm(service: Any, ctry: Country, ticker: str) -> None:
+            async with semaphore:
+                try:
+                    await service.warmup(ctry, ticker)
+                except Exception as e:
+                    failures.append(f"{type(service).__name__}({ctry.value}:{ticker}): {str(e)}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*[warm(service, ctry, ticker) for ctry, ticker in targets for service in services])
+
+        self.last_run = {
+            "finished_at": time.time(),
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "targets": len(targets),
+            "services": [type(service).__name__ for service in services],
+            "failures": failures[:50],
+        }
+        logger.info(
+            f"Cache warm-up finished: {len(targets)} tickers, {len(failures)} failures "
+            f"in {self.last_run['elapsed_seconds']}s"
+        )
+        return self.last_run
+
+    async def _run_periodically(self) -> None:
+        while True:
+            try:
+                await self._run_serialized()
+            except Exception as e:
+                logger.error(f"Cache warm-up failed: {str(e)}")
+            self.access_stats.save()
+            await asyncio.sleep(settings.WARMUP_INTERVAL_SECONDS)
+
+    async def _run_serialized(self) -> None:
+        """다른 워커의 warm-up 이 끝날 때까지 기다린 뒤 실행"""
+        while not self.lock.acquire():
+            await asyncio.sleep(_LOCK_POLL_SECONDS)
+        try:
+            await self.run_once()
+        finally:
+            self.lock.release()
+
+    async def start(self) -> None:
+        """저장된 조회 통계 로드 후 백그라운드 warm-up 시작"""
+        self.access_stats.load()
+        if settings.WARMUP_ENABLED and self._task is None:
+            self._task = asyncio.create_task(self._run_periodically())
+
+    async def stop(self) -> None:
+        """warm-up 중지 및 조회 통계 저장"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.lock.release()
+        self.access_stats.save()
+
+
+cache_warmer = CacheWarmer(service_registry)
+
+
+async def access_stats_middleware(request: Request, call_next):
+    """성공한 API 요청의 (국가, 종목) 조회 횟수 기록"""
+    response = await call_next(request)
+    ticker = request.query_params.get("ticker")
+    if ticker and response.status_code == 200:
+        ctry = _parse_country(request.query_params.get("ctry"))
+        if ctry is not None:
+            cache_warmer.access_stats.record(ctry, ticker)
+    return response
@@ -1,19 +1,55 @@
 from contextlib import asynccontextmanager
 from typing import Optional
 from fastapi import FastAPI
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, exc
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 import logging
+import time
 import pymysql
 
+from app.core.config import settings
+from app.core.registry import service_registry
+from app.core.startup import startup_report
+from app.core.warmup import cache_warmer
+from app.modules.common.cache import close_caches
+from app.modules.common.invalidation import invalidation_bus
+from app.modules.common.market_calendar import check_holiday_coverage
+
 pymysql.install_as_MySQLdb()
 
 
+def install_idle_ping(engine, idle_seconds: int) -> None:
+    """pool_pre_ping 대신 idle_seconds 이상 사용되지 않은 connection 만 checkout 시 연결 확인
+
+    확인에 실패하면 DisconnectionError 로 pool 이 해당 connection 을 폐기하고 새로 연결한다.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        connection_record.info["last_used"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        last_used = connection_record.info.get("last_used")
+        if last_used is None or time.monotonic() - last_used < idle_seconds:
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception as e:
+            raise exc.DisconnectionError() from e
+        finally:
+            cursor.close()
+
+
 class SQLAlchemy:
     def __init__(self, app: FastAPI = None, **kwargs):
         self._engine = None
         self._async_engine = None
+        self._read_engine = None
+        self._async_read_engine = None
         self._session = None
         self._async_session = None
         if app is not None:
@@ -21,56 +57,33 @@ class SQLAlchemy:
 
     def init_app(self, app: FastAPI, **kwargs):
         """Initialize app with FastAPI instance"""
-        database_url = kwargs.get("DB_URL")
-        async_database_url = database_url.replace("mysql://", "mysql+aiomysql://")
-        pool_recycle = kwargs.setdefault("DB_POOL_RECYCLE", 3600)
-        pool_size = kwargs.setdefault("DB_POOL_SIZE", 20)
-        max_overflow = kwargs.setdefault("DB_MAX_OVERFLOW", 10)
-        echo = kwargs.setdefault("DB_ECHO", True)
-
-        # 동기 엔진 설정
-        self._engine = create_engine(
-            database_url,
-            echo=echo,
-            pool_recycle=pool_recycle,
-            pool_pre_ping=True,
-        )
-
-        self._session = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self._engine,
-        )
-
-        # 비동기 엔진 설정
-        self._async_engine = create_async_engine(
-            async_database_url,
-            echo=echo,
-            pool_recycle=pool_recycle,
-            pool_pre_ping=True,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-        )
-
-        self._async_session = sessionmaker(
-            class_=AsyncSession,
-            autocommit=False,
-            autoflush=False,
-            bind=self._async_engine,
-        )
+        self.init_db(**kwargs)
 
         @asynccontextmanager
         async def lifespan(app: FastAPI):
             # Startup
-            self._engine.connect()
-            async with self._async_engine.connect() as conn:
-                await conn.close()
+            with startup_report.phase("db connect"):
+                self._engine.connect()
+                async with self._async_engine.connect() as conn:
+                    await conn.close()
             logging.info("DB connected (both sync and async).")
+            with startup_report.phase("service startup"):
+                await service_registry.startup()
+                await invalidation_bus.start()
+                await cache_warmer.start()
+            check_holiday_coverage(settings.MARKET_HOLIDAY_WARN_DAYS)
+            startup_report.ready()
             yield
             # Shutdown
+            await cache_warmer.stop()
+            await invalidation_bus.stop()
+            await service_registry.shutdown()
+            await close_caches()
             self._session.close_all()
             self._engine.dispose()
+            self._read_engine.dispose()
             await self._async_engine.dispose()
+            await self._async_read_engine.dispose()
             logging.info("DB disconnected (both sync and async).")
 
         app.router.lifespan_context = lifespan
@@ -83,12 +96,15 @@ class SQLAlchemy:
         pool_size = kwargs.setdefault("DB_POOL_SIZE", 20)
         max_overflow = kwargs.setdefault("DB_MAX_OVERFLOW", 10)
         echo = kwargs.setdefault("DB_ECHO", True)
+        query_cache_size = kwargs.setdefault("DB_QUERY_CACHE_SIZE", 500)
+        ping_idle_seconds = kwargs.setdefault("DB_PING_IDLE_SECONDS", 60)
 
+        # 동기 엔진 설정
         self._engine = create_engine(
             database_url,
             echo=echo,
             pool_recycle=pool_recycle,
-            pool_pre_ping=True,
+            query_cache_size=query_cache_size,
         )
 
         self._session = sessionmaker(
@@ -97,11 +113,12 @@ class SQLAlchemy:
             bind=self._engine,
         )
 
+        # 비동기 엔진 설정
         self._async_engine = create_async_engine(
             async_database_url,
             echo=echo,
             pool_recycle=pool_recycle,
-            pool_pre_ping=True,
+            query_cache_size=query_cache_size,
             pool_size=pool_size,
             max_overflow=max_overflow,
         )
@@ -113,6 +130,29 @@ class SQLAlchemy:
             bind=self._async_engine,
         )
 
+        # 조회 전용 엔진 (autocommit 이므로 SELECT 후 COMMIT/ROLLBACK 불필요)
+        self._read_engine = create_engine(
+            database_url,
+            echo=echo,
+            pool_recycle=pool_recycle,
+            query_cache_size=query_cache_size,
+            isolation_level="AUTOCOMMIT",
+            pool_reset_on_return=None,
+        )
+        self._async_read_engine = create_async_engine(
+            async_database_url,
+            echo=echo,
+            pool_recycle=pool_recycle,
+            query_cache_size=query_cache_size,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            isolation_level="AUTOCOMMIT",
+            pool_reset_on_return=None,
+        )
+
+        for engine in (self._engine, self._async_engine, self._read_engine, self._async_read_engine):
+            install_idle_ping(engine, ping_idle_seconds)
+
     async def get_db(self):
         """동기 데이터베이스 세션"""
         if self._session is None:
@@ -161,5 +201,13 @@ class SQLAlchemy:
     def async_engine(self):
         return self._async_engine
 
+    @property
+    def read_engine(self):
+        return self._read_engine
+
+    @property
+    def async_read_engine(self):
+        return self._async_read_engine
+
 
 db = SQLAlchemy()
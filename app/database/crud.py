@@ -1,11 +1,23 @@
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
-from sqlalchemy import MetaData
-from sqlalchemy import select, insert, update, delete, desc, asc, or_, and_
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from sqlalchemy import Boolean, Date, DateTime, Integer, MetaData, Numeric, String
+from sqlalchemy import select, insert, update, delete, desc, asc, or_, and_, bindparam, extract, func
+from sqlalchemy.dialects import mysql, sqlite
 from sqlalchemy.exc import IntegrityError
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 import logging
-from app.core.config import get_database_config
+import threading
+import time
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Iterator, Optional
+from app.core.config import get_database_config, settings
 from app.database.conn import db
+from app.database.schema import SchemaCache
+from app.modules.common.invalidation import invalidation_bus, tags_for_columns, tags_for_conditions, tags_for_records
 
 
 @dataclass
@@ -19,23 +31,248 @@ class JoinInfo:
     secondary_condition: dict = field(default_factory=dict)
 
 
+@dataclass
+class BulkWriteResult:
+    """대량 적재 결과"""
+
+    table: str
+    rows: int
+    batches: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+# SQL 컬럼 타입별 Arrow 타입 (순서대로 검사하므로 하위 타입을 먼저 둠)
+_ARROW_TYPES = (
+    (DateTime, pa.timestamp("ns")),
+    (Date, pa.date32()),
+    (Boolean, pa.bool_()),
+    (Integer, pa.int64()),
+    (Numeric, pa.float64()),
+    (String, pa.string()),
+)
+
+
+def _arrow_type(sql_type) -> pa.DataType | None:
+    """SQL 컬럼 타입에 대응하는 Arrow 타입 (알 수 없으면 None: 값에서 추론)"""
+    for type_class, arrow_type in _ARROW_TYPES:
+        if isinstance(sql_type, type_class):
+            return arrow_type
+    return None
+
+
+def _arrow_types(stmt, size: int) -> list:
+    """SELECT 결과 컬럼별 Arrow 타입 (드라이버가 반환하는 값의 형태와 관계없이 배치마다 같은 타입으로 변환)"""
+    columns = list(getattr(stmt, "selected_columns", ()))
+    if len(columns) != size:
+        return [None] * size
+    return [_arrow_type(column.type) for column in columns]
+
+
+def _arrow_column(values: tuple, arrow_type: pa.DataType | None = None) -> pa.Array:
+    """컬럼 값(튜플)을 Arrow 배열로 변환
+
+    arrow_type 이 있으면 그 타입으로 변환하고(SQLite 의 시각 문자열 등), 없으면 DECIMAL 은 float64, 시각은 ns 단위로 맞춘다.
+    """
+    array = pa.array(values, from_pandas=True)
+    if arrow_type is not None:
+        return array if array.type == arrow_type else array.cast(arrow_type)
+    if pa.types.is_decimal(array.type):
+        return array.cast(pa.float64())
+    if pa.types.is_timestamp(array.type) and array.type.unit != "ns":
+        return array.cast(pa.timestamp("ns"))
+    return array
+
+
+def _arrow_batch(names: list, types: list, rows: list) -> pa.RecordBatch:
+    """행(튜플) 목록을 컬럼 단위 RecordBatch 로 변환"""
+    columns = [_arrow_column(values, arrow_type) for values, arrow_type in zip(zip(*rows), types)]
+    return pa.RecordBatch.from_arrays(columns, names=names)
+
+
+def _arrow_table(names: list, batches: list, types: list | None = None) -> pa.Table:
+    """Arrow 배치 병합 (배치마다 추론된 타입이 다르면 상위 타입으로 통일)"""
+    if not batches:
+        types = types or [None] * len(names)
+        return pa.table({name: pa.array([], arrow_type or pa.null()) for name, arrow_type in zip(names, types)})
+    tables = [pa.Table.from_batches([batch]) for batch in batches]
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+class _RequestConnection:
+    """요청 단위로 재사용하는 조회 전용 async connection"""
+
+    __slots__ = ("connection", "busy", "closed")
+
+    def __init__(self):
+        self.connection = None
+        self.busy = False
+        self.closed = False
+
+    async def discard(self) -> None:
+        if self.connection is not None:
+            connection, self.connection = self.connection, None
+            await connection.close()
+
+
+_AGGREGATES = {"max": func.max, "min": func.min, "sum": func.sum, "avg": func.avg}
+
+_OPERATORS = ("not", "gt", "gte", "lt", "lte", "in", "notin", "startswith", "between", "year", "month")
+
+# 하한/상한 두 bindparam({이름}_lo, {이름}_hi)으로 비교하는 범위 연산자
+_RANGE_OPERATORS = ("between", "year", "month")
+
+
+def _is_day(value) -> bool:
+    return isinstance(value, date) and not isinstance(value, datetime)
+
+
+def _between_pair(val, key: str = "between") -> tuple:
+    """between 조건 값 (시작, 끝) 검증 (잘못된 값은 ValueError)"""
+    if val is None:
+        raise ValueError(f"None is not allowed for condition: {key}")
+    if not isinstance(val, (tuple, list)) or len(val) != 2:
+        raise ValueError(f"between condition requires a (start, end) pair: {key}")
+    return tuple(val)
+
+
+def _range_bounds(op: str, val, key: str = "between") -> tuple:
+    """범위 연산자의 (하한, 상한)
+
+    between 은 (시작, 끝) 양끝 포함이며 끝이 date 이면 다음날 0시 미만으로 변환한다.
+    year(2024), month("2024-03", "202403", (2024, 3), date) 는 [기간 시작, 다음 기간 시작) 구간이다.
+    """
+    if op == "between":
+        lower, upper = _between_pair(val, key)
+        if _is_day(lower):
+            lower = datetime.combine(lower, datetime.min.time())
+        if _is_day(upper):
+            upper = datetime.combine(upper + timedelta(days=1), datetime.min.time())
+        return lower, upper
+    if op == "year":
+        year = int(val)
+        return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+
+    if isinstance(val, date):
+        year, month = val.year, val.month
+    elif isinstance(val, str):
+        digits = val.replace("-", "")
+        year, month = int(digits[:4]), int(digits[4:6])
+    else:
+        year, month = val
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return datetime(year, month, 1), datetime(next_year, next_month, 1)
+
+
+def _like_prefix(val: str) -> str:
+    """startswith 용 LIKE 패턴 (와일드카드 문자는 escape)"""
+    escaped = str(val).replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return f"{escaped}%"
+
+
+_request_connection: ContextVar[Optional[_RequestConnection]] = ContextVar("request_connection", default=None)
+
+
+class StatementCache:
+    """형태(테이블, 컬럼, 조건 연산자, 정렬, limit)별 SELECT 문 캐시
+
+    조건 값은 bindparam 으로 분리되어 있으므로 같은 형태의 쿼리는 문장 객체를 재사용하고,
+    SQLAlchemy 도 동일한 문장의 컴파일 결과(query_cache_size)를 재사용한다.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._statements: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, shape: tuple):
+        with self._lock:
+            stmt = self._statements.get(shape)
+            if stmt is None:
+                self.misses += 1
+                return None
+            self._statements.move_to_end(shape)
+            self.hits += 1
+            return stmt
+
+    def put(self, shape: tuple, stmt) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._statements[shape] = stmt
+            self._statements.move_to_end(shape)
+            while len(self._statements) > self.maxsize:
+                self._statements.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statements.clear()
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._statements),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
 class Database:
+    """kwargs 조건 문법의 CRUD 헬퍼
+
+    엔진은 `db`(app.database.conn)가 init_app 에서 만든 것을 매번 참조하므로 import 시에는 connection pool 을 만들지 않는다.
+    앱 밖(스크립트, 벤치마크)에서 init_app 없이 사용하면 처음 사용할 때 설정으로 한 번만 생성한다.
+    """
+
     def __init__(self):
-        c = get_database_config()
-        conf_dict = asdict(c)
-        self.init_db(conf_dict)
+        conf_dict = asdict(get_database_config())
+        self.statement_cache = StatementCache(conf_dict.get("DB_STATEMENT_CACHE_SIZE", 512))
+        self._lock = threading.Lock()
+        self._schema: SchemaCache | None = None
 
-    def init_db(self, conf_dict: dict):
-        db.init_db(**conf_dict)
-        self.init_conn()
-        self.init_meta()
+    @property
+    def _db(self):
+        """엔진이 생성된 db (init_app 전에 사용되면 설정으로 생성)"""
+        if db.engine is None:
+            with self._lock:
+                if db.engine is None:
+                    db.init_db(**asdict(get_database_config()))
+        return db
 
-    def init_conn(self):
-        self.conn = db.engine
+    @property
+    def conn(self):
+        """동기(쓰기/스키마) 엔진"""
+        return self._db.engine
 
-    def init_meta(self):
+    @property
+    def schema(self) -> SchemaCache:
+        """테이블 정의 캐시 (엔진이 바뀌면 새로 만듦)"""
+        engine = self.conn
+        schema = self._schema
+        if schema is None or schema.engine is not engine:
+            with self._lock:
+                schema = self._schema
+                if schema is None or schema.engine is not engine:
+                    schema = self.init_meta(engine)
+        return schema
+
+    def init_meta(self, engine=None) -> SchemaCache:
+        # 전체 reflect 대신 테이블별로 처음 사용할 때 로드 (SchemaCache 참고)
         self.meta_data = MetaData()
-        self.meta_data.reflect(bind=self.conn)
+        self._schema = SchemaCache(self.meta_data, engine or self.conn, settings.DB_SCHEMA_VERSION)
+        self.statement_cache.clear()
+        return self._schema
+
+    def _table(self, table: str):
+        """테이블 정의 조회 (지연 로딩)"""
+        return self.schema.table(table)
 
     @contextmanager
     def get_connection(self):
@@ -48,10 +285,68 @@ class Database:
                 connection.rollback()
                 raise e
 
+    @asynccontextmanager
+    async def get_async_connection(self):
+        """비동기(aiomysql) connection 관리"""
+        async with self._db.async_engine.connect() as connection:
+            try:
+                yield connection
+                await connection.commit()
+            except Exception as e:
+                await connection.rollback()
+                raise e
+
+    @contextmanager
+    def get_read_connection(self):
+        """조회 전용 connection (autocommit 이므로 COMMIT 하지 않음)"""
+        with self._db.read_engine.connect() as connection:
+            yield connection
+
+    @asynccontextmanager
+    async def get_async_read_connection(self):
+        """조회 전용 async connection
+
+        request_scope 안에서는 요청 동안 하나의 connection 을 재사용하고,
+        같은 요청의 다른 조회가 사용 중이면(동시 실행) pool 에서 별도 connection 을 사용한다.
+        """
+        scope = _request_connection.get()
+        if scope is None or scope.busy or scope.closed:
+            async with self._db.async_read_engine.connect() as connection:
+                yield connection
+            return
+
+        scope.busy = True
+        try:
+            if scope.connection is None:
+                scope.connection = await self._db.async_read_engine.connect()
+            yield scope.connection
+        except BaseException:
+            # 오류가 발생한 connection 은 재사용하지 않음
+            await scope.discard()
+            raise
+        finally:
+            scope.busy = False
+            if scope.closed:
+                await scope.discard()
+
+    @asynccontextmanager
+    async def request_scope(self):
+        """요청 단위 조회 connection 범위 (request_scope_middleware 에서 사용)"""
+        scope = _RequestConnection()
+        token = _request_connection.set(scope)
+        try:
+            yield
+        finally:
+            _request_connection.reset(token)
+            scope.closed = True
+            # 백그라운드 작업이 사용 중이면 사용이 끝날 때 반환
+            if not scope.busy:
+                await scope.discard()
+
     def check_connection(self) -> bool:
         """데이터베이스 연결 상태를 확인하는 메서드"""
         try:
-            with self.get_connection() as connection:
+            with self.get_read_connection() as connection:
                 connection.execute(select(1))
             return True
         except Exception as e:
@@ -71,57 +366,159 @@ class Database:
                 logging.error(f"Error in query execution: {str(e)}")
                 raise
 
+    async def _execute_async(self, query, *args):
+        """쿼리 비동기 실행 (이벤트 루프를 막지 않음)"""
+        async with self.get_async_connection() as connection:
+            try:
+                result = await connection.execute(query, *args)
+                return result
+            except IntegrityError as e:
+                logging.error(f"Integrity Error in query execution: {str(e)}")
+                raise
+            except Exception as e:
+                logging.error(f"Error in query execution: {str(e)}")
+                raise
+
     def get_condition(self, obj: object, **kwargs) -> list:
         """조건절 생성 메서드"""
+        return self._conditions(obj, kwargs, bind_prefix=None)
+
+    def _conditions(self, obj: object, kwargs: dict, bind_prefix: str | None) -> list:
+        """조건절 생성 (bind_prefix 가 있으면 값 대신 bindparam 사용)"""
         cond = []
         for key, val in kwargs.items():
             if key == "or__":
                 or_cond = []
-                for sub_cond in val:
-                    key, val = list(sub_cond.keys())[0], list(sub_cond.values())[0]
-                    key = key.split("__")
-                    col = getattr(obj.columns, key[0])
-                    if len(key) == 1:
-                        or_cond.append((col == val))
-                    elif len(key) == 2 and key[1] == "not":
-                        or_cond.append((col != val))
-                    elif len(key) == 2 and key[1] == "gt":
-                        or_cond.append((col > val))
-                    elif len(key) == 2 and key[1] == "gte":
-                        or_cond.append((col >= val))
-                    elif len(key) == 2 and key[1] == "lt":
-                        or_cond.append((col < val))
-                    elif len(key) == 2 and key[1] == "lte":
-                        or_cond.append((col <= val))
-                    elif len(key) == 2 and key[1] == "in":
-                        or_cond.append((col.in_(val)))
-                    elif len(key) == 2 and key[1] == "notin":
-                        or_cond.append(~(col.in_(val)))
+                for i, sub_cond in enumerate(val):
+                    sub_key, sub_val = list(sub_cond.keys())[0], list(sub_cond.values())[0]
+                    name = None if bind_prefix is None else f"{bind_prefix}or{i}_{sub_key}"
+                    clause = self._compare(obj, sub_key, sub_val, name)
+                    if clause is not None:
+                        or_cond.append(clause)
                 if or_cond:
                     cond.append(or_(*or_cond))
                 continue
 
-            key = key.split("__")
-            col = getattr(obj.columns, key[0])
-            if len(key) == 1:
-                cond.append((col == val))
-            elif len(key) == 2 and key[1] == "not":
-                cond.append((col != val))
-            elif len(key) == 2 and key[1] == "gt":
-                cond.append((col > val))
-            elif len(key) == 2 and key[1] == "gte":
-                cond.append((col >= val))
-            elif len(key) == 2 and key[1] == "lt":
-                cond.append((col < val))
-            elif len(key) == 2 and key[1] == "lte":
-                cond.append((col <= val))
-            elif len(key) == 2 and key[1] == "in":
-                cond.append((col.in_(val)))
-            elif len(key) == 2 and key[1] == "notin":
-                cond.append(~(col.in_(val)))
+            name = None if bind_prefix is None else f"{bind_prefix}{key}"
+            clause = self._compare(obj, key, val, name)
+            if clause is not None:
+                cond.append(clause)
 
         return cond
 
+    def _compare(self, obj: object, key: str, val, bind_name: str | None = None):
+        """조건 하나 생성 ("컬럼__연산자" 형식, 지원하지 않는 연산자는 ValueError)
+
+        between/year/month 는 인덱스를 사용할 수 있도록 컬럼에 함수를 적용하지 않고 범위 비교로 변환하며,
+        startswith 는 접두어 LIKE 로 변환한다.
+        """
+        parts = key.split("__")
+        col = getattr(obj.columns, parts[0])
+        op = parts[1] if len(parts) == 2 else None
+        if len(parts) > 2 or (len(parts) == 2 and op not in _OPERATORS):
+            raise ValueError(f"Unsupported condition operator: {key}")
+        if val is None and op in _RANGE_OPERATORS + ("startswith", "in", "notin"):
+            raise ValueError(f"None is not allowed for condition: {key}")
+
+        if op in _RANGE_OPERATORS:
+            if op != "between" and not isinstance(col.type, (Date, DateTime)):
+                raise ValueError(f"{op} condition requires a date column: {key}")
+            lower, upper = _range_bounds(op, val, key)
+            upper_exclusive = op != "between" or _is_day(val[1])
+            if bind_name is not None:
+                lower, upper = bindparam(f"{bind_name}_lo"), bindparam(f"{bind_name}_hi")
+            return and_(col >= lower, col < upper if upper_exclusive else col <= upper)
+        if op == "startswith":
+            pattern = bindparam(bind_name) if bind_name is not None else _like_prefix(val)
+            return col.like(pattern, escape="/")
+
+        # None 은 IS NULL 로 비교되도록 값 그대로 사용
+        if bind_name is not None and val is not None:
+            val = bindparam(bind_name, expanding=op in ("in", "notin"))
+        if len(parts) == 1:
+            return col == val
+        elif op == "not":
+            return col != val
+        elif op == "gt":
+            return col > val
+        elif op == "gte":
+            return col >= val
+        elif op == "lt":
+            return col < val
+        elif op == "lte":
+            return col <= val
+        elif op == "in":
+            return col.in_(val)
+        elif op == "notin":
+            return ~(col.in_(val))
+
+    def _column(self, obj: object, key: str, labeled: bool = True):
+        """조회 컬럼 생성 ("컬럼__함수" 형식은 집계/변환식, 결과 컬럼명은 key 그대로)
+
+        집계: max, min, sum, avg, count ("*__count" 는 COUNT(*))
+        변환: year (날짜 컬럼은 연도, 문자열 컬럼(예: period_q "YYYYMM")은 앞 4자리)
+        """
+        if "__" not in key:
+            return getattr(obj.columns, key)
+
+        name, op = key.split("__")
+        if op == "count":
+            expr = func.count() if name == "*" else func.count(getattr(obj.columns, name))
+        elif op in _AGGREGATES:
+            expr = _AGGREGATES[op](getattr(obj.columns, name))
+        elif op == "year":
+            col = getattr(obj.columns, name)
+            expr = extract("year", col) if isinstance(col.type, (Date, DateTime)) else func.substr(col, 1, 4)
+        else:
+            raise ValueError(f"Unsupported column function: {key}")
+        return expr.label(key) if labeled else expr
+
+    @staticmethod
+    def _condition_shape(kwargs: dict) -> tuple:
+        """문장 캐시 키용 조건 형태 (값 제외, None 여부와 between 상한 포함 여부만 포함)"""
+
+        def value_shape(key: str, val) -> tuple:
+            if key.endswith("__between"):
+                # 잘못된 값도 _compare 와 같이 ValueError 로 처리
+                return False, _is_day(_between_pair(val, key)[1])
+            return val is None, False
+
+        shape = []
+        for key, val in kwargs.items():
+            if key == "or__":
+                shape.append((key, tuple((k, value_shape(k, v)) for sub_cond in val for k, v in sub_cond.items())))
+            else:
+                shape.append((key, value_shape(key, val)))
+        return tuple(shape)
+
+    @staticmethod
+    def _condition_params(kwargs: dict, bind_prefix: str = "") -> dict:
+        """bindparam 에 전달할 조건 값"""
+        params = {}
+        for key, val in kwargs.items():
+            if key == "or__":
+                for i, sub_cond in enumerate(val):
+                    sub_key, sub_val = list(sub_cond.items())[0]
+                    if sub_val is not None:
+                        params.update(Database._param_values(f"{bind_prefix}or{i}_{sub_key}", sub_key, sub_val))
+            elif val is not None:
+                params.update(Database._param_values(f"{bind_prefix}{key}", key, val))
+        return params
+
+    @staticmethod
+    def _param_values(name: str, key: str, val) -> dict:
+        """조건 하나의 bindparam 값 (범위 연산자는 하한/상한 두 값)"""
+        op = key.split("__")[1] if "__" in key else None
+        if op in _RANGE_OPERATORS:
+            lower, upper = _range_bounds(op, val, key)
+            return {f"{name}_lo": lower, f"{name}_hi": upper}
+        if op == "startswith":
+            return {name: _like_prefix(val)}
+        # expanding bindparam 은 list 만 허용
+        if op in ("in", "notin"):
+            return {name: list(val)}
+        return {name: val}
+
     def get_sets(self, obj, sets) -> dict:
         """SET절 생성 메서드"""
         _sets = {}
@@ -140,14 +537,17 @@ class Database:
             raise ValueError("Conditional statements (kwargs) are required in update queries.")
 
         try:
-            obj = self.meta_data.tables[table]
+            obj = self._table(table)
             cond = self.get_condition(obj, **kwargs)
             _sets = self.get_sets(obj, sets)
             stmt = update(obj).where(*cond).values(_sets)
 
             with self.get_connection() as connection:
                 result = connection.execute(stmt)
-                return result
+
+            # 변경된 종목의 캐시 무효화
+            invalidation_bus.publish(tags_for_conditions(table, kwargs))
+            return result
         except Exception as e:
             logging.error(f"Error in update operation: {str(e)}")
             raise
@@ -158,13 +558,16 @@ class Database:
             raise ValueError("Conditional statements (kwargs) are required in delete queries.")
 
         try:
-            obj = self.meta_data.tables[table]
+            obj = self._table(table)
             cond = self.get_condition(obj, **kwargs)
             stmt = delete(obj).where(*cond)
 
             with self.get_connection() as connection:
                 result = connection.execute(stmt)
-                return result
+
+            # 삭제된 종목의 캐시 무효화
+            invalidation_bus.publish(tags_for_conditions(table, kwargs))
+            return result
         except Exception as e:
             logging.error(f"Error in delete operation: {str(e)}")
             raise
@@ -172,7 +575,7 @@ class Database:
     def _insert(self, table: str, sets: dict | list):
         """INSERT 쿼리 실행"""
         try:
-            obj = self.meta_data.tables[table]
+            obj = self._table(table)
             if isinstance(sets, dict):
                 _sets = self.get_sets(obj, sets)
             elif isinstance(sets, list):
@@ -184,72 +587,474 @@ class Database:
 
             with self.get_connection() as connection:
                 result = connection.execute(stmt)
-                return result
+
+            # 추가된 종목(월)의 캐시 무효화
+            invalidation_bus.publish(tags_for_records(table, sets if isinstance(sets, list) else [sets]))
+            return result
         except Exception as e:
             logging.error(f"Error in insert operation: {str(e)}")
             raise
 
+    def _bulk_upsert(
+        self,
+        table: str,
+        source: pd.DataFrame | pa.Table | list,
+        update_columns: list | None = None,
+        batch_size: int = 1000,
+    ) -> BulkWriteResult:
+        """대량 INSERT ... ON DUPLICATE KEY UPDATE
+
+        source(DataFrame, pyarrow.Table 또는 dict 리스트)를 batch_size 행씩 나누어 배치마다 트랜잭션으로 실행한다.
+        update_columns 를 지정하지 않으면 기본 키를 제외한 source 의 모든 컬럼을 갱신하며,
+        실패 시 이전 배치까지는 반영된 상태로 예외가 전달된다. SQLite 에서는 ON CONFLICT DO UPDATE 로 실행된다.
+        """
+        rows = batches = 0
+        started = time.perf_counter()
+        try:
+            obj = self._table(table)
+            data = self._to_arrow(source)
+
+            unknown = [name for name in data.column_names if name not in obj.columns]
+            if unknown:
+                raise ValueError(f"Unknown columns for {table}: {unknown}")
+            if update_columns is None:
+                update_columns = [name for name in data.column_names if not obj.columns[name].primary_key]
+            stmt = self._upsert_statement(obj, update_columns)
+
+            with self.conn.connect() as connection:
+                # 행마다 dict 를 만들지 않도록 DBAPI 문장으로 컴파일하여 컬럼 목록을 위치 인자 튜플로 전달
+                compiled = stmt.compile(dialect=connection.dialect, column_keys=data.column_names)
+                sql, names = str(compiled), compiled.positiontup
+                for batch in data.to_batches(max_chunksize=batch_size):
+                    if not batch.num_rows:
+                        continue
+                    columns = {name: batch.column(name).to_pylist() for name in batch.schema.names}
+                    with connection.begin():
+                        connection.exec_driver_sql(sql, list(zip(*[columns[name] for name in names])))
+                    rows += batch.num_rows
+                    batches += 1
+
+                    # 반영된 배치의 종목(월) 캐시 무효화
+                    invalidation_bus.publish(tags_for_columns(table, columns))
+        except Exception as e:
+            logging.error(f"Error in bulk upsert operation ({rows} rows written): {str(e)}")
+            raise
+
+        result = BulkWriteResult(table, rows, batches, time.perf_counter() - started)
+        logging.info(
+            f"Bulk upsert {table}: {rows} rows in {batches} batches "
+            f"({result.elapsed:.2f}s, {result.rows_per_second:.0f} rows/s)"
+        )
+        return result
+
+    def _upsert_statement(self, obj, update_columns: list):
+        """DB 종류에 맞는 upsert 문 생성 (갱신할 컬럼이 없으면 중복 행은 무시)"""
+        dialect = self.conn.dialect.name
+        if dialect == "mysql":
+            stmt = mysql.insert(obj)
+            if not update_columns:
+                return stmt.prefix_with("IGNORE")
+            return stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in update_columns})
+        if dialect == "sqlite":
+            stmt = sqlite.insert(obj)
+            keys = [column.name for column in obj.primary_key.columns]
+            if not update_columns:
+                return stmt.on_conflict_do_nothing()
+            return stmt.on_conflict_do_update(
+                index_elements=keys, set_={name: stmt.excluded[name] for name in update_columns}
+            )
+        raise ValueError(f"Bulk upsert is not supported for {dialect}")
+
+    @staticmethod
+    def _to_arrow(source: pd.DataFrame | pa.Table | list) -> pa.Table:
+        """적재 원본을 pyarrow.Table 로 변환 (ns 시각은 DB 드라이버가 처리하도록 us 단위로 변환)"""
+        if isinstance(source, pd.DataFrame):
+            data = pa.Table.from_pandas(source, preserve_index=False)
+        elif isinstance(source, pa.Table):
+            data = source
+        elif isinstance(source, list):
+            data = pa.Table.from_pylist(source)
+        else:
+            raise ValueError("Invalid source type for bulk upsert")
+
+        for i, schema_field in enumerate(data.schema):
+            if pa.types.is_timestamp(schema_field.type) and schema_field.type.unit == "ns":
+                data = data.set_column(
+                    i, schema_field.name, data.column(i).cast(pa.timestamp("us", schema_field.type.tz), safe=False)
+                )
+        return data
+
     def _select(
         self,
         table: str,
         columns: list | None = None,
-        order: str | None = None,
+        order: str | list | None = None,
         ascending: bool = False,
         join_info: JoinInfo | None = None,
         limit: int = 0,
+        group_by: list | None = None,
+        offset: int = 0,
         **kwargs,
     ):
         """SELECT 쿼리 실행"""
         try:
-            obj = self.meta_data.tables[table]
+            stmt, params = self._build_select(
+                table, columns, order, ascending, join_info, limit, group_by, offset, **kwargs
+            )
 
-            if columns is None:
-                cols = [obj]
-            else:
-                cols = list(map(lambda x: getattr(obj.columns, x), columns))
+            with self.get_read_connection() as connection:
+                result = connection.execute(stmt, params)
+                return result.fetchall()
 
-            if join_info:
-                join_table_obj = self.meta_data.tables[join_info.secondary_table]
-                join_cols = list(map(lambda x: getattr(join_table_obj.columns, x), join_info.columns))
-                cols.extend(join_cols)
+        except Exception as e:
+            logging.error(f"Error in select operation: {str(e)}")
+            raise
 
-            cond = self.get_condition(obj, **kwargs)
-            stmt = select(*cols).where(*cond)
+    async def _select_async(
+        self,
+        table: str,
+        columns: list | None = None,
+        order: str | list | None = None,
+        ascending: bool = False,
+        join_info: JoinInfo | None = None,
+        limit: int = 0,
+        group_by: list | None = None,
+        offset: int = 0,
+        **kwargs,
+    ):
+        """SELECT 쿼리 비동기 실행 (_select 와 동일한 조건 문법)"""
+        try:
+            stmt, params = self._build_select(
+                table, columns, order, ascending, join_info, limit, group_by, offset, **kwargs
+            )
 
-            if join_info:
-                join_condition = self._join(join_info)
-                stmt = stmt.select_from(join_condition)
+            async with self.get_async_read_connection() as connection:
+                result = await connection.execute(stmt, params)
+                return result.fetchall()
+
+        except Exception as e:
+            logging.error(f"Error in select operation: {str(e)}")
+            raise
 
-            if order:
-                order_col = getattr(obj.columns, order)
+    def _select_stream(
+        self,
+        table: str,
+        columns: list | None = None,
+        order: str | list | None = None,
+        ascending: bool = False,
+        join_info: JoinInfo | None = None,
+        limit: int = 0,
+        group_by: list | None = None,
+        offset: int = 0,
+        batch_size: int = 1000,
+        **kwargs,
+    ) -> Iterator[list]:
+        """SELECT 결과를 서버 측 커서로 batch_size 행씩 순회
+
+        전체 결과를 fetchall 하지 않으므로 메모리 사용량이 배치 크기로 제한된다.
+        순회가 끝나거나 generator 가 닫힐 때까지 connection 을 점유한다.
+        """
+        try:
+            stmt, params = self._build_select(
+                table, columns, order, ascending, join_info, limit, group_by, offset, **kwargs
+            )
+
+            with self.get_read_connection() as connection:
+                result = connection.execute(
+                    stmt, params, execution_options={"stream_results": True, "yield_per": batch_size}
+                )
+                try:
+                    yield from result.partitions()
+                finally:
+                    result.close()
+
+        except Exception as e:
+            logging.error(f"Error in select operation: {str(e)}")
+            raise
+
+    async def _select_stream_async(
+        self,
+        table: str,
+        columns: list | None = None,
+        order: str | list | None = None,
+        ascending: bool = False,
+        join_info: JoinInfo | None = None,
+        limit: int = 0,
+        group_by: list | None = None,
+        offset: int = 0,
+        batch_size: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[list]:
+        """SELECT 결과를 서버 측 커서로 batch_size 행씩 비동기 순회
+
+        중간에 순회를 멈추는 경우 `contextlib.aclosing` 으로 감싸 connection 을 바로 반환한다.
+        """
+        try:
+            stmt, params = self._build_select(
+                table, columns, order, ascending, join_info, limit, group_by, offset, **kwargs
+            )
+
+            async with self.get_async_read_connection() as connection:
+                async with connection.stream(stmt, params) as result:
+                    async for partition in result.partitions(batch_size):
+                        yield partition
+
+        except Exception as e:
+            logging.error(f"Error in select operation: {str(e)}")
+            raise
+
+    async def _select_arrow_stream_async(
+        self,
+        table: str,
+        columns: list | None = None,
+        order: str | list | None = None,
+        ascending: bool = False,
+        join_info: JoinInfo | None = None,
+        limit: int = 0,
+        group_by: list | None = None,
+        offset: int = 0,
+        batch_size: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """SELECT 결과를 서버 측 커서로 batch_size 행씩 pyarrow.RecordBatch 로 비동기 순회
+
+        배치마다 SELECT 컬럼 타입으로 정한 Arrow 타입으로 변환하므로 모든 배치의 스키마가 같다.
+        (_select_stream_async 와 같이 중간에 멈추는 경우 `contextlib.aclosing` 으로 감싼다)
+        """
+        try:
+            stmt, params = self._build_select(
+                table, columns, order, ascending, join_info, limit, group_by, offset, **kwargs
+            )
+
+            async with self.get_async_read_connection() as connection:
+                async with connection.stream(stmt, params) as result:
+                    names = list(result.keys())
+                    types = _arrow_types(stmt, len(names))
+                    async for partition in result.partitions(batch_size):
+                        yield _arrow_batch(names, types, partition)
+
+        except Exception as e:
+            logging.error(f"Error in select operation: {str(e)}")
+            raise
+
+    def _select_arrow(
+        self,
+        table: str,
+        columns: list | None = None,
+        order: str | list | None = None,
+        ascending: bool = False,
+        join_info: JoinInfo | None = None,
+        limit: int = 0,
+        group_by: list | None = None,
+        offset: int = 0,
+        batch_size: int = 0,
+        **kwargs,
+    ) -> pa.Table:
+        """SELECT 결과를 컬럼 단위 pyarrow.Table 로 조회
+
+        Row 객체를 만들지 않고 DB 드라이버의 튜플을 컬럼별 Arrow 배열로 변환한다.
+        batch_size 를 지정하면 서버 측 커서로 배치 단위 변환하여 중간 메모리를 제한한다.
+        """
+        try:
+            stmt, params = self._build_select(
+                table, columns, order, ascending, join_info, limit, group_by, offset, **kwargs
+            )
+
+            with self.get_read_connection() as connection:
+                return self._fetch_arrow(connection, stmt, params, batch_size)
+
+        except Exception as e:
+            logging.error(f"Error in select operation: {str(e)}")
+            raise
+
+    async def _select_arrow_async(
+        self,
+        table: str,
+        columns: list | None = None,
+        order: str | list | None = None,
+        ascending: bool = False,
+        join_info: JoinInfo | None = None,
+        limit: int = 0,
+        group_by: list | None = None,
+        offset: int = 0,
+        batch_size: int = 0,
+        **kwargs,
+    ) -> pa.Table:
+        """SELECT 결과를 컬럼 단위 pyarrow.Table 로 비동기 조회 (_select_arrow 참고)"""
+        try:
+            stmt, params = self._build_select(
+                table, columns, order, ascending, join_info, limit, group_by, offset, **kwargs
+            )
+
+            async with self.get_async_read_connection() as connection:
+                return await connection.run_sync(self._fetch_arrow, stmt, params, batch_size)
+
+        except Exception as e:
+            logging.error(f"Error in select operation: {str(e)}")
+            raise
+
+    def _select_columns(self, table: str, **kwargs) -> dict[str, np.ndarray]:
+        """SELECT 결과를 {컬럼명: NumPy 배열} 로 조회 (인자는 _select_arrow 와 동일)"""
+        return self._arrow_to_numpy(self._select_arrow(table, **kwargs))
+
+    async def _select_columns_async(self, table: str, **kwargs) -> dict[str, np.ndarray]:
+        """SELECT 결과를 {컬럼명: NumPy 배열} 로 비동기 조회"""
+        return self._arrow_to_numpy(await self._select_arrow_async(table, **kwargs))
+
+    @staticmethod
+    def _arrow_to_numpy(table: pa.Table) -> dict[str, np.ndarray]:
+        return {name: table.column(name).to_numpy() for name in table.column_names}
+
+    @staticmethod
+    def _fetch_arrow(connection, stmt, params: dict, batch_size: int = 0) -> pa.Table:
+        """DBAPI 커서에서 직접 튜플을 읽어 컬럼 단위로 변환
+
+        모든 배치를 같은 DBAPI 커서 경로로 읽고, SELECT 컬럼 타입으로 정한 Arrow 타입으로 변환하여
+        배치 간(및 드라이버 간) 컬럼 타입이 같도록 한다.
+        """
+        # 요청 단위로 재사용되는 connection 이므로 옵션은 이번 실행에만 적용
+        options = {"stream_results": True} if batch_size else {}
+        result = connection.execute(stmt, params, execution_options=options)
+        try:
+            names = list(result.keys())
+            types = _arrow_types(stmt, len(names))
+            cursor = result.cursor
+            batches = []
+            if batch_size:
+                # 서버 측 커서는 SQLAlchemy 가 첫 행 하나를 미리 읽어두므로 그 행만 Result 에서 꺼내 별도 배치로 변환
+                head = result.fetchmany(1)
+                if not head:
+                    # 결과가 없으면 SQLAlchemy 가 커서를 닫으므로 더 조회하지 않음
+                    return _arrow_table(names, batches, types)
+                batches.append(_arrow_batch(names, types, [tuple(head[0])]))
+            while True:
+                rows = cursor.fetchmany(batch_size) if batch_size else cursor.fetchall()
+                if not rows:
+                    break
+                batches.append(_arrow_batch(names, types, rows))
+                # 마지막 배치 이후에는 SQLAlchemy 가 커서를 닫으므로 더 조회하지 않음
+                if not batch_size or len(rows) < batch_size:
+                    break
+            return _arrow_table(names, batches, types)
+        finally:
+            result.close()
+
+    def _build_select(
+        self,
+        table: str,
+        columns: list | None = None,
+        order: str | list | None = None,
+        ascending: bool = False,
+        join_info: JoinInfo | None = None,
+        limit: int = 0,
+        group_by: list | None = None,
+        offset: int = 0,
+        **kwargs,
+    ) -> tuple:
+        """SELECT 문과 bind 파라미터 생성
+
+        조건 값은 bindparam 으로 분리하고 문장은 형태별로 캐시하므로,
+        같은 형태의 반복 조회는 테이블 조회/조건 생성/SQL 컴파일 없이 파라미터만 바뀐다.
+        """
+        join_shape = None
+        params = self._condition_params(kwargs)
+        if join_info:
+            join_shape = (
+                join_info.primary_table,
+                join_info.secondary_table,
+                join_info.primary_column,
+                join_info.secondary_column,
+                tuple(join_info.columns),
+                join_info.is_outer,
+                self._condition_shape(join_info.secondary_condition),
+            )
+            params.update(self._condition_params(join_info.secondary_condition, bind_prefix="join_"))
+
+        # offset 은 페이지마다 달라지므로 bindparam 으로 분리
+        if offset:
+            params["select_offset"] = offset
+
+        shape = (
+            table,
+            tuple(columns) if columns is not None else None,
+            self._condition_shape(kwargs),
+            tuple(order) if isinstance(order, list) else order,
+            ascending,
+            limit,
+            join_shape,
+            tuple(group_by) if group_by else None,
+            bool(offset),
+        )
+        stmt = self.statement_cache.get(shape)
+        if stmt is None:
+            stmt = self._compose_select(table, columns, order, ascending, join_info, limit, kwargs, group_by, offset)
+            self.statement_cache.put(shape, stmt)
+        return stmt, params
+
+    def _compose_select(
+        self,
+        table: str,
+        columns: list | None,
+        order: str | list | None,
+        ascending: bool,
+        join_info: JoinInfo | None,
+        limit: int,
+        kwargs: dict,
+        group_by: list | None = None,
+        offset: int = 0,
+    ):
+        """bindparam 조건으로 SELECT 문 생성"""
+        obj = self._table(table)
+
+        if columns is None:
+            cols = [obj]
+        else:
+            cols = [self._column(obj, column) for column in columns]
+
+        if join_info:
+            join_table_obj = self._table(join_info.secondary_table)
+            join_cols = list(map(lambda x: getattr(join_table_obj.columns, x), join_info.columns))
+            cols.extend(join_cols)
+
+        cond = self._conditions(obj, kwargs, bind_prefix="")
+        stmt = select(*cols).where(*cond)
+
+        if join_info:
+            join_condition = self._join(join_info, bind_prefix="join_")
+            stmt = stmt.select_from(join_condition)
+
+        if group_by:
+            stmt = stmt.group_by(*[self._column(obj, column, labeled=False) for column in group_by])
+
+        if order:
+            # 여러 컬럼이면 같은 방향으로 순서대로 정렬 (keyset 페이지네이션의 동률 처리용)
+            for column in [order] if isinstance(order, str) else order:
+                order_col = self._column(obj, column, labeled=False)
                 if ascending:
                     stmt = stmt.order_by(asc(order_col))
                 else:
                     stmt = stmt.order_by(desc(order_col))
 
-            if limit:
-                stmt = stmt.limit(limit)
+        if limit:
+            stmt = stmt.limit(limit)
 
-            with self.get_connection() as connection:
-                result = connection.execute(stmt)
-                return result.fetchall()
+        if offset:
+            stmt = stmt.offset(bindparam("select_offset"))
 
-        except Exception as e:
-            logging.error(f"Error in select operation: {str(e)}")
-            raise
+        return stmt
 
-    def _join(self, join_info: JoinInfo):
+    def _join(self, join_info: JoinInfo, bind_prefix: str | None = None):
         """JOIN 조건 생성"""
         try:
-            primary_obj = self.meta_data.tables[join_info.primary_table]
-            secondary_obj = self.meta_data.tables[join_info.secondary_table]
+            primary_obj = self._table(join_info.primary_table)
+            secondary_obj = self._table(join_info.secondary_table)
 
             primary_col = getattr(primary_obj.columns, join_info.primary_column)
             secondary_col = getattr(secondary_obj.columns, join_info.secondary_column)
 
             conds = [primary_col == secondary_col]
             if join_info.secondary_condition:
-                conds += self.get_condition(secondary_obj, **join_info.secondary_condition)
+                conds += self._conditions(secondary_obj, join_info.secondary_condition, bind_prefix)
 
             if join_info.is_outer:
                 join_obj = primary_obj.outerjoin(secondary_obj, and_(*conds))
@@ -263,3 +1068,9 @@ class Database:
 
 
 database = Database()
+
+
+async def request_scope_middleware(request, call_next):
+    """요청 동안 조회 전용 connection 하나를 재사용"""
+    async with database.request_scope():
+        return await call_next(request)
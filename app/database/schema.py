@@ -0,0 +1,155 @@
+import importlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import sqlalchemy
+from sqlalchemy import Column, MetaData, PrimaryKeyConstraint, Table, util
+from sqlalchemy.engine import Engine
+from sqlalchemy.types import TypeEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_CHARS = re.compile(r"[^0-9A-Za-z._=-]")
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _type_spec(column_type: TypeEngine) -> dict:
+    """컬럼 타입을 JSON 으로 저장할 수 있는 (클래스, 생성자 인자) 형태로 변환"""
+    cls = type(column_type)
+    kwargs = {}
+    for name in sorted(util.get_cls_kwargs(cls)):
+        value = getattr(column_type, name, None)
+        if isinstance(value, _JSON_SCALARS):
+            kwargs[name] = value
+    args = list(getattr(column_type, "enums", None) or [])
+    return {"module": cls.__module__, "name": cls.__qualname__, "args": args, "kwargs": kwargs}
+
+
+def _build_type(spec: dict) -> TypeEngine:
+    """_type_spec 로 저장한 타입 복원 (SQLAlchemy 타입 클래스만 허용)"""
+    module = spec["module"]
+    if module != "sqlalchemy" and not module.startswith("sqlalchemy."):
+        raise ValueError(f"Unsupported column type module: {module}")
+    cls = getattr(importlib.import_module(module), spec["name"])
+    if not (isinstance(cls, type) and issubclass(cls, TypeEngine)):
+        raise ValueError(f"Unsupported column type: {module}.{spec['name']}")
+    return cls(*spec["args"], **spec["kwargs"])
+
+
+class SchemaCache:
+    """테이블 정의 지연 로딩 및 파일 캐시
+
+    테이블은 처음 사용할 때 개별적으로 reflect 하고, 컬럼 정의(이름, 타입, NULL 허용)와 기본 키를
+    DATA_DIR/schema/{DB}-{DB_SCHEMA_VERSION}-sa{SQLAlchemy 버전} 아래에 JSON 으로 저장한다.
+    같은 버전으로 다시 시작하면 DB 조회 없이 파일에서 Table 을 다시 만들므로, 스키마 변경을 배포할 때는 DB_SCHEMA_VERSION 을 올려야 한다.
+    파일에서 만든 Table 에는 인덱스/외래 키/서버 기본값이 없다 (조회/적재에는 컬럼과 기본 키만 사용).
+    """
+
+    def __init__(self, meta_data: MetaData, engine: Engine, version: str, root: Optional[str] = None):
+        self.meta_data = meta_data
+        self.engine = engine
+        url = engine.url
+        key = _UNSAFE_CHARS.sub(
+            "_", f"{url.host or 'local'}_{os.path.basename(url.database or '')}-{version}-sa{sqlalchemy.__version__}"
+        )
+        self.directory = os.path.join(root or os.path.join(settings.DATA_DIR, "schema"), key)
+        self._lock = threading.Lock()
+        self.reflected = 0
+        self.file_loads = 0
+        self.load_seconds = 0.0
+
+    def table(self, name: str) -> Table:
+        """테이블 정의 조회 (메모리 -> 파일 -> DB reflect 순서)"""
+        table = self.meta_data.tables.get(name)
+        if table is not None:
+            return table
+
+        with self._lock:
+            table = self.meta_data.tables.get(name)
+            if table is not None:
+                return table
+
+            started = time.perf_counter()
+            table = self._read(name)
+            if table is None:
+                table = Table(name, self.meta_data, autoload_with=self.engine)
+                self.reflected += 1
+                self._write(table)
+            else:
+                self.file_loads += 1
+            self.load_seconds += time.perf_counter() - started
+            return table
+
+    def loaded(self) -> List[str]:
+        return sorted(self.meta_data.tables)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{_UNSAFE_CHARS.sub('_', name)}.json")
+
+    def _read(self, name: str) -> Optional[Table]:
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                spec = json.load(f)
+            columns = [
+                Column(
+                    column["name"],
+                    _build_type(column["type"]),
+                    nullable=column["nullable"],
+                    autoincrement=column["autoincrement"],
+                )
+                for column in spec["columns"]
+            ]
+            # 복합 기본 키의 컬럼 순서 유지
+            return Table(name, self.meta_data, *columns, PrimaryKeyConstraint(*spec["primary_key"]))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read cached schema for {name}: {str(e)}")
+            return None
+
+    def _write(self, table: Table) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._spec(table), f, ensure_ascii=False)
+                os.replace(tmp_path, self._path(table.name))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to write cached schema for {table.name}: {str(e)}")
+
+    @staticmethod
+    def _spec(table: Table) -> dict:
+        return {
+            "name": table.name,
+            "columns": [
+                {
+                    "name": column.name,
+                    "type": _type_spec(column.type),
+                    "nullable": column.nullable,
+                    "autoincrement": column.autoincrement,
+                }
+                for column in table.columns
+            ],
+            "primary_key": [column.name for column in table.primary_key.columns],
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "tables_loaded": len(self.meta_data.tables),
+            "reflected": self.reflected,
+            "file_loads": self.file_loads,
+            "load_seconds": round(self.load_seconds, 4),
+        }
@@ -1,11 +1,19 @@
-from fastapi import FastAPI, HTTPException
-from app.core.config import get_database_config, settings
-from app.api import routers
-from app.core.exception import handler
-from app.database.conn import db
-from app.database.crud import database
-from pydantic import BaseModel
-from fastapi.middleware.cors import CORSMiddleware
+from app.core.startup import startup_report
+
+# 시작 시간 분석을 위해 단계별로 import 시간 기록
+with startup_report.phase("import fastapi"):
+    from fastapi import FastAPI, HTTPException
+    from pydantic import BaseModel
+    from fastapi.middleware.cors import CORSMiddleware
+with startup_report.phase("import config"):
+    from app.core.config import get_database_config, settings
+with startup_report.phase("import database"):
+    from app.database.conn import db
+    from app.database.crud import database, request_scope_middleware
+with startup_report.phase("import routers"):
+    from app.api import routers
+    from app.core.exception import handler
+    from app.core.warmup import access_stats_middleware
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -17,7 +25,8 @@ handler.initialize(app)
 app.include_router(routers.router)
 
 db_config = get_database_config()
-db.init_app(app, **db_config.__dict__)
+with startup_report.phase("init app"):
+    db.init_app(app, **db_config.__dict__)
 
 
 @app.get("/")
@@ -29,6 +38,11 @@ origins = [
     "*",
 ]
 
+# warm-up 대상 선정을 위한 종목별 조회 통계
+app.middleware("http")(access_stats_middleware)
+# 요청 동안 조회 전용 DB connection 재사용
+app.middleware("http")(request_scope_middleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -56,8 +70,8 @@ async def health_check():
         if not database.check_connection():
             raise Exception("Database connection test failed")
 
-        # 메타데이터 확인
-        tables = database.meta_data.tables.keys()
+        # 메타데이터 확인 (지금까지 로드된 테이블)
+        tables = database.schema.loaded()
 
         return HealthCheckResponse(
             status_code=200,
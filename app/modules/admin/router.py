@@ -0,0 +1,67 @@
+import hmac
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.exception.custom import AdminDisabledException, InvalidTokenException
+from app.core.startup import startup_report
+from app.core.warmup import cache_warmer
+from app.modules.admin.services import CacheAdminService, get_cache_admin_service
+from app.database.crud import database
+from app.modules.common.invalidation import invalidation_bus
+
+
+def verify_admin_token(x_admin_token: Annotated[Optional[str], Header()] = None) -> None:
+    """X-Admin-Token 헤더 검증 (ADMIN_TOKEN 이 설정되지 않으면 모든 요청 거부)"""
+    if not settings.ADMIN_TOKEN:
+        raise AdminDisabledException()
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode(), settings.ADMIN_TOKEN.encode()):
+        raise InvalidTokenException()
+
+
+router = APIRouter(dependencies=[Depends(verify_admin_token)])
+
+
+@router.get("/cache", summary="캐시 네임스페이스별 통계")
+def get_cache_stats(
+    namespace: Annotated[Optional[str], Query(description="캐시 네임스페이스")] = None,
+    service: CacheAdminService = Depends(get_cache_admin_service),
+):
+    return service.get_stats(namespace)
+
+
+@router.get("/cache/hot-keys", summary="캐시 핫 키 조회")
+def get_cache_hot_keys(
+    namespace: Annotated[str, Query(description="캐시 네임스페이스")],
+    limit: Annotated[int, Query(description="조회 개수", ge=1, le=1000)] = 20,
+    service: CacheAdminService = Depends(get_cache_admin_service),
+):
+    return {"namespace": namespace, "keys": service.get_hot_keys(namespace, limit)}
+
+
+@router.get("/metrics", summary="Prometheus 메트릭", response_class=PlainTextResponse)
+def get_metrics(service: CacheAdminService = Depends(get_cache_admin_service)):
+    return PlainTextResponse(service.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/warmup", summary="캐시 warm-up 상태")
+def get_warmup_status():
+    targets = [f"{ctry.value}:{ticker}" for ctry, ticker in cache_warmer.targets()]
+    return {"last_run": cache_warmer.last_run, "targets": targets}
+
+
+@router.post("/warmup", summary="캐시 warm-up 즉시 실행")
+async def run_warmup():
+    return await cache_warmer.run_once()
+
+
+@router.get("/invalidation", summary="캐시 무효화 전파 상태")
+def get_invalidation_status():
+    return invalidation_bus.get_stats()
+
+
+@router.get("/startup", summary="워커 시작 단계별 소요 시간")
+def get_startup_report():
+    return {**startup_report.to_dict(), "schema": database.schema.get_stats()}
@@ -0,0 +1,72 @@
+from typing import Any, Dict, List, Optional
+
+from app.core.exception.custom import CacheNamespaceNotFoundException
+from app.modules.common.cache import MemoryCache, get_caches
+
+METRIC_PREFIX = "alphafinder_cache"
+
+# (메트릭 이름, 타입, 설명, get_stats 키)
+_COUNTERS = [
+    ("hits_total", "counter", "Fresh cache hits", "hits"),
+    ("misses_total", "counter", "Cache misses", "misses"),
+    ("stale_hits_total", "counter", "Stale entries served while revalidating", "stale_hits"),
+    ("refreshes_total", "counter", "Background refreshes started", "refreshes"),
+    ("evictions_total", "counter", "Entries evicted by the size/count limit", "evictions"),
+    ("invalidations_total", "counter", "Entries removed by tag invalidation", "invalidations"),
+    ("loads_total", "counter", "Loader executions", "loads"),
+    ("coalesced_loads_total", "counter", "Loads merged into an in-flight loader", "coalesced_loads"),
+    ("load_errors_total", "counter", "Loader executions that raised", "load_errors"),
+    ("items", "gauge", "Entries currently cached", "total_cached_items"),
+    ("bytes", "gauge", "Estimated bytes currently cached", "bytes"),
+    ("max_bytes", "gauge", "Byte quota of the namespace", "max_bytes"),
+]
+
+
+class CacheAdminService:
+    """캐시 관측 (네임스페이스별 통계, Prometheus 메트릭, 핫 키)"""
+
+    def _get_cache(self, namespace: str) -> MemoryCache:
+        cache = get_caches().get(namespace)
+        if cache is None:
+            raise CacheNamespaceNotFoundException(namespace)
+        return cache
+
+    def get_stats(self, namespace: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """네임스페이스별 캐시 통계"""
+        if namespace:
+            return {namespace: self._get_cache(namespace).get_stats()}
+        return {name: cache.get_stats() for name, cache in get_caches().items()}
+
+    def get_hot_keys(self, namespace: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """조회가 많은 키 목록"""
+        return self._get_cache(namespace).hot_keys(limit)
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        caches = get_caches()
+        stats = {namespace: cache.get_stats() for namespace, cache in caches.items()}
+        lines = []
+
+        for suffix, metric_type, description, stat_key in _COUNTERS:
+            name = f"{METRIC_PREFIX}_{suffix}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for namespace, values in stats.items():
+                lines.append(f'{name}{{namespace="{namespace}"}} {values.get(stat_key, 0)}')
+
+        name = f"{METRIC_PREFIX}_load_duration_seconds"
+        lines.append(f"# HELP {name} Loader execution time")
+        lines.append(f"# TYPE {name} histogram")
+        for namespace, cache in caches.items():
+            latency = cache.load_latency
+            for bound, count in latency.cumulative():
+                lines.append(f'{name}_bucket{{namespace="{namespace}",le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{namespace="{namespace}",le="+Inf"}} {latency.count}')
+            lines.append(f'{name}_sum{{namespace="{namespace}"}} {latency.total:.6f}')
+            lines.append(f'{name}_count{{namespace="{namespace}"}} {latency.count}')
+
+        return "\n".join(lines) + "\n"
+
+
+def get_cache_admin_service() -> CacheAdminService:
+    return CacheAdminService()
@@ -1,88 +1,651 @@
-from datetime import datetime
+import asyncio
+import heapq
+import math
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Optional, Tuple, Any
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import logging
 
+from app.modules.common.enum import CacheType
+from app.modules.common.frame import DateLike, FrameSnapshot
+from app.modules.common.singleflight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
 
-class CacheStrategy(Enum):
-    PERMANENT = "permanent"  # 과거 데이터
-    TEMPORARY = "temporary"  # 최근 데이터
-    NO_CACHE = "no_cache"  # 실시간 데이터
+# 네임스페이스별 메모리 한도 (한 네임스페이스가 다른 네임스페이스의 데이터를 밀어내지 않도록 분리)
+NAMESPACE_QUOTAS: Dict[str, int] = {
+    "price": 256 * MB,
+    "price_v1": 256 * MB,
+    "financial": 64 * MB,
+    "stock_indices": 16 * MB,
+}
+DEFAULT_NAMESPACE_QUOTA = 64 * MB
 
+# 컨테이너 크기 추정 시 샘플링할 최대 원소 수
+_SIZE_SAMPLE = 64
+
+# loader 지연시간 히스토그램 버킷 (초)
+LOAD_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 네임스페이스별 캐시 인스턴스 (관측용, 서비스가 폐기되면 함께 제거)
+_caches: "weakref.WeakValueDictionary[str, MemoryCache]" = weakref.WeakValueDictionary()
+
+
+def _register(cache: "MemoryCache") -> str:
+    """캐시 등록 (같은 네임스페이스의 캐시가 이미 있으면 "namespace#2" 처럼 구분하여 둘 다 무효화 대상에 포함)"""
+    name, n = cache.namespace, 1
+    while name in _caches:
+        n += 1
+        name = f"{cache.namespace}#{n}"
+    _caches[name] = cache
+    return name
+
+
+# PERMANENT: 만료 없음 / TEMPORARY: soft TTL 이후 hard TTL 까지 stale 제공 + 백그라운드 갱신 / NO_CACHE: 캐시 우회
+CacheStrategy = CacheType
+
+
+class EvictionPolicy(Enum):
+    LRU = "lru"
+    LFU = "lfu"
+
+
+def cache_tag(table: str, ticker: Optional[str] = None, month: Optional[str] = None) -> str:
+    """캐시 태그 생성 ("{table}", "{table}:{ticker}", "{table}:{ticker}@{YYYY-MM}")"""
+    if ticker is None:
+        return table
+    if month is None:
+        return f"{table}:{ticker}"
+    return f"{table}:{ticker}@{month}"
+
+
+def _tag_ancestors(tag: str) -> List[str]:
+    """상위 태그 목록 ("t:005930@2025-01" -> ["t", "t:005930"])"""
+    table, sep, rest = tag.partition(":")
+    if not sep:
+        return []
+    ticker, sep, _ = rest.partition("@")
+    return [table, f"{table}:{ticker}"] if sep else [table]
+
+
+def _is_empty(data: Any) -> bool:
+    """캐싱하지 않을 빈 결과 여부"""
+    if data is None:
+        return True
+    if isinstance(data, (pd.DataFrame, FrameSnapshot)):
+        return data.empty
+    if isinstance(data, (list, tuple, dict)):
+        return len(data) == 0
+    return False
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """캐시 객체의 메모리 사용량 추정 (bytes)"""
+    if isinstance(obj, FrameSnapshot):
+        return obj.nbytes
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if _depth > 3:
+        return sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        sample = items[:_SIZE_SAMPLE]
+        sampled = sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in sample)
+        return sys.getsizeof(obj) + (sampled * len(items) // len(sample) if sample else 0)
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = obj if isinstance(obj, (list, tuple)) else list(obj)
+        sample = items[:_SIZE_SAMPLE]
+        sampled = sum(estimate_size(v, _depth + 1) for v in sample)
+        return sys.getsizeof(obj) + (sampled * len(items) // len(sample) if sample else 0)
+    if hasattr(obj, "__dict__"):
+        return sys.getsizeof(obj) + estimate_size(vars(obj), _depth + 1)
+    return sys.getsizeof(obj)
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목
+
+    expires_at(soft TTL) 이전은 fresh, stale_until(hard TTL) 이전은 stale, 이후는 만료
+    """
+
+    data: Any
+    expires_at: float
+    stale_until: float
+    size: int
+    tags: Tuple[str, ...] = ()
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def is_alive(self, now: float) -> bool:
+        return now < self.stale_until
 
-class MemoryCache:
-    """메모리 캐시 관리"""
+
+class _LRUIndex:
+    """최근 사용 순서 관리 (OrderedDict, O(1))"""
 
     def __init__(self):
-        self._cache: Dict[str, Tuple[Any, datetime, int]] = {}
+        self._order: OrderedDict[str, None] = OrderedDict()
 
-    def get(self, key: str) -> Optional[Any]:
-        """캐시된 데이터 조회"""
-        try:
-            if key in self._cache:
-                data, cached_time, ttl = self._cache[key]
+    def add(self, key: str) -> None:
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def touch(self, key: str) -> None:
+        self._order.move_to_end(key)
+
+    def renew(self, key: str) -> None:
+        """값이 교체된 키를 사용한 것으로 처리"""
+        self._order.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self, keep: Optional[str] = None) -> Optional[str]:
+        for key in self._order:
+            if key != keep:
+                return key
+        return None
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class _LFUIndex:
+    """사용 빈도 관리 (빈도별 버킷 + 빈도 오름차순 연결 리스트, O(1))
+
+    비어 있지 않은 빈도 버킷만 오름차순으로 연결하여 최소 빈도(리스트 head)를 항상 O(1)로 유지한다.
+    같은 빈도 안에서는 가장 오래 사용되지 않은 키를 먼저 내보낸다.
+    """
+
+    def __init__(self):
+        self._freq: Dict[str, int] = {}
+        self._buckets: Dict[int, OrderedDict[str, None]] = {}
+        self._next: Dict[int, Optional[int]] = {}
+        self._prev: Dict[int, Optional[int]] = {}
+        self._min_freq: Optional[int] = None
+
+    def _link(self, freq: int, after: Optional[int]) -> None:
+        """빈 버킷을 after 다음(None 이면 head)에 연결"""
+        nxt = self._next[after] if after is not None else self._min_freq
+        self._buckets[freq] = OrderedDict()
+        self._prev[freq] = after
+        self._next[freq] = nxt
+        if after is None:
+            self._min_freq = freq
+        else:
+            self._next[after] = freq
+        if nxt is not None:
+            self._prev[nxt] = freq
+
+    def _unlink(self, freq: int) -> None:
+        """빈 버킷 제거"""
+        prev, nxt = self._prev.pop(freq), self._next.pop(freq)
+        del self._buckets[freq]
+        if prev is None:
+            self._min_freq = nxt
+        else:
+            self._next[prev] = nxt
+        if nxt is not None:
+            self._prev[nxt] = prev
+
+    def add(self, key: str) -> None:
+        if key in self._freq:
+            self.touch(key)
+            return
+        self._freq[key] = 1
+        if 1 not in self._buckets:
+            self._link(1, None)
+        self._buckets[1][key] = None
+
+    def touch(self, key: str) -> None:
+        freq = self._freq[key]
+        if freq + 1 not in self._buckets:
+            self._link(freq + 1, freq)
+        del self._buckets[freq][key]
+        self._freq[key] = freq + 1
+        self._buckets[freq + 1][key] = None
+        if not self._buckets[freq]:
+            self._unlink(freq)
+
+    def renew(self, key: str) -> None:
+        """값이 교체된 키를 같은 빈도 안에서 가장 최근으로 이동 (빈도는 유지)"""
+        self._buckets[self._freq[key]].move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            self._unlink(freq)
+
+    def victim(self, keep: Optional[str] = None) -> Optional[str]:
+        freq = self._min_freq
+        while freq is not None:
+            for key in self._buckets[freq]:
+                if key != keep:
+                    return key
+            freq = self._next[freq]
+        return None
+
+    def clear(self) -> None:
+        self._freq.clear()
+        self._buckets.clear()
+        self._next.clear()
+        self._prev.clear()
+        self._min_freq = None
+
+
+class LoadLatency:
+    """loader 실행 시간 누적 (히스토그램)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LOAD_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(상한, 누적 개수) 리스트"""
+        result, running = [], 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 2) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+class MemoryCache:
+    """메모리 캐시 관리
+
+    네임스페이스 단위로 생성되며, 네임스페이스마다 독립된 메모리 한도(bytes)를 가진다.
+    한도를 넘으면 LRU/LFU 정책에 따라 O(1)로 항목을 내보낸다.
+    DataFrame 은 불변 스냅샷(FrameSnapshot)으로 저장되어 조회 시 복사 없이 view 로 반환된다.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "default",
+        max_bytes: Optional[int] = None,
+        max_items: Optional[int] = None,
+        policy: EvictionPolicy = EvictionPolicy.LRU,
+    ):
+        self.namespace = namespace
+        self.max_bytes = max_bytes or NAMESPACE_QUOTAS.get(namespace, DEFAULT_NAMESPACE_QUOTA)
+        self.max_items = max_items
+        self.policy = policy
+        self._cache: Dict[str, CacheEntry] = {}
+        self._index = _LFUIndex() if policy == EvictionPolicy.LFU else _LRUIndex()
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._flight = SingleFlight()
+        self._refresh_tasks: set[asyncio.Task] = set()
+        self._refreshing: set[str] = set()
+        self._key_hits: Dict[str, int] = {}
+        self._tag_index: Dict[str, set[str]] = {}
+        self._invalidations = 0
+        self._load_latency = LoadLatency()
+        self._load_errors = 0
+        self.name = _register(self)
+
+    @property
+    def load_latency(self) -> LoadLatency:
+        return self._load_latency
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[CacheEntry], bool]:
+        """캐시 항목 조회 - (항목, stale 여부) 반환"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                now = time.monotonic()
                 # TTL 체크
-                if (datetime.now() - cached_time).total_seconds() < ttl:
-                    if isinstance(data, pd.DataFrame):
-                        return data.copy()
-                    return data
-                # 만료된 캐시 삭제
-                del self._cache[key]
-            return None
+                if entry.is_fresh(now):
+                    self._hits += 1
+                    self._key_hits[key] = self._key_hits.get(key, 0) + 1
+                    self._index.touch(key)
+                    return entry, False
+                if not entry.is_alive(now):
+                    # 만료된 캐시 삭제
+                    self._remove(key)
+                elif allow_stale:
+                    self._stale_hits += 1
+                    self._key_hits[key] = self._key_hits.get(key, 0) + 1
+                    self._index.touch(key)
+                    return entry, True
+            self._misses += 1
+            return None, False
+
+    @staticmethod
+    def _output(data: Any) -> Any:
+        # 읽기 전용 view 로 반환 (복사 없음)
+        if isinstance(data, FrameSnapshot):
+            return data.to_frame()
+        return data
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """캐시된 데이터 조회 (기본적으로 fresh 항목만 반환)"""
+        try:
+            entry, _ = self._lookup(key, allow_stale)
+            return self._output(entry.data) if entry is not None else None
         except Exception as e:
             logger.error(f"Error retrieving from cache: {str(e)}")
             return None
 
-    def set(self, key: str, data: Any, ttl: int) -> None:
-        """데이터 캐싱"""
+    def get_snapshot(self, key: str, allow_stale: bool = False) -> Optional[FrameSnapshot]:
+        """캐시된 DataFrame 스냅샷 조회"""
+        entry, _ = self._lookup(key, allow_stale)
+        if entry is None or not isinstance(entry.data, FrameSnapshot):
+            return None
+        return entry.data
+
+    def get_range(
+        self, key: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None, allow_stale: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """캐시된 DataFrame 에서 날짜 구간만 복사 없이 조회"""
+        try:
+            snapshot = self.get_snapshot(key, allow_stale)
+            return snapshot.slice(start, end) if snapshot is not None else None
+        except Exception as e:
+            logger.error(f"Error retrieving range from cache: {str(e)}")
+            return None
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: int,
+        strategy: CacheStrategy = CacheStrategy.TEMPORARY,
+        stale_ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """데이터 캐싱
+
+        ttl: soft TTL(초), stale_ttl: soft TTL 이후 stale 데이터를 제공할 시간(초, 기본값 ttl)
+        tags: 무효화 태그 (cache_tag 참고). 데이터 변경 시 invalidate_tags 로 함께 삭제된다.
+        """
+        if strategy == CacheStrategy.NO_CACHE:
+            return
         try:
-            # DataFrame의 경우 empty 체크
+            # DataFrame의 경우 empty 체크 후 불변 스냅샷으로 변환 (이미 스냅샷이면 그대로 보관)
             if isinstance(data, pd.DataFrame):
                 if data.empty:
                     return
-                cached_data = data.copy()
+                cached_data = FrameSnapshot.from_frame(data)
+            elif isinstance(data, FrameSnapshot):
+                if data.empty:
+                    return
+                cached_data = data
             else:
                 cached_data = data
 
-            self._cache[key] = (cached_data, datetime.now(), ttl)
+            size = estimate_size(cached_data)
+            if size > self.max_bytes:
+                logger.warning(f"[{self.namespace}] Skip caching {key}: {size} bytes exceeds quota {self.max_bytes}")
+                return
+
+            now = time.monotonic()
+            if strategy == CacheStrategy.PERMANENT:
+                expires_at = stale_until = math.inf
+            else:
+                expires_at = now + ttl
+                stale_until = expires_at + (ttl if stale_ttl is None else stale_ttl)
 
-            # 캐시 크기 제한 (예: 최대 100개)
-            if len(self._cache) > 100:
-                oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-                del self._cache[oldest_key]
+            with self._lock:
+                previous = self._cache.get(key)
+                if previous is not None:
+                    # 덮어쓰기는 값/크기/태그만 교체하고 사용 빈도(LFU)와 순서는 유지
+                    # (주기적으로 갱신되는 인기 키가 최소 빈도로 돌아가 먼저 제거되지 않도록)
+                    self._bytes -= previous.size
+                    self._untag(key, previous.tags)
+                    self._index.renew(key)
+                # 새 항목을 넣기 전에 공간 확보 (LFU 에서 빈도 1 인 새 항목이 바로 제거되지 않도록, 덮어쓰는 키는 제외)
+                self._evict(size, 0 if previous is not None else 1, keep=key)
+                entry_tags = tuple(tags)
+                self._cache[key] = CacheEntry(cached_data, expires_at, stale_until, size, entry_tags)
+                for tag in entry_tags:
+                    self._tag_index.setdefault(tag, set()).add(key)
+                self._bytes += size
+                if previous is None:
+                    self._index.add(key)
         except Exception as e:
             logger.error(f"Error setting cache: {str(e)}")
 
+    async def coalesce(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """동일 키의 동시 로드 병합 (결과는 캐싱하지 않음)"""
+        return await self._flight.do(key, lambda: self._timed(loader))
+
+    async def _timed(self, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """loader 실행 시간 및 실패 횟수 기록"""
+        started = time.perf_counter()
+        try:
+            return await loader()
+        except Exception:
+            self._load_errors += 1
+            raise
+        finally:
+            self._load_latency.observe(time.perf_counter() - started)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        strategy: CacheStrategy = CacheStrategy.TEMPORARY,
+        stale_ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """캐시 조회 후 미스이면 병합된 단일 로드로 채움
+
+        TEMPORARY 항목이 stale 상태이면 기존 데이터를 즉시 반환하고 백그라운드에서 갱신한다.
+        loader 예외는 모든 대기자에게 전달되며 캐싱되지 않는다.
+        """
+        if strategy == CacheStrategy.NO_CACHE:
+            return await self.coalesce(key, loader)
+
+        entry, stale = self._lookup(key, allow_stale=True)
+
+        async def load():
+            loaded = await self._timed(loader)
+            if not _is_empty(loaded):
+                self.set(key, loaded, ttl, strategy, stale_ttl, tags)
+            return loaded
+
+        if entry is not None:
+            if stale:
+                self._schedule_refresh(key, load)
+            return self._output(entry.data)
+
+        return await self._flight.do(key, load)
+
+    def _schedule_refresh(self, key: str, load: Callable[[], Awaitable[Any]]) -> None:
+        """stale 항목 백그라운드 갱신 (키당 하나만 실행)
+
+        task 가 시작되기 전(같은 loop tick)에 들어온 stale 조회도 중복 갱신하지 않도록 키를 먼저 등록한다.
+        """
+        if key in self._refreshing or self._flight.is_inflight(key):
+            return
+        self._refreshing.add(key)
+        self._refreshes += 1
+        task = asyncio.ensure_future(self._flight.do(key, load))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(lambda done: self._on_refresh_done(key, done))
+
+    def _on_refresh_done(self, key: str, task: asyncio.Task) -> None:
+        self._refreshing.discard(key)
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"[{self.namespace}] Background refresh failed: {str(task.exception())}")
+
+    async def close(self) -> None:
+        """진행 중인 백그라운드 갱신 취소"""
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+
+    def _remove(self, key: str) -> None:
+        """만료/제거/무효화된 항목 삭제 (조회 수 포함, 값 교체는 set 에서 처리하므로 조회 수가 유지됨)"""
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
+        self._index.remove(key)
+        self._key_hits.pop(key, None)
+        self._untag(key, entry.tags)
+
+    def _untag(self, key: str, tags: Tuple[str, ...]) -> None:
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """태그로 캐시 무효화 - 같은 태그, 상위 태그(종목/테이블 단위), 하위 태그(월 단위) 항목 삭제"""
+        with self._lock:
+            targets = set()
+            for tag in tags:
+                targets.add(tag)
+                targets.update(_tag_ancestors(tag))
+                prefixes = (f"{tag}:", f"{tag}@")
+                targets.update(t for t in self._tag_index if t.startswith(prefixes))
+
+            keys = set()
+            for tag in targets:
+                keys.update(self._tag_index.get(tag, ()))
+            for key in keys:
+                if key in self._cache:
+                    self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def _evict(self, reserve_bytes: int = 0, reserve_items: int = 0, keep: Optional[str] = None) -> None:
+        """reserve 만큼 추가해도 메모리/개수 한도를 넘지 않을 때까지 정책에 따라 항목 제거 (keep 은 제외)"""
+        while self._bytes + reserve_bytes > self.max_bytes or (
+            self.max_items and len(self._cache) + reserve_items > self.max_items
+        ):
+            victim = self._index.victim(keep)
+            if victim is None:
+                break
+            self._remove(victim)
+            self._evictions += 1
+
     def clear(self, pattern: Optional[str] = None) -> None:
         """캐시 삭제"""
         try:
-            if pattern:
-                keys_to_delete = [key for key in self._cache.keys() if pattern in key]
-                for key in keys_to_delete:
-                    del self._cache[key]
-            else:
-                self._cache.clear()
+            with self._lock:
+                if pattern:
+                    keys_to_delete = [key for key in self._cache.keys() if pattern in key]
+                    for key in keys_to_delete:
+                        self._remove(key)
+                else:
+                    self._cache.clear()
+                    self._index.clear()
+                    self._key_hits.clear()
+                    self._tag_index.clear()
+                    self._bytes = 0
         except Exception as e:
             logger.error(f"Error clearing cache: {str(e)}")
 
     def get_stats(self) -> dict:
         """캐시 상태 정보"""
         try:
-            stats = {
-                "total_cached_items": len(self._cache),
-                "memory_keys": list(self._cache.keys()),
-                "type_distribution": {},
-            }
+            with self._lock:
+                lookups = self._hits + self._misses
+                stats = {
+                    "namespace": self.namespace,
+                    "policy": self.policy.value,
+                    "total_cached_items": len(self._cache),
+                    "bytes": self._bytes,
+                    "max_bytes": self.max_bytes,
+                    "hits": self._hits,
+                    "misses": self._misses,
+                    "stale_hits": self._stale_hits,
+                    "refreshes": self._refreshes,
+                    "evictions": self._evictions,
+                    "invalidations": self._invalidations,
+                    "loads": self._flight.loads,
+                    "coalesced_loads": self._flight.coalesced,
+                    "load_errors": self._load_errors,
+                    "load_latency": self._load_latency.to_dict(),
+                    "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                    "type_distribution": {},
+                }
 
-            # 캐시된 데이터 타입 분포 추가
-            for k, (v, _, _) in self._cache.items():
-                data_type = type(v).__name__
-                stats["type_distribution"][data_type] = stats["type_distribution"].get(data_type, 0) + 1
+                # 캐시된 데이터 타입 분포 추가
+                for entry in self._cache.values():
+                    data_type = type(entry.data).__name__
+                    stats["type_distribution"][data_type] = stats["type_distribution"].get(data_type, 0) + 1
 
             return stats
         except Exception as e:
             logger.error(f"Error getting cache stats: {str(e)}")
             return {}
+
+    def hot_keys(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """조회가 많은 키 목록 (현재 캐시에 남아있는 키 기준)"""
+        with self._lock:
+            now = time.monotonic()
+            top = heapq.nlargest(limit, self._key_hits.items(), key=lambda item: item[1])
+            result = []
+            for key, hits in top:
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue
+                result.append(
+                    {
+                        "key": key,
+                        "hits": hits,
+                        "bytes": entry.size,
+                        "ttl": None if math.isinf(entry.expires_at) else round(entry.expires_at - now, 1),
+                    }
+                )
+            return result
+
+
+def get_caches() -> Dict[str, MemoryCache]:
+    """생성된 캐시 인스턴스 (네임스페이스별)"""
+    return dict(sorted(_caches.items()))
+
+
+async def close_caches() -> None:
+    """모든 캐시의 백그라운드 갱신 종료"""
+    for cache in get_caches().values():
+        await cache.close()
@@ -0,0 +1,185 @@
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import logging
+
+from app.core.config import settings
+from app.modules.common.frame import FrameSnapshot
+
+logger = logging.getLogger(__name__)
+
+# 저장 포맷이 바뀌면 올려서 기존 파일을 무시
+DISK_CACHE_VERSION = "v1"
+
+_UNSAFE_CHARS = re.compile(r"[^0-9A-Za-z._=-]")
+
+
+class DiskCache:
+    """로컬 디스크 캐시 (L2)
+
+    변하지 않는 데이터(마감된 기간의 시세 등)를 Arrow IPC 파일로 저장하고 memory-map 으로 읽는다.
+    읽은 데이터는 매핑된 버퍼를 그대로 공유하는 FrameSnapshot 으로 반환하므로 MemoryCache 에 복사 없이 넣을 수 있다.
+    파일은 임시 파일에 쓴 뒤 rename 하므로 여러 워커가 동시에 써도 깨진 파일을 읽지 않는다.
+    쓰기 후 prune_interval 마다 max_age 보다 오래된 파일을 지우고, 전체 크기가 max_bytes 를 넘으면
+    가장 오래 사용되지 않은 파일부터 지운다 (읽을 때 파일 수정 시각을 갱신).
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        root: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        prune_interval: Optional[float] = None,
+    ):
+        self.namespace = namespace
+        self.root = os.path.join(root or os.path.join(settings.DATA_DIR, "cache"), namespace, DISK_CACHE_VERSION)
+        self.max_bytes = settings.DISK_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.max_age = settings.DISK_CACHE_MAX_AGE_DAYS * 24 * 60 * 60 if max_age is None else max_age
+        self.prune_interval = settings.DISK_CACHE_PRUNE_INTERVAL_SECONDS if prune_interval is None else prune_interval
+        self._lock = threading.Lock()
+        self._last_prune = -float("inf")
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._errors = 0
+        self._pruned = 0
+
+    def path(self, *parts: str) -> str:
+        """키 구성 요소로 파일 경로 생성"""
+        safe_parts = [_UNSAFE_CHARS.sub("_", str(part)) for part in parts]
+        return os.path.join(self.root, *safe_parts[:-1], f"{safe_parts[-1]}.arrow")
+
+    def read(self, *parts: str, date_column: Optional[str] = "Date") -> Optional[FrameSnapshot]:
+        """저장된 데이터를 스냅샷으로 조회 (없으면 None)"""
+        path = self.path(*parts)
+        try:
+            # 매핑은 버퍼를 참조하는 배열이 남아 있는 동안 유지됨 (파일이 교체/삭제되어도 기존 매핑은 유효)
+            with pa.memory_map(path, "r") as source:
+                table = ipc.open_file(source).read_all()
+            snapshot = FrameSnapshot.from_arrow(table, date_column)
+            self._count("_hits")
+            self._touch(path)
+            return snapshot
+        except FileNotFoundError:
+            self._count("_misses")
+            return None
+        except Exception as e:
+            # 손상된 파일은 삭제 후 미스로 처리
+            logger.warning(f"[{self.namespace}] Failed to read disk cache {path}: {str(e)}")
+            self._count("_errors")
+            self._discard(path)
+            return None
+
+    def write(self, df: pd.DataFrame, *parts: str) -> None:
+        """DataFrame 저장 (빈 DataFrame 도 스키마와 함께 저장)"""
+        path = self.path(*parts)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as sink:
+                    with ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._discard(tmp_path)
+                raise
+            self._count("_writes")
+        except Exception as e:
+            logger.warning(f"[{self.namespace}] Failed to write disk cache {path}: {str(e)}")
+            self._count("_errors")
+        self._maybe_prune()
+
+    def prune(self) -> int:
+        """보관 기간이 지난 파일과 크기 한도를 넘는 파일(오래 사용되지 않은 순) 삭제, 삭제한 파일 수 반환"""
+        files = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        cutoff = time.time() - self.max_age if self.max_age else None
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in sorted(files):
+            expired = cutoff is not None and mtime < cutoff
+            if not expired and total <= self.max_bytes:
+                break
+            # 쓰는 중인 임시 파일은 보관 기간이 지난 경우에만 삭제
+            if not expired and path.endswith(".tmp"):
+                continue
+            self._discard(path)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"[{self.namespace}] Pruned {removed} disk cache files ({total} bytes left)")
+            with self._lock:
+                self._pruned += removed
+        return removed
+
+    def _maybe_prune(self) -> None:
+        """prune_interval 이 지났으면 정리 (워커마다 독립적으로 실행되며, 다른 워커가 지운 파일은 무시)"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_prune < self.prune_interval:
+                return
+            self._last_prune = now
+        try:
+            self.prune()
+        except Exception as e:
+            logger.warning(f"[{self.namespace}] Failed to prune disk cache: {str(e)}")
+
+    def _touch(self, path: str) -> None:
+        """최근 사용 시각 기록 (크기 한도 정리 시 최근에 읽은 파일을 남김)"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def delete(self, *parts: str) -> None:
+        self._discard(self.path(*parts))
+
+    def delete_tree(self, *parts: str) -> None:
+        """키 구성 요소 하위의 모든 파일 삭제"""
+        safe_parts = [_UNSAFE_CHARS.sub("_", str(part)) for part in parts]
+        shutil.rmtree(os.path.join(self.root, *safe_parts), ignore_errors=True)
+
+    def _discard(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """디스크 캐시 상태 정보"""
+        lookups = self._hits + self._misses
+        return {
+            "namespace": self.namespace,
+            "root": self.root,
+            "hits": self._hits,
+            "misses": self._misses,
+            "writes": self._writes,
+            "errors": self._errors,
+            "pruned": self._pruned,
+            "max_bytes": self.max_bytes,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
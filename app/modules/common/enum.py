@@ -20,6 +20,27 @@ class Frequency(Enum):
     MINUTE = "minute"
 
 
+class ResponseFormat(Enum):
+    RECORDS = "records"  # 행 단위 객체 배열
+    COLUMNAR = "columnar"  # 컬럼별 배열 (struct of arrays)
+
+
+class ExportFormat(Enum):
+    ARROW = "arrow"  # Arrow IPC stream
+    PARQUET = "parquet"
+
+
+class Interval(Enum):
+    """차트 봉 간격 (분봉/일봉을 서버에서 집계)"""
+
+    MINUTE_5 = "5m"
+    MINUTE_15 = "15m"
+    MINUTE_60 = "60m"
+    WEEK = "1w"
+    MONTH = "1M"
+    YEAR = "1Y"
+
+
 class GraphPeriod(Enum):
     ONE_DAY = "oneday"
     ONE_WEEK = "oneweek"
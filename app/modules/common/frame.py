@@ -0,0 +1,124 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+DateLike = Union[date, datetime, pd.Timestamp, np.datetime64]
+
+
+def _readonly(values: np.ndarray) -> np.ndarray:
+    values.flags.writeable = False
+    return values
+
+
+class FrameSnapshot:
+    """캐시용 불변 DataFrame 표현
+
+    컬럼별 읽기 전용 NumPy 배열로 보관하여 조회 시 복사 없이 view 기반 DataFrame 을 반환한다.
+    반환된 DataFrame 에 새 컬럼을 추가하는 것은 가능하지만, 기존 값을 제자리에서 수정하면 ValueError 가 발생한다.
+    date_column 이 정렬되어 있으면 `slice` 로 날짜 구간을 이진 탐색하여 잘라낸다.
+    """
+
+    __slots__ = ("_columns", "_index", "_dates", "date_column", "nbytes")
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        index: pd.Index,
+        date_column: Optional[str] = None,
+        nbytes: int = 0,
+    ):
+        self._columns = columns
+        self._index = index
+        self.date_column = date_column
+        self.nbytes = nbytes
+
+        # 날짜 컬럼이 정렬된 경우에만 구간 검색용 int64(ns) 배열 보관
+        self._dates: Optional[np.ndarray] = None
+        if date_column in columns:
+            dates = columns[date_column]
+            if np.issubdtype(dates.dtype, np.datetime64):
+                dates = dates.astype("datetime64[ns]", copy=False).view("int64")
+                if len(dates) < 2 or bool(np.all(dates[1:] >= dates[:-1])):
+                    self._dates = dates
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, date_column: Optional[str] = "Date", copy: bool = True) -> "FrameSnapshot":
+        """DataFrame 으로부터 스냅샷 생성 (원본과 메모리를 공유하지 않음)
+
+        copy=False 이면 원본의 배열을 그대로 읽기 전용으로 보관한다. 호출자가 새로 만들어 더 이상 사용하지 않는
+        DataFrame(concat 결과 등)에만 사용한다. 이미 읽기 전용인 배열은 크기 계산을 위해 복사한다.
+        """
+        columns = {}
+        for name in df.columns:
+            values = df[name].to_numpy()
+            columns[name] = values.copy() if copy or not values.flags.writeable else values
+        # 원본이 다른 스냅샷의 읽기 전용 배열을 포함하면 memory_usage(deep=True) 가 실패하므로 복사본으로 계산
+        nbytes = int(pd.DataFrame(columns, index=df.index, copy=False).memory_usage(deep=True).sum())
+        for values in columns.values():
+            _readonly(values)
+        return cls(columns, df.index, date_column if date_column in df.columns else None, nbytes)
+
+    @classmethod
+    def from_arrow(cls, table: pa.Table, date_column: Optional[str] = "Date") -> "FrameSnapshot":
+        """pyarrow.Table 로부터 스냅샷 생성
+
+        결측값이 없는 숫자/시각 컬럼은 Arrow 버퍼(memory-map 된 파일 포함)를 복사 없이 공유하고,
+        문자열 등 변환이 필요한 컬럼만 복사한다.
+        """
+        df = table.to_pandas(split_blocks=True)
+        # 읽기 전용으로 바꾸기 전에 계산 (from_frame 참고)
+        nbytes = int(df.memory_usage(deep=True).sum())
+        columns = {name: _readonly(df[name].to_numpy()) for name in df.columns}
+        return cls(columns, df.index, date_column if date_column in df.columns else None, nbytes)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def empty(self) -> bool:
+        return len(self._index) == 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def to_frame(self) -> pd.DataFrame:
+        """복사 없이 DataFrame 생성"""
+        return self._build(slice(None))
+
+    def slice(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> pd.DataFrame:
+        """date_column 기준 [start, end] 구간 조회 (양 끝 포함)"""
+        if self.empty:
+            return self.to_frame()
+        if self._dates is None:
+            if self.date_column is None:
+                raise ValueError("date_column is not set for this snapshot")
+            # 정렬되지 않은 경우 마스크로 처리
+            dates = pd.Series(self._columns[self.date_column])
+            mask = np.ones(len(dates), dtype=bool)
+            if start is not None:
+                mask &= (dates >= pd.Timestamp(start)).to_numpy()
+            if end is not None:
+                mask &= (dates <= pd.Timestamp(end)).to_numpy()
+            return self._build(mask)
+
+        lo = 0 if start is None else int(np.searchsorted(self._dates, pd.Timestamp(start).value, side="left"))
+        hi = len(self._dates) if end is None else int(np.searchsorted(self._dates, pd.Timestamp(end).value, side="right"))
+        return self._build(slice(lo, hi))
+
+    def date_bounds(self) -> Optional[tuple]:
+        """date_column 의 (최소, 최대) 값"""
+        if self.date_column is None or self.empty:
+            return None
+        if self._dates is not None:
+            return pd.Timestamp(self._dates[0]), pd.Timestamp(self._dates[-1])
+        dates = pd.Series(self._columns[self.date_column])
+        return dates.min(), dates.max()
+
+    def _build(self, selector: Union[slice, np.ndarray]) -> pd.DataFrame:
+        # slice 는 view, 마스크는 필요한 행만 복사
+        data = {name: values[selector] for name, values in self._columns.items()}
+        return pd.DataFrame(data, index=self._index[selector], copy=False)
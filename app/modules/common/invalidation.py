@@ -0,0 +1,197 @@
+import asyncio
+import glob
+import json
+import logging
+import os
+import socket
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.modules.common.cache import cache_tag, get_caches
+
+logger = logging.getLogger(__name__)
+
+# 종목 코드 컬럼 (테이블마다 이름이 다름)
+TICKER_COLUMNS = ("Ticker", "ticker", "Code")
+DATE_COLUMN = "Date"
+
+# 데이터그램 하나에 담을 최대 태그 수 (Unix 소켓 버퍼 한도 내로 분할)
+_TAGS_PER_MESSAGE = 2000
+
+Listener = Callable[[List[str]], None]
+
+
+def tags_for_records(table: str, records: Iterable[Dict[str, Any]]) -> List[str]:
+    """변경된 행(또는 조건)으로부터 무효화 태그 생성
+
+    종목 컬럼이 없는 변경은 테이블 전체, Date 값이 있으면 종목의 해당 월 단위로 무효화한다.
+    """
+    tags = set()
+    for record in records:
+        ticker = next((record[column] for column in TICKER_COLUMNS if record.get(column) is not None), None)
+        if ticker is None:
+            return [cache_tag(table)]
+        value = record.get(DATE_COLUMN)
+        month = f"{value:%Y-%m}" if isinstance(value, (date, datetime)) else None
+        tags.add(cache_tag(table, str(ticker), month))
+    return sorted(tags)
+
+
+def tags_for_columns(table: str, columns: Dict[str, List[Any]]) -> List[str]:
+    """컬럼 단위 데이터({컬럼명: 값 목록})로부터 무효화 태그 생성 (규칙은 tags_for_records 와 동일)"""
+    ticker_columns = [columns[column] for column in TICKER_COLUMNS if column in columns]
+    if not ticker_columns:
+        return [cache_tag(table)]
+    dates = columns.get(DATE_COLUMN) or [None] * len(ticker_columns[0])
+
+    tags = set()
+    for values, value in zip(zip(*ticker_columns), dates):
+        ticker = next((ticker for ticker in values if ticker is not None), None)
+        if ticker is None:
+            return [cache_tag(table)]
+        month = f"{value:%Y-%m}" if isinstance(value, (date, datetime)) else None
+        tags.add(cache_tag(table, str(ticker), month))
+    return sorted(tags)
+
+
+def tags_for_conditions(table: str, conditions: Dict[str, Any]) -> List[str]:
+    """UPDATE/DELETE 조건(kwargs)으로부터 무효화 태그 생성"""
+    for column in TICKER_COLUMNS:
+        if column in conditions:
+            tickers = [conditions[column]]
+        elif f"{column}__in" in conditions:
+            tickers = list(conditions[f"{column}__in"])
+        else:
+            continue
+        return tags_for_records(table, [{column: ticker, DATE_COLUMN: conditions.get(DATE_COLUMN)} for ticker in tickers])
+    return [cache_tag(table)]
+
+
+class InvalidationBus:
+    """캐시 무효화 전파
+
+    publish 된 태그를 현재 프로세스의 모든 MemoryCache 와 구독자에 적용하고,
+    DATA_DIR/invalidation 아래의 Unix 데이터그램 소켓으로 다른 uvicorn 워커에 전달한다.
+    각 워커는 lifespan 시작 시 `{pid}.sock` 을 열어 수신하며, 응답이 없는 소켓 파일은 발행 시 정리된다.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or os.path.join(settings.DATA_DIR, "invalidation")
+        self._listeners: List[Listener] = []
+        self._sock: Optional[socket.socket] = None
+        self._path: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._send_lock = threading.Lock()
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, listener: Listener) -> None:
+        """캐시 외 저장소(디스크 캐시 등) 무효화 구독"""
+        self._listeners.append(listener)
+
+    def publish(self, tags: Iterable[str]) -> None:
+        """태그 무효화 발행 (현재 프로세스 적용 후 다른 워커로 전파)"""
+        tags = sorted(set(tags))
+        if not tags:
+            return
+        self.published += 1
+        self._apply(tags)
+        self._broadcast(tags)
+
+    def _apply(self, tags: List[str]) -> None:
+        removed = sum(cache.invalidate_tags(tags) for cache in get_caches().values())
+        for listener in self._listeners:
+            try:
+                listener(tags)
+            except Exception as e:
+                logger.warning(f"Invalidation listener failed: {str(e)}")
+        logger.debug(f"Invalidated {removed} cache entries for {len(tags)} tags")
+
+    def _broadcast(self, tags: List[str]) -> None:
+        if not hasattr(socket, "AF_UNIX"):
+            return
+        peers = [path for path in glob.glob(os.path.join(self.directory, "*.sock")) if path != self._path]
+        if not peers:
+            return
+
+        messages = [
+            json.dumps({"origin": os.getpid(), "tags": tags[i : i + _TAGS_PER_MESSAGE]}).encode()
+            for i in range(0, len(tags), _TAGS_PER_MESSAGE)
+        ]
+        with self._send_lock, socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+            sender.setblocking(False)
+            for path in peers:
+                try:
+                    for message in messages:
+                        sender.sendto(message, path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # 종료된 워커의 소켓 파일 정리
+                    self._discard(path)
+                except BlockingIOError:
+                    logger.warning(f"Invalidation queue full for {path}, message dropped")
+                except OSError as e:
+                    logger.warning(f"Failed to send invalidation to {path}: {str(e)}")
+
+    def _on_readable(self) -> None:
+        while True:
+            try:
+                data = self._sock.recv(1 << 20)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                logger.warning(f"Failed to receive invalidation: {str(e)}")
+                return
+            try:
+                message = json.loads(data)
+                self.received += 1
+                self._apply(list(message["tags"]))
+            except Exception as e:
+                logger.warning(f"Invalid invalidation message: {str(e)}")
+
+    async def start(self) -> None:
+        """다른 워커의 무효화 수신 시작"""
+        if not hasattr(socket, "AF_UNIX") or self._sock is not None:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._path = os.path.join(self.directory, f"{os.getpid()}.sock")
+            self._discard(self._path)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.bind(self._path)
+            sock.setblocking(False)
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(sock.fileno(), self._on_readable)
+            self._sock = sock
+        except Exception as e:
+            logger.error(f"Failed to start invalidation bus: {str(e)}")
+            self._path = None
+
+    async def stop(self) -> None:
+        """수신 종료 및 소켓 파일 삭제"""
+        if self._sock is None:
+            return
+        self._loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        self._discard(self._path)
+        self._path = None
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "listening": self._path,
+            "published": self.published,
+            "received": self.received,
+        }
+
+
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,262 @@
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import pytz
+
+from app.core.config import settings
+from app.modules.common.cache import CacheStrategy
+from app.modules.common.enum import Country
+
+logger = logging.getLogger(__name__)
+
+# 장중 캐시 TTL (초)
+MARKET_OPEN_TTL = 60
+
+# 휴장일 표 범위를 벗어났다고 경고한 캘린더 (프로세스당 한 번)
+_coverage_warned: set = set()
+
+# 기본 휴장일 파일 (MARKET_HOLIDAYS_PATH 로 교체 가능)
+_DEFAULT_HOLIDAYS_PATH = os.path.join(os.path.dirname(__file__), "data", "market_holidays.json")
+
+
+def load_holidays(path: str) -> Dict[str, Dict[str, Any]]:
+    """거래소별 휴장일 파일 로드
+
+    {"NYSE": {"covered_from": "2024-01-01", "covered_until": "2026-12-31", "holidays": ["2026-01-01", ...],
+              "early_closes": {"2026-11-27": "13:00"}}}
+    covered_until 은 표가 유효한 마지막 날짜이며, 매년 거래소 공지 기준으로 다음 해 휴장일과 함께 갱신해야 한다.
+    covered_from(선택)은 표가 유효한 첫 날짜이며, 이전 날짜의 휴장일은 표에 없다.
+    """
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    return {
+        name: {
+            "covered_from": date.fromisoformat(table["covered_from"]) if "covered_from" in table else None,
+            "covered_until": date.fromisoformat(table["covered_until"]),
+            "holidays": frozenset(date.fromisoformat(day) for day in table["holidays"]),
+            "early_closes": {
+                date.fromisoformat(day): time.fromisoformat(close) for day, close in table.get("early_closes", {}).items()
+            },
+        }
+        for name, table in raw.items()
+    }
+
+
+_HOLIDAYS = load_holidays(settings.MARKET_HOLIDAYS_PATH or _DEFAULT_HOLIDAYS_PATH)
+
+
+@dataclass(frozen=True)
+class CacheExpiry:
+    """캐시 만료 정책 (MemoryCache.set / get_or_load 인자)"""
+
+    ttl: int
+    strategy: CacheStrategy
+    stale_ttl: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class MarketCalendar:
+    """거래소 정규장 캘린더
+
+    settle: 장 마감 후 일봉이 확정(적재)될 때까지의 여유 시간 (MARKET_SETTLE_MINUTES). 이 시간 동안은 장중과 동일하게 취급한다.
+    시간만으로는 적재 완료를 보장할 수 없으므로, 캐시는 마지막 확정 거래일의 일봉이 있을 때만 확정 구간으로 보관한다.
+    covered_until: 휴장일 표(MARKET_HOLIDAYS_PATH)가 유효한 마지막 날짜. 이후 날짜는 거래일 여부를 알 수 없으므로 확정으로 취급하지 않고 오류 로그를 남긴다.
+    covered_from: 휴장일 표가 유효한 첫 날짜. 이전 날짜는 휴장일을 알 수 없으므로 마지막 거래일 일봉 확인(expected_last_session)을 하지 않는다.
+    """
+
+    name: str
+    timezone: str
+    open_time: time
+    close_time: time
+    holidays: FrozenSet[date] = frozenset()
+    early_closes: Dict[date, time] = field(default_factory=dict)
+    settle: timedelta = field(default_factory=lambda: timedelta(minutes=settings.MARKET_SETTLE_MINUTES))
+    covered_from: Optional[date] = None
+    covered_until: Optional[date] = None
+
+    @property
+    def tz(self):
+        return pytz.timezone(self.timezone)
+
+    def now(self) -> datetime:
+        return datetime.now(self.tz)
+
+    def _localize(self, value: Optional[datetime]) -> datetime:
+        if value is None:
+            return self.now()
+        if value.tzinfo is None:
+            return self.tz.localize(value)
+        return value.astimezone(self.tz)
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def next_trading_day(self, day: date) -> date:
+        day += timedelta(days=1)
+        while not self.is_trading_day(day):
+            day += timedelta(days=1)
+        return day
+
+    def previous_trading_day(self, day: date) -> date:
+        day -= timedelta(days=1)
+        while not self.is_trading_day(day):
+            day -= timedelta(days=1)
+        return day
+
+    def expected_last_session(self, day: date) -> Optional[date]:
+        """day 까지(포함)의 마지막 거래일 (휴장일 표 시작 이전이면 휴장일을 알 수 없으므로 None)"""
+        if self.covered_from is not None and day < self.covered_from:
+            return None
+        return self.previous_trading_day(day + timedelta(days=1))
+
+    def session(self, day: date) -> Tuple[datetime, datetime]:
+        """해당 거래일의 (개장, 폐장) 시각"""
+        close_time = self.early_closes.get(day, self.close_time)
+        return (
+            self.tz.localize(datetime.combine(day, self.open_time)),
+            self.tz.localize(datetime.combine(day, close_time)),
+        )
+
+    def is_open(self, now: Optional[datetime] = None) -> bool:
+        """장중(마감 후 확정 대기 시간 포함) 여부"""
+        now = self._localize(now)
+        if not self.is_trading_day(now.date()):
+            return False
+        market_open, market_close = self.session(now.date())
+        return market_open <= now < market_close + self.settle
+
+    def next_open(self, now: Optional[datetime] = None) -> datetime:
+        """다음 개장 시각"""
+        now = self._localize(now)
+        day = now.date()
+        if self.is_trading_day(day) and now < self.session(day)[0]:
+            return self.session(day)[0]
+        return self.session(self.next_trading_day(day))[0]
+
+    def last_settled_session(self, now: Optional[datetime] = None) -> date:
+        """마감 후 데이터가 확정된 가장 최근 거래일"""
+        now = self._localize(now)
+        day = now.date()
+        if self.is_trading_day(day) and now >= self.session(day)[1] + self.settle:
+            return day
+        return self.previous_trading_day(day)
+
+    def is_settled(self, day: date, now: Optional[datetime] = None) -> bool:
+        """day 까지의 데이터가 더 이상 바뀌지 않는지 여부 (day 이전의 모든 거래일이 확정됨)"""
+        return self.settled_until(now) >= day
+
+    def settled_until(self, now: Optional[datetime] = None) -> date:
+        """데이터가 확정된 마지막 날짜 (다음 거래일 전날까지, 휴장일 표 범위 이내)"""
+        settled = self.next_trading_day(self.last_settled_session(now)) - timedelta(days=1)
+        if self.covered_until is not None and settled > self.covered_until:
+            if self.name not in _coverage_warned:
+                _coverage_warned.add(self.name)
+                logger.error(
+                    f"{self.name} holiday table ends at {self.covered_until}; "
+                    "later dates are not treated as settled until the holidays are updated"
+                )
+            return self.covered_until
+        return settled
+
+    def cache_expiry(
+        self, end_date: Optional[date], now: Optional[datetime] = None, open_ttl: int = MARKET_OPEN_TTL
+    ) -> CacheExpiry:
+        """end_date 까지의 데이터를 담은 캐시 항목의 만료 정책
+
+        - 확정된 세션만 포함: 영구 캐싱
+        - 장중: 짧은 TTL
+        - 장 마감 후: 다음 개장 시각까지 유효
+        end_date 가 None 이면 최신 구간(52주 등)을 의미하므로 영구 캐싱하지 않는다.
+        """
+        now = self._localize(now)
+        if end_date is not None and self.is_settled(end_date, now):
+            return CacheExpiry(ttl=0, strategy=CacheStrategy.PERMANENT)
+        if self.is_open(now):
+            return CacheExpiry(ttl=open_ttl, strategy=CacheStrategy.TEMPORARY, stale_ttl=open_ttl)
+        ttl = max(int((self.next_open(now) - now).total_seconds()), open_ttl)
+        return CacheExpiry(ttl=ttl, strategy=CacheStrategy.TEMPORARY, stale_ttl=open_ttl)
+
+
+KRX = MarketCalendar(
+    name="KRX",
+    timezone="Asia/Seoul",
+    open_time=time(9, 0),
+    close_time=time(15, 30),
+    **_HOLIDAYS["KRX"],
+)
+
+NYSE = MarketCalendar(
+    name="NYSE",
+    timezone="America/New_York",
+    open_time=time(9, 30),
+    close_time=time(16, 0),
+    **_HOLIDAYS["NYSE"],
+)
+
+MARKET_CALENDARS: Dict[Country, MarketCalendar] = {
+    Country.KR: KRX,
+    Country.US: NYSE,
+}
+
+
+def check_holiday_coverage(warn_days: int, today: Optional[date] = None) -> List[str]:
+    """휴장일 표가 warn_days 이내에 끝나는 캘린더 경고 (시작 시 호출, 경고한 캘린더 이름 반환)"""
+    warned = []
+    for calendar in MARKET_CALENDARS.values():
+        current = today or calendar.now().date()
+        if calendar.covered_until is not None and (calendar.covered_until - current).days < warn_days:
+            logger.warning(
+                f"{calendar.name} holiday table ends at {calendar.covered_until}; "
+                "update MARKET_HOLIDAYS_PATH (or app/modules/common/data/market_holidays.json) before then, "
+                "otherwise permanent/disk caching stops after that date"
+            )
+            warned.append(calendar.name)
+    return warned
+
+
+def get_market_calendar(ctry: Country) -> Optional[MarketCalendar]:
+    """국가별 거래소 캘린더 (미지원 국가는 None)"""
+    return MARKET_CALENDARS.get(ctry)
+
+
+def get_cache_expiry(ctry: Country, end_date: Optional[date], default_ttl: int) -> CacheExpiry:
+    """국가별 캐시 만료 정책 (캘린더 미지원 국가는 고정 TTL)"""
+    calendar = get_market_calendar(ctry)
+    if calendar is None:
+        return CacheExpiry(ttl=default_ttl, strategy=CacheStrategy.TEMPORARY)
+    return calendar.cache_expiry(end_date)
+
+
+def get_data_expiry(ctry: Country, end_date: date, default_ttl: int, last_loaded: Optional[date]) -> CacheExpiry:
+    """end_date 까지 조회한 데이터의 캐시 만료 정책
+
+    last_loaded(조회된 마지막 날짜)가 end_date 이전 마지막 거래일보다 이르면 늦게 적재될 수 있으므로 영구 캐싱하지 않는다.
+    휴장일 표 시작(covered_from) 이전의 end_date 는 마지막 거래일을 알 수 없으므로 데이터가 있으면 영구 캐싱한다.
+    """
+    expiry = get_cache_expiry(ctry, end_date, default_ttl)
+    if expiry.strategy != CacheStrategy.PERMANENT:
+        return expiry
+    last_day = get_market_calendar(ctry).expected_last_session(end_date)
+    if last_loaded is not None and (last_day is None or last_loaded >= last_day):
+        return expiry
+    return CacheExpiry(ttl=default_ttl, strategy=CacheStrategy.TEMPORARY)
+
+
+def get_settled_until(ctry: Country) -> date:
+    """국가별 데이터가 확정된 마지막 날짜 (캘린더 미지원 국가는 전일)"""
+    calendar = get_market_calendar(ctry)
+    if calendar is None:
+        return date.today() - timedelta(days=1)
+    return calendar.settled_until()
+
+
+def get_last_session(ctry: Country) -> Optional[date]:
+    """국가별 마감 후 확정된 가장 최근 거래일 (캘린더 미지원 국가는 None)"""
+    calendar = get_market_calendar(ctry)
+    if calendar is None:
+        return None
+    return calendar.last_settled_session()
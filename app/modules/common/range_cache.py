@@ -0,0 +1,183 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from app.modules.common.cache import CacheStrategy, MemoryCache
+from app.modules.common.frame import FrameSnapshot
+
+DateRange = Tuple[date, date]
+
+# loader 결과: DataFrame 또는 날짜순 DataFrame 조각 목록 (조각은 병합 시 한 번만 복사)
+Loaded = Union[pd.DataFrame, List[pd.DataFrame]]
+
+ONE_DAY = timedelta(days=1)
+
+
+def merge_ranges(ranges: List[DateRange]) -> List[DateRange]:
+    """겹치거나 인접한 날짜 구간 병합 (양 끝 포함)"""
+    merged: List[DateRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + ONE_DAY:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_ranges(start: date, end: date, covered: List[DateRange]) -> List[DateRange]:
+    """[start, end] 중 covered 에 포함되지 않은 구간 목록"""
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start - ONE_DAY))
+        cursor = max(cursor, covered_end + ONE_DAY)
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+@dataclass(frozen=True)
+class RangeEntry:
+    """종목별로 보관된 데이터와 보유 구간
+
+    ranges: 확정된 구간 (만료 없음)
+    tails: 확정되지 않은 구간과 만료 시각 목록 (만료 이후 다시 조회)
+    """
+
+    snapshot: FrameSnapshot
+    ranges: Tuple[DateRange, ...] = ()
+    tails: Tuple[Tuple[DateRange, float], ...] = ()
+
+    def live_tails(self, now: float) -> List[Tuple[DateRange, float]]:
+        return [(tail, expires_at) for tail, expires_at in self.tails if now < expires_at]
+
+    def covered(self, now: float) -> List[DateRange]:
+        return merge_ranges(list(self.ranges) + [tail for tail, _ in self.live_tails(now)])
+
+
+class RangeCache:
+    """날짜 구간 인식 캐시
+
+    키(종목)별로 하나의 정렬된 스냅샷과 보유 구간을 유지한다.
+    요청 구간 중 비어있는 부분만 loader 로 조회하여 기존 데이터에 병합하고, 요청 구간은 스냅샷에서 잘라 반환한다.
+    settled_until 이후(장중 등 아직 바뀔 수 있는 구간)는 tail 로, 조회 시점부터 tail_ttl 동안만 보유한 것으로 취급한다.
+    떨어져 있는 tail 구간이 여러 개이면 구간마다 만료 시각을 따로 관리한다.
+    last_session(마지막 확정 거래일)을 포함해 조회한 구간에 그날 행이 없으면(적재 지연/일부 적재) 그날부터는 tail 로 취급한다.
+    loader 가 행을 반환하지 않은 구간은 확정 구간이어도 tail 로 취급한다.
+    loader 는 조각 목록을 반환할 수 있으며, 기존 데이터와 조각은 병합 시 한 번만 복사되어 스냅샷이 된다.
+    """
+
+    def __init__(self, cache: MemoryCache, date_column: str = "Date"):
+        self._cache = cache
+        self.date_column = date_column
+
+    async def get(
+        self,
+        key: str,
+        start: date,
+        end: date,
+        loader: Callable[[date, date], Awaitable[Loaded]],
+        settled_until: date,
+        tail_ttl: int,
+        tags: Iterable[str] = (),
+        last_session: Optional[date] = None,
+    ) -> pd.DataFrame:
+        """[start, end] 구간 데이터 조회 (비어있는 구간만 loader 호출)"""
+        entry: Optional[RangeEntry] = self._cache.get(key)
+        gaps = subtract_ranges(start, end, entry.covered(time.monotonic()) if entry else [])
+
+        if gaps:
+            # 같은 구간의 동시 조회는 하나로 병합
+            frames = await asyncio.gather(
+                *[self._cache.coalesce((key, gap), lambda gap=gap: loader(*gap)) for gap in gaps]
+            )
+            frames = [self._pieces(loaded) for loaded in frames]
+            # loader 대기 중 다른 요청이 병합했을 수 있으므로 최신 항목 기준으로 병합
+            entry = self._merge(self._cache.get(key), list(zip(gaps, frames)), settled_until, tail_ttl, last_session)
+            self._cache.set(key, entry, 0, CacheStrategy.PERMANENT, tags=tags)
+
+        return entry.snapshot.slice(start, datetime.combine(end, datetime.max.time()))
+
+    @staticmethod
+    def _pieces(loaded: Optional[Loaded]) -> List[pd.DataFrame]:
+        """loader 결과를 조각 목록으로 변환"""
+        pieces = loaded if isinstance(loaded, list) else [loaded]
+        return [df for df in pieces if df is not None]
+
+    def _has_day(self, pieces: List[pd.DataFrame], day: date) -> bool:
+        """조각 중 day 일자 행이 있는지 여부"""
+        for df in pieces:
+            dates = df[self.date_column]
+            if ((dates >= pd.Timestamp(day)) & (dates < pd.Timestamp(day + ONE_DAY))).any():
+                return True
+        return False
+
+    def _merge(
+        self,
+        entry: Optional[RangeEntry],
+        loaded: List[Tuple[DateRange, List[pd.DataFrame]]],
+        settled_until: date,
+        tail_ttl: int,
+        last_session: Optional[date] = None,
+    ) -> RangeEntry:
+        column = self.date_column
+        frames = []
+        if entry is not None and not entry.snapshot.empty:
+            current = entry.snapshot.to_frame()
+            # 새로 조회한 구간의 기존 행은 교체
+            keep = pd.Series(True, index=current.index)
+            for (gap_start, gap_end), _ in loaded:
+                keep &= ~current[column].between(
+                    pd.Timestamp(gap_start), pd.Timestamp(datetime.combine(gap_end, datetime.max.time()))
+                )
+            # 교체할 행이 없으면 view 그대로 사용 (병합 시 한 번만 복사)
+            frames.append(current if keep.all() else current[keep])
+        for _, pieces in loaded:
+            frames.extend(pieces)
+
+        frames = [df for df in frames if not df.empty]
+        if frames:
+            # concat 결과는 새로 만든 배열이므로 스냅샷이 복사 없이 보관
+            merged = pd.concat(frames, ignore_index=True)
+            if not merged[column].is_monotonic_increasing:
+                merged = merged.sort_values(column, kind="stable", ignore_index=True)
+        else:
+            merged = next((df for _, pieces in loaded for df in pieces), pd.DataFrame())
+
+        # 확정 구간과 tail 구간 분리 (기존 tail 은 각자의 만료 시각 유지)
+        now = time.monotonic()
+        ranges = list(entry.ranges) if entry else []
+        tails = entry.live_tails(now) if entry else []
+        for (gap_start, gap_end), pieces in loaded:
+            if all(df.empty for df in pieces):
+                # 행이 없는 구간은 확정하지 않음 (잘못된 종목, 이후 상장/적재되는 종목이 계속 비어있지 않도록)
+                tails.append(((gap_start, gap_end), now + tail_ttl))
+                continue
+            settled_end = min(gap_end, settled_until)
+            if (
+                last_session is not None
+                and gap_start <= last_session <= settled_end
+                and not self._has_day(pieces, last_session)
+            ):
+                settled_end = last_session - ONE_DAY
+            if gap_start <= settled_end:
+                ranges.append((gap_start, settled_end))
+            if gap_end > settled_end:
+                tails.append(((max(gap_start, settled_end + ONE_DAY), gap_end), now + tail_ttl))
+
+        return RangeEntry(
+            snapshot=FrameSnapshot.from_frame(merged, column, copy=False),
+            ranges=tuple(merge_ranges(ranges)),
+            tails=tuple(sorted(tails)),
+        )
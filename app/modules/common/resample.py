@@ -0,0 +1,61 @@
+from datetime import time
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from app.modules.common.enum import Frequency, Interval
+
+# 분봉 집계 간격(분)
+_INTRADAY_MINUTES = {Interval.MINUTE_5: 5, Interval.MINUTE_15: 15, Interval.MINUTE_60: 60}
+# 월/연봉 집계 단위 (datetime64 단위)
+_CALENDAR_UNITS = {Interval.MONTH: "M", Interval.YEAR: "Y"}
+# 1970-01-01(목) 부터 첫 월요일까지의 일수
+_MONDAY_OFFSET = 4
+
+
+def source_frequency(interval: Interval) -> Frequency:
+    """interval 집계에 사용하는 원본 데이터 주기"""
+    return Frequency.MINUTE if interval in _INTRADAY_MINUTES else Frequency.DAILY
+
+
+def bucket_starts(dates: np.ndarray, interval: Interval, session_open: Optional[time] = None) -> np.ndarray:
+    """각 시각이 속한 구간의 시작 시각 (datetime64[ns])
+
+    분봉 구간은 session_open(거래소 현지 개장 시각, 예: NYSE 09:30) 기준으로 나누며, 없으면 정시 기준이다.
+    """
+    if interval in _INTRADAY_MINUTES:
+        minutes = dates.astype("datetime64[m]").astype(np.int64)
+        anchor = session_open.hour * 60 + session_open.minute if session_open is not None else 0
+        starts = (minutes - (minutes - anchor) % _INTRADAY_MINUTES[interval]).astype("datetime64[m]")
+    elif interval == Interval.WEEK:
+        days = dates.astype("datetime64[D]").astype(np.int64)
+        starts = (days - (days - _MONDAY_OFFSET) % 7).astype("datetime64[D]")
+    else:
+        starts = dates.astype(f"datetime64[{_CALENDAR_UNITS[interval]}]")
+    return starts.astype("datetime64[ns]")
+
+
+def resample_ohlcv(df: pd.DataFrame, interval: Interval, session_open: Optional[time] = None) -> pd.DataFrame:
+    """OHLCV 봉을 interval 단위로 집계
+
+    시가는 첫 봉 시가, 고가/저가는 최대/최소, 종가는 마지막 봉 종가, 거래량은 합계이며 나머지 컬럼은 첫 봉 값을 사용한다.
+    Date 는 구간 시작 시각(분봉: 개장 시각(session_open, 현지 시각) 기준, 주봉: 월요일, 월/연봉: 1일)이다.
+    df 는 Date 오름차순이어야 하며, 시가/종가가 없는 봉은 제외한다.
+    """
+    valid = df[df["Open"].notna() & df["Close"].notna()]
+    if valid.empty:
+        return valid
+
+    buckets = bucket_starts(valid["Date"].to_numpy(dtype="datetime64[ns]"), interval, session_open)
+    # 정렬된 데이터이므로 구간이 바뀌는 위치만 찾아 reduceat 으로 한 번에 집계
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+
+    result = valid.iloc[starts].reset_index(drop=True)
+    result["Date"] = buckets[starts]
+    result["High"] = np.fmax.reduceat(valid["High"].to_numpy(dtype=np.float64), starts)
+    result["Low"] = np.fmin.reduceat(valid["Low"].to_numpy(dtype=np.float64), starts)
+    result["Close"] = valid["Close"].to_numpy(dtype=np.float64)[ends]
+    result["Volume"] = np.add.reduceat(np.nan_to_num(valid["Volume"].to_numpy(dtype=np.float64)), starts)
+    return result
@@ -30,5 +30,6 @@ class PaginationBaseResponse(BaseResponse):
     total_count: int
     total_pages: int
     current_page: int
-    offset: int
+    offset: Optional[int] = None
     size: int
+    next_cursor: Optional[str] = None
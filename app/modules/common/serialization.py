@@ -0,0 +1,147 @@
+import io
+import json
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import Response
+
+from app.modules.common.enum import ExportFormat
+
+# 가격(float) 컬럼 직렬화 소수점 자리수 (pandas to_json 최대값)
+DOUBLE_PRECISION = 15
+
+# 바이너리 내보내기 형식별 Content-Type / 파일 확장자
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+EXPORT_EXTENSIONS = {ExportFormat.ARROW: "arrows", ExportFormat.PARQUET: "parquet"}
+
+
+class RawJSONResponse(Response):
+    """이미 직렬화된 JSON bytes 응답
+
+    라우터가 Response 를 직접 반환하면 FastAPI 는 response_model 검증/직렬화를 건너뛰므로,
+    서비스에서 만든 데이터를 pydantic 모델을 거치지 않고 전송한다. OpenAPI 스키마는 response_model 기준으로 유지된다.
+    """
+
+    media_type = "application/json"
+
+
+def dumps(obj: Any) -> bytes:
+    """FastAPI 기본 JSONResponse 와 같은 형식으로 직렬화"""
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def records_json(columns: Dict[str, np.ndarray]) -> bytes:
+    """컬럼 배열들을 JSON 객체 배열(records)로 직렬화
+
+    행마다 Python 객체를 만들지 않고 pandas 의 C 인코더로 한 번에 변환하며, NaN/inf 는 null 로 출력된다.
+    null 을 허용하지 않는 필드는 finite_or 로 미리 대체해야 한다.
+    """
+    return (
+        pd.DataFrame(columns, copy=False)
+        .to_json(orient="records", double_precision=DOUBLE_PRECISION, force_ascii=False)
+        .encode("utf-8")
+    )
+
+
+def columns_json(columns: Dict[str, np.ndarray]) -> bytes:
+    """컬럼 배열들을 {컬럼명: 배열} JSON 으로 직렬화 (행마다 키를 반복하지 않음)"""
+    parts = [
+        dumps(name)
+        + b":"
+        + pd.Series(values, copy=False)
+        .to_json(orient="values", double_precision=DOUBLE_PRECISION, force_ascii=False)
+        .encode("utf-8")
+        for name, values in columns.items()
+    ]
+    return b"{" + b",".join(parts) + b"}"
+
+
+def frame_json(columns: Dict[str, np.ndarray], columnar: bool = False) -> bytes:
+    """columnar 이면 컬럼별 배열, 아니면 객체 배열(records) JSON"""
+    return columns_json(columns) if columnar else records_json(columns)
+
+
+def splice_json(obj: Dict[str, Any], key: str, raw: bytes) -> bytes:
+    """obj 를 직렬화하고 마지막 필드로 key: raw(직렬화된 JSON) 추가"""
+    head = dumps(obj)
+    separator = b"," if len(obj) else b""
+    return head[:-1] + separator + dumps(key) + b":" + raw + b"}"
+
+
+def response_json(status_code: int, message: str, data: bytes) -> bytes:
+    """BaseResponse 형식 ({status_code, message, data}) JSON"""
+    return splice_json({"status_code": status_code, "message": message}, "data", data)
+
+
+def finite_or(values: np.ndarray, fallback) -> np.ndarray:
+    """NaN/inf 값을 fallback(스칼라 또는 같은 길이의 배열)으로 대체"""
+    return np.where(np.isfinite(values), values, fallback)
+
+
+def iso_datetimes(values: np.ndarray) -> np.ndarray:
+    """datetime64 배열을 초 단위 ISO 문자열("YYYY-MM-DDTHH:MM:SS")로 변환"""
+    return np.datetime_as_string(values.astype("datetime64[s]"), unit="s")
+
+
+def iso_dates(values: np.ndarray) -> np.ndarray:
+    """datetime64 배열을 날짜 문자열("YYYY-MM-DD")로 변환"""
+    return np.datetime_as_string(values.astype("datetime64[D]"), unit="D")
+
+
+class _ChunkSink(io.RawIOBase):
+    """pyarrow writer 출력을 모아두었다가 drain 으로 꺼내는 스트림
+
+    tell 은 지금까지 쓴 전체 길이를 반환하므로 Parquet footer 의 오프셋이 유지된다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class TableStreamWriter:
+    """pyarrow.Table 을 Arrow IPC stream 또는 Parquet 으로 이어 쓰며 완성된 바이트 조각을 반환
+
+    전체 결과를 메모리에 모으지 않고 write 마다 StreamingResponse 로 전송할 수 있다.
+    Arrow IPC 는 압축하지 않으므로 클라이언트가 pyarrow 로 복사 없이 읽을 수 있다.
+    """
+
+    def __init__(self, schema: pa.Schema, export_format: ExportFormat):
+        self._sink = _ChunkSink()
+        if export_format == ExportFormat.PARQUET:
+            self._writer = pq.ParquetWriter(self._sink, schema)
+        else:
+            self._writer = pa.ipc.new_stream(self._sink, schema)
+
+    def write(self, table: pa.Table) -> bytes:
+        self._writer.write_table(table)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """스트림 종료 (IPC end-of-stream 표시 / Parquet footer)"""
+        self._writer.close()
+        return self._sink.drain()
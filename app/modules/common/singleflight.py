@@ -0,0 +1,47 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """동일 키에 대한 동시 로드 요청 병합
+
+    첫 번째 호출만 loader 를 실행하고, 실행 중에 들어온 호출은 같은 결과(또는 예외)를 함께 기다린다.
+    결과는 저장하지 않으므로 완료 이후의 호출은 다시 loader 를 실행한다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.loads = 0  # 실제 loader 실행 횟수
+        self.coalesced = 0  # 병합되어 생략된 loader 실행 횟수
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def is_inflight(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        # 호출자가 취소되어도 다른 대기자를 위해 로드는 계속 진행
+        future = asyncio.ensure_future(loader())
+        self._inflight[key] = future
+        self.loads += 1
+        future.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고가 남지 않도록 처리
+        if not future.cancelled():
+            future.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"loads": self.loads, "coalesced": self.coalesced, "inflight": self.inflight}
@@ -12,10 +12,21 @@ router = APIRouter()
 async def get_disclosure(
     ctry: Annotated[FinancialCountry, Query(description="국가 코드 (US)")],
     ticker: Annotated[Optional[str], Query(description="종목 코드, 예시: AAPL")] = None,
-    year: Annotated[Optional[str], Query(description="연도, 예시: 2024, 기본값: 올해")] = None,
-    page: Annotated[Optional[int], Query(description="페이지 번호, 기본값: 1")] = 1,
+    year: Annotated[Optional[str], Query(description="연도, 예시: 2024, 기본값: 올해", pattern=r"^\d{4}$")] = None,
+    page: Annotated[
+        Optional[int],
+        Query(
+            description="페이지 번호, 기본값: 1 (순차 이동은 직전 페이지의 커서로 조회, 처음 조회하는 페이지로 바로 이동하면 OFFSET 조회)"
+        ),
+    ] = 1,
     size: Annotated[Optional[int], Query(description="페이지 크기, 기본값: 6")] = 6,
+    cursor: Annotated[
+        Optional[str],
+        Query(
+            description="이전 응답의 next_cursor (지정 시 offset 대신 keyset 으로 다음 페이지 조회, 응답의 offset 은 null)"
+        ),
+    ] = None,
     service: DisclosureService = Depends(get_disclosure_service),
 ):
-    result = await service.get_disclosure(ctry=ctry, ticker=ticker, year=year, page=page, size=size)
+    result = await service.get_disclosure(ctry=ctry, ticker=ticker, year=year, page=page, size=size, cursor=cursor)
     return PaginationBaseResponse(status_code=200, message="Successfully retrieved disclosure data", **result)
@@ -1,8 +1,13 @@
+import asyncio
+import base64
 from datetime import datetime
-from app.core.exception.custom import DataNotFoundException
+from typing import Optional, Tuple
+from app.core.exception.custom import DataNotFoundException, InvalidCursorException
+from app.modules.common.cache import MemoryCache, cache_tag
 from app.modules.common.enum import FinancialCountry
 from app.database.crud import database
 from app.core.logging.config import get_logger
+from app.core.registry import service_registry
 from .mapping import document_type_mapping
 
 
@@ -12,8 +17,26 @@ logger = get_logger(__name__)
 class DisclosureService:
     def __init__(self):
         self.db = database
-
-    async def get_disclosure(self, ctry: FinancialCountry, ticker: str, year: str = None, page: int = 1, size: int = 6):
+        self._cache = MemoryCache(namespace="disclosure")
+        # 공시 건수/페이지 커서 캐시 (적재 시 종목 태그로 무효화)
+        self.cache_ttl = 60 * 60
+        self.columns = ["id", "form_type", "filing_date", "sec_url", "ai_processed", "company_name", "summary"]
+
+    async def get_disclosure(
+        self,
+        ctry: FinancialCountry,
+        ticker: str,
+        year: str = None,
+        page: int = 1,
+        size: int = 6,
+        cursor: Optional[str] = None,
+    ):
+        """공시 목록 조회 ((filing_date, id) 내림차순)
+
+        cursor 를 지정하면 해당 위치부터 keyset 으로 조회하며, 이때 page 와 무관하므로 offset 은 None 으로 응답한다.
+        cursor 없이 page 로 조회하면 직전 페이지 조회 시 캐싱한 커서를 사용하므로 1, 2, 3... 순차 이동은 keyset 비용으로 조회되지만,
+        캐싱된 커서가 없는 페이지로 바로 이동하면 OFFSET (page - 1) * size 로 조회한다.
+        """
         if not year:
             year = datetime.now().strftime("%Y")
 
@@ -26,19 +49,51 @@ class DisclosureService:
         if ticker:
             conditions["ticker"] = ticker
         if year:
-            conditions["filing_date__like"] = f"{year}%"
+            conditions["filing_date__year"] = int(year)
 
-        columns = ["form_type", "ticker", "filing_date", "sec_url", "ai_processed", "company_name"]
         offset = (page - 1) * size
-
-        results = self.db._select(
-            table=table_name, columns=columns, order="filing_date", ascending=False, limit=size, **conditions
+        tags = [cache_tag(table_name, ticker)]
+
+        # 커서가 없으면 직전 페이지 조회 시 저장한 커서 사용 (순차 페이지 이동도 keyset 으로 조회)
+        # 페이지 번호로 이동한 경우에만 page -> 커서 캐시를 읽고 쓴다 (클라이언트 커서는 페이지 번호와 무관)
+        by_page = cursor is None
+        if by_page and page > 1:
+            cursor = self._cache.get(self._cursor_key(table_name, conditions, size, page))
+
+        query = dict(conditions)
+        if cursor:
+            # (filing_date, id) 내림차순 keyset: filing_date 인덱스 범위 조건 + 동일 일시의 id 비교
+            filing_date, last_id = self._decode_cursor(cursor)
+            query["filing_date__lte"] = filing_date
+            query["or__"] = [{"filing_date__lt": filing_date}, {"id__lt": last_id}]
+
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        results, total_count = await asyncio.gather(
+            self.db._select_async(
+                table=table_name,
+                columns=self.columns,
+                order=["filing_date", "id"],
+                ascending=False,
+                limit=size + 1,
+                offset=0 if cursor else offset,
+                **query,
+            ),
+            self._count(table_name, conditions, tags),
         )
 
         if not results:
             raise DataNotFoundException(ticker=ticker, data_type="공시")
 
-        total_count = len(results)
+        has_next = len(results) > size
+        results = results[:size]
+
+        next_cursor = None
+        if has_next:
+            next_cursor = self._encode_cursor(results[-1].filing_date, results[-1].id)
+            if by_page:
+                self._cache.set(
+                    self._cursor_key(table_name, conditions, size, page + 1), next_cursor, self.cache_ttl, tags=tags
+                )
 
         items = []
         for row in results:
@@ -61,10 +116,46 @@ class DisclosureService:
             "total_count": total_count,
             "total_pages": (total_count + size - 1) // size,
             "current_page": page,
-            "offset": offset,
+            "offset": offset if by_page else None,
             "size": size,
+            "next_cursor": next_cursor,
         }
 
+    async def _count(self, table_name: str, conditions: dict, tags: list) -> int:
+        """종목/연도별 전체 공시 건수 (캐시 우선 조회)"""
+        key = f"count:{table_name}:{self._conditions_key(conditions)}"
+
+        async def load() -> int:
+            result = await self.db._select_async(table=table_name, columns=["*__count"], **conditions)
+            return result[0][0]
+
+        return await self._cache.get_or_load(key, load, self.cache_ttl, tags=tags)
+
+    @staticmethod
+    def _conditions_key(conditions: dict) -> str:
+        return ",".join(f"{k}={v!r}" for k, v in sorted(conditions.items()))
+
+    def _cursor_key(self, table_name: str, conditions: dict, size: int, page: int) -> str:
+        """page 번째 페이지 시작 커서의 캐시 키"""
+        return f"cursor:{table_name}:{self._conditions_key(conditions)}:{size}:{page}"
+
+    @staticmethod
+    def _encode_cursor(filing_date: datetime, disclosure_id: int) -> str:
+        raw = f"{filing_date.isoformat()}|{disclosure_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            filing_date, disclosure_id = raw.split("|")
+            return datetime.fromisoformat(filing_date), int(disclosure_id)
+        except ValueError:
+            raise InvalidCursorException(cursor)
+
+
+service_registry.register(DisclosureService)
+
 
 def get_disclosure_service() -> DisclosureService:
-    return DisclosureService()
+    return service_registry.get(DisclosureService)
@@ -1,5 +1,6 @@
 from app.modules.common.enum import FinancialCountry
 from app.modules.dividend.schemas import DividendItem, DividendDetail, DividendYearResponse
+from app.core.registry import service_registry
 from app.database.crud import database
 
 
@@ -138,5 +139,8 @@ class DividendService:
         )
 
 
+service_registry.register(DividendService)
+
+
 def get_dividend_service():
-    return DividendService()
+    return service_registry.get(DividendService)
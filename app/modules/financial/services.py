@@ -1,13 +1,16 @@
+import asyncio
 import pandas as pd
 from app.core.logging.config import get_logger
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from typing import Optional, Dict, List, Tuple
-from fastapi import HTTPException, Depends
+from fastapi import HTTPException
 import math
 import random
 
+from app.core.registry import service_registry
 from app.database.crud import database
-from app.modules.common.enum import FinancialCountry
+from app.modules.common.cache import MemoryCache, cache_tag
+from app.modules.common.enum import Country, FinancialCountry
 from app.modules.common.services import CommonService, get_common_service
 from app.modules.financial.schemas import (
     CashFlowResponse,
@@ -33,6 +36,10 @@ class FinancialService:
     def __init__(self, common_service: CommonService):
         self.db = database
         self.common_service = common_service
+        self._cache = MemoryCache(namespace="financial")
+        # 재무제표는 분기 단위로 갱신되므로 soft TTL 이후에도 stale 데이터를 제공하며 백그라운드 갱신
+        self.cache_ttl = 60 * 60 * 6
+        self.cache_stale_ttl = 60 * 60 * 24 * 7
         self._setup_tables()
 
     def _setup_tables(self):
@@ -47,6 +54,35 @@ class FinancialService:
         self.cashflow_tables = create_table_mapping("cashflow")
         self.finpos_tables = create_table_mapping("finpos")
 
+    async def _select(self, table: str, **kwargs):
+        """
+        DB 조회 - 캐시 우선 조회, 동일한 조건의 동시 조회는 하나의 쿼리로 병합
+        """
+        key = f"{table}:" + ",".join(f"{k}={v!r}" for k, v in sorted(kwargs.items()))
+        return await self._cache.get_or_load(
+            key,
+            lambda: self.db._select_async(table=table, **kwargs),
+            self.cache_ttl,
+            stale_ttl=self.cache_stale_ttl,
+            tags=[cache_tag(table, kwargs.get("Code"))],
+        )
+
+    async def _select_frame(self, table: str, **kwargs) -> pd.DataFrame:
+        """DB 조회 결과를 컬럼 단위(Arrow)로 받아 DataFrame 으로 반환 - 캐시 우선 조회"""
+        key = f"{table}:frame:" + ",".join(f"{k}={v!r}" for k, v in sorted(kwargs.items()))
+
+        async def load() -> pd.DataFrame:
+            result = await self.db._select_arrow_async(table=table, **kwargs)
+            return result.to_pandas()
+
+        return await self._cache.get_or_load(
+            key,
+            load,
+            self.cache_ttl,
+            stale_ttl=self.cache_stale_ttl,
+            tags=[cache_tag(table, kwargs.get("Code"))],
+        )
+
     def _get_date_conditions(self, start_date: Optional[str], end_date: Optional[str]) -> Dict:
         """
         날짜 조건 생성
@@ -127,16 +163,43 @@ class FinancialService:
             conditions = {"Code": ticker, **self._get_date_conditions(start_date, end_date)}
 
             logger.debug(f"Querying income performance for {ticker} with conditions: {conditions}")
-            result = self.db._select(table=table_name, order="period_q", ascending=False, **conditions)
+            # 최근 10분기는 행 그대로, 연간 합계는 DB 에서 GROUP BY 로 집계하여 10년치만 조회
+            quarterly, yearly = await asyncio.gather(
+                self._select_frame(
+                    table=table_name,
+                    columns=["Code", "Name", "period_q", "rev", "operating_income", "net_income"],
+                    order="period_q",
+                    ascending=False,
+                    limit=10,
+                    **conditions,
+                ),
+                self._select_frame(
+                    table=table_name,
+                    columns=[
+                        "Code",
+                        "Name",
+                        "period_q__year",
+                        "rev__sum",
+                        "operating_income__sum",
+                        "net_income__sum",
+                        "period_q__count",
+                    ],
+                    group_by=["Code", "Name", "period_q__year"],
+                    order="period_q__year",
+                    ascending=False,
+                    limit=10,
+                    **conditions,
+                ),
+            )
 
-            if not result:
+            if quarterly.empty:
                 logger.warning(f"No income performance data found for ticker: {ticker}")
                 raise DataNotFoundException(ticker=ticker, data_type="실적")
 
-            quarterly_statements, yearly_statements = self._process_income_performance_statement_result(result)
+            quarterly_statements, yearly_statements = self._process_income_performance_statement_result(quarterly, yearly)
 
             # DB 결과에서 직접 이름 추출
-            name = result[0][1] if result else ""
+            name = quarterly["Name"].iloc[0]
 
             performance_response = IncomePerformanceResponse(
                 code=ticker, name=name, quarterly=quarterly_statements, yearly=yearly_statements
@@ -305,7 +368,7 @@ class FinancialService:
             conditions = {"Code": ticker, **self._get_date_conditions(start_date, end_date)}
 
             logger.debug(f"Querying income data for {ticker} with conditions: {conditions}")
-            result = self.db._select(table=table_name, order="period_q", ascending=False, **conditions)
+            result = await self._select(table=table_name, order="period_q", ascending=False, **conditions)
 
             if not result:
                 logger.warning(f"No income data found for ticker: {ticker}")
@@ -352,7 +415,7 @@ class FinancialService:
             conditions = {"Code": ticker, **self._get_date_conditions(start_date, end_date)}
 
             logger.debug(f"Querying cashflow data for {ticker} with conditions: {conditions}")
-            result = self.db._select(table=table_name, order="period_q", ascending=False, **conditions)
+            result = await self._select(table=table_name, order="period_q", ascending=False, **conditions)
 
             if not result:
                 logger.warning(f"No cashflow data found for ticker: {ticker}")
@@ -397,7 +460,7 @@ class FinancialService:
             conditions = {"Code": ticker, **self._get_date_conditions(start_date, end_date)}
 
             logger.debug(f"Querying finpos data for {ticker} with conditions: {conditions}")
-            result = self.db._select(table=table_name, order="period_q", ascending=False, **conditions)
+            result = await self._select(table=table_name, order="period_q", ascending=False, **conditions)
 
             if not result:
                 logger.warning(f"No finpos data found for ticker: {ticker}")
@@ -431,7 +494,7 @@ class FinancialService:
             if not table_name:
                 raise HTTPException(status_code=400, detail="Invalid country code")
 
-            result = self.db._select(
+            result = await self._select(
                 table=table_name, columns=["period_q"], order="period_q", ascending=False, limit=1, Code=ticker
             )
 
@@ -462,7 +525,7 @@ class FinancialService:
             raise InvalidCountryException()
 
         conditions = {"Code": ticker}
-        result = self.db._select(table=table_name, order="period_q", ascending=False, limit=4, **conditions)
+        result = await self._select(table=table_name, order="period_q", ascending=False, limit=4, **conditions)
 
         if not result:
             logger.warning(f"재무비율 데이터를 찾을 수 없습니다: {ticker}")
@@ -509,7 +572,7 @@ class FinancialService:
             raise InvalidCountryException()
 
         conditions = {"Code": ticker}
-        result = self.db._select(table=table_name, order="period_q", ascending=False, limit=4, **conditions)
+        result = await self._select(table=table_name, order="period_q", ascending=False, limit=4, **conditions)
 
         if not result:
             logger.warning(f"유동비율 데이터를 찾을 수 없습니다: {ticker}")
@@ -559,7 +622,7 @@ class FinancialService:
             raise InvalidCountryException()
 
         conditions = {"Code": ticker}
-        result = self.db._select(table=table_name, order="period_q", ascending=False, limit=4, **conditions)
+        result = await self._select(table=table_name, order="period_q", ascending=False, limit=4, **conditions)
 
         if not result:
             logger.warning(f"이자보상배율 데이터를 찾을 수 없습니다: {ticker}")
@@ -680,43 +743,35 @@ class FinancialService:
     ########################################## 결과 처리 메서드 #########################################
     # 실적
     def _process_income_performance_statement_result(
-        self, result, exclude_columns=["StmtDt"]
+        self, quarterly: pd.DataFrame, yearly: pd.DataFrame
     ) -> Tuple[List[QuarterlyIncome], List[QuarterlyIncome]]:
         """
-        실적 결과 처리 - 분기별 및 연도별 데이터를 분리하여 처리
+        실적 결과 처리 - 분기별 데이터와 DB 에서 집계한 연도별 합계를 처리
         최근 10개의 분기/연간 데이터만 반환
         """
-        if not result:
+        if quarterly.empty:
             return [], []
 
-        # SQLAlchemy 결과를 DataFrame으로 변환
-        df = pd.DataFrame([{col: val for col, val in zip(row._fields, row)} for row in result])
+        # 캐시된 DataFrame 을 수정하지 않도록 필요한 컬럼만 복사
+        df = quarterly[["Code", "Name", "period_q", "rev", "operating_income", "net_income"]].copy()
 
         # TODO: eps Mock 데이터 생성 - 시계열 패턴 반영
-        base_eps = 1000  # 기준 EPS 값
-        num_rows = len(df)
-
-        # 시계열 패턴을 만들기 위한 계산
-        eps_values = []
-        for i in range(num_rows):
-            # 기본 증가 트렌드
-            trend = base_eps * (1 + (i * 0.05))
-
-            # 계절성 추가 (4분기 패턴)
-            seasonal_factor = 1 + (0.2 * (i % 4) / 4)
-
-            # 약간의 랜덤성 추가 (-5% ~ +5%)
-            random_factor = 1 + (random.uniform(-0.05, 0.05))
-
-            eps = round(trend * seasonal_factor * random_factor, 2)
-            eps_values.append(eps)
-
-        # 시간 순서대로 정렬된 데이터에 맞춰 eps 값 할당
-        df["eps"] = eps_values[::-1]  # 최신 데이터가 앞쪽에 오도록 역순 정렬
-
-        # 필요한 컬럼만 선택
-        required_columns = ["Code", "Name", "period_q", "rev", "operating_income", "net_income", "eps"]
-        df = df[required_columns]
+        df["eps"] = self._mock_eps_values(len(df))
+
+        # 연도별 합계 (period_q__year: 연도, *__sum: 합계, period_q__count: 해당 연도 분기 수)
+        yearly_sum = yearly.rename(
+            columns={
+                "period_q__year": "period_q",
+                "rev__sum": "rev",
+                "operating_income__sum": "operating_income",
+                "net_income__sum": "net_income",
+            }
+        )
+        # 분기 eps 합계와 같은 규모가 되도록 분기 수를 곱함
+        yearly_sum["eps"] = [
+            round(eps * count, 2)
+            for eps, count in zip(self._mock_eps_values(len(yearly_sum)), yearly_sum["period_q__count"])
+        ]
 
         def create_income_metric(value: float) -> IncomeMetric:
             """기업/업종 평균 값을 포함한 IncomeMetric 생성"""
@@ -734,14 +789,6 @@ class FinancialService:
                 eps=create_income_metric(row["eps"]),
             )
 
-        # 연도별 데이터 처리
-        df["year"] = df["period_q"].astype(str).str[:4]
-        agg_columns = ["rev", "operating_income", "net_income", "eps"]
-
-        yearly_sum = df.groupby(["Code", "Name", "year"]).agg({col: "sum" for col in agg_columns}).reset_index()
-        yearly_sum["period_q"] = yearly_sum["year"]
-        yearly_sum = yearly_sum.drop("year", axis=1)
-
         # 분기별/연도별 데이터 생성
         quarterly_statements = [create_quarterly_income(row) for _, row in df.iterrows()]
         yearly_statements = [create_quarterly_income(row) for _, row in yearly_sum.iterrows()]
@@ -753,6 +800,29 @@ class FinancialService:
         # 최근 10개의 데이터만 반환
         return quarterly_statements[:10], yearly_statements[:10]
 
+    @staticmethod
+    def _mock_eps_values(num_rows: int) -> List[float]:
+        """eps Mock 값 생성 (최신 데이터가 앞쪽에 오도록 정렬)"""
+        base_eps = 1000  # 기준 EPS 값
+
+        # 시계열 패턴을 만들기 위한 계산
+        eps_values = []
+        for i in range(num_rows):
+            # 기본 증가 트렌드
+            trend = base_eps * (1 + (i * 0.05))
+
+            # 계절성 추가 (4분기 패턴)
+            seasonal_factor = 1 + (0.2 * (i % 4) / 4)
+
+            # 약간의 랜덤성 추가 (-5% ~ +5%)
+            random_factor = 1 + (random.uniform(-0.05, 0.05))
+
+            eps = round(trend * seasonal_factor * random_factor, 2)
+            eps_values.append(eps)
+
+        # 시간 순서대로 정렬된 데이터에 맞춰 eps 값 할당
+        return eps_values[::-1]
+
     # 손익계산서
     def _process_income_statement_result(
         self, result, exclude_columns=["Code", "Name", "StmtDt"]
@@ -871,6 +941,21 @@ class FinancialService:
 
         return FinPosDetail(**values)
 
+    async def warmup(self, ctry: Country, ticker: str) -> None:
+        """재무제표(실적/손익/현금흐름/재무상태) 캐시 적재"""
+        financial_ctry = {Country.KR: FinancialCountry.KOR, Country.US: FinancialCountry.USA}.get(ctry)
+        if financial_ctry is None:
+            return
+        await asyncio.gather(
+            self.get_income_performance_data(ctry=financial_ctry, ticker=ticker),
+            self.get_income_analysis(ctry=financial_ctry, ticker=ticker),
+            self.get_cashflow_analysis(ctry=financial_ctry, ticker=ticker),
+            self.get_finpos_analysis(ctry=financial_ctry, ticker=ticker),
+        )
+
+
+service_registry.register(FinancialService, lambda: FinancialService(common_service=get_common_service()))
+
 
-def get_financial_service(common_service: CommonService = Depends(get_common_service)) -> FinancialService:
-    return FinancialService(common_service=common_service)
+def get_financial_service() -> FinancialService:
+    return service_registry.get(FinancialService)
@@ -1,3 +1,4 @@
+import asyncio
 from functools import lru_cache
 from typing import Dict, Optional, List
 import pytz
@@ -7,6 +8,8 @@ import numpy as np
 from app.core.exception.custom import DataNotFoundException
 from app.modules.news.schemas import NewsItem
 from app.modules.common.enum import Country
+from app.modules.common.singleflight import SingleFlight
+from app.core.registry import service_registry
 from quantus_aws.common.configs import s3_client
 
 KST_TIMEZONE = pytz.timezone("Asia/Seoul")
@@ -15,16 +18,20 @@ KST_TIMEZONE = pytz.timezone("Asia/Seoul")
 class NewsService:
     def __init__(self):
         self._bucket_name = "quantus-news"
+        self._flight = SingleFlight()
 
     async def _fetch_s3_data(self, date_str: str, country_path: str) -> Optional[bytes]:
-        """S3에서 데이터를 가져오는 내부 메서드"""
+        """S3에서 데이터를 가져오는 내부 메서드 (동일 파일 동시 요청은 병합)"""
         try:
             file_path = f"{country_path}/{date_str}.parquet"
-            response = s3_client.get_object(Bucket=self._bucket_name, Key=file_path)
-            return response["Body"].read()
+            return await self._flight.do(file_path, lambda: asyncio.to_thread(self._read_s3_object, file_path))
         except Exception:
             return None
 
+    def _read_s3_object(self, file_path: str) -> bytes:
+        response = s3_client.get_object(Bucket=self._bucket_name, Key=file_path)
+        return response["Body"].read()
+
     @staticmethod
     def _process_dataframe(df: pd.DataFrame, ticker: Optional[str] = None) -> pd.DataFrame:
         """DataFrame 전처리 및 필터링"""
@@ -113,5 +120,8 @@ class NewsService:
         }
 
 
+service_registry.register(NewsService)
+
+
 def get_news_service() -> NewsService:
-    return NewsService()
+    return service_registry.get(NewsService)
@@ -1,21 +1,29 @@
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from app.modules.common.schemas import BaseResponse
+from app.modules.common.serialization import EXPORT_EXTENSIONS, EXPORT_MEDIA_TYPES
 from app.modules.price.services import PriceService, get_price_service
-from app.modules.price.schemas import ResponsePriceDataItem
+from app.modules.price.schemas import ResponsePriceDataColumns, ResponsePriceDataItem
 from datetime import date
-from typing import Annotated, Optional
-from app.modules.common.enum import Country, Frequency
+from typing import Annotated, List, Optional, Union
+from app.modules.common.enum import Country, ExportFormat, Frequency, Interval, ResponseFormat
 
 router = APIRouter()
 
 
-@router.get("", response_model=BaseResponse[ResponsePriceDataItem])
+@router.get("", response_model=BaseResponse[Union[ResponsePriceDataItem, ResponsePriceDataColumns]])
 async def get_price_data(
     ctry: Annotated[Country, Query(description="Country code (kr/us)")],
     ticker: Annotated[str, Query(description="Stock ticker symbol")],
     frequency: Annotated[Frequency, Query(description="Frequency (daily/minute)")],
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
+    response_format: ResponseFormat = Query(
+        ResponseFormat.RECORDS, alias="format", description="price_data 형식 (records: 객체 배열, columnar: 필드별 배열)"
+    ),
+    interval: Optional[Interval] = Query(
+        None, description="봉 간격 (minute: 5m/15m/60m, daily: 1w/1M/1Y). 지정하지 않으면 원본 봉"
+    ),
     service: PriceService = Depends(get_price_service),
 ):
     """
@@ -26,7 +34,51 @@ async def get_price_data(
         return BaseResponse(status_code=400, message=f"{ctry.value}의 분 단위 데이터는 없습니다.", data=None)
 
     return await service.read_price_data(
-        ctry=ctry, ticker=ticker, start_date=start_date, end_date=end_date, frequency=frequency
+        ctry=ctry,
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+        frequency=frequency,
+        response_format=response_format,
+        interval=interval,
+    )
+
+
+@router.get(
+    "/export",
+    responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}},
+)
+async def export_price_data(
+    ctry: Annotated[Country, Query(description="Country code (kr/us)")],
+    ticker: Annotated[List[str], Query(min_length=1, max_length=50, description="Stock ticker symbol (repeatable)")],
+    frequency: Annotated[Frequency, Query(description="Frequency (daily/minute)")],
+    start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
+    export_format: ExportFormat = Query(ExportFormat.ARROW, alias="format", description="arrow (IPC stream) / parquet"),
+    service: PriceService = Depends(get_price_service),
+):
+    """
+    Download price history as Arrow IPC stream or Parquet (pyarrow.ipc.open_stream / pyarrow.parquet.read_table).
+    """
+
+    if ctry == Country.KR and frequency == Frequency.MINUTE:
+        return BaseResponse(status_code=400, message=f"{ctry.value}의 분 단위 데이터는 없습니다.", data=None)
+
+    tickers = list(dict.fromkeys(ticker))
+    chunks = await service.export_price_history(
+        ctry=ctry,
+        tickers=tickers,
+        frequency=frequency,
+        start_date=start_date,
+        end_date=end_date,
+        export_format=export_format,
+    )
+    name = tickers[0] if len(tickers) == 1 else f"{len(tickers)}_tickers"
+    filename = f"{ctry.value}_{frequency.value}_{name}.{EXPORT_EXTENSIONS[export_format]}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -1,10 +1,11 @@
 from datetime import date
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Union
 from fastapi import APIRouter, Depends, Query
 
-from app.modules.common.enum import Country
+from app.modules.common.enum import Country, Interval, ResponseFormat
 from app.modules.common.schemas import BaseResponse
-from app.modules.price.schemas import PriceDailyItem, PriceSummaryItem
+from app.modules.common.serialization import RawJSONResponse, response_json
+from app.modules.price.schemas import PriceDailyColumns, PriceDailyItem, PriceSummaryItem
 from app.modules.price.services_v2 import get_price_service, PriceService
 
 
@@ -23,16 +24,28 @@ router = APIRouter()
 #     return BaseResponse(status_code=200, message="Success", data=data)
 
 
-@router.get("/daily", response_model=BaseResponse[List[PriceDailyItem]])
+@router.get("/daily", response_model=BaseResponse[Union[List[PriceDailyItem], PriceDailyColumns]])
 async def get_price_data_daily(
     ctry: Annotated[Country, Query(description="국가 코드 (kr/us)")],
     ticker: Annotated[str, Query(description="종목 티커")],
     start_date: Annotated[Optional[date], Query(description="시작 날짜")] = None,
     end_date: Annotated[Optional[date], Query(description="종료 날짜")] = None,
+    response_format: Annotated[
+        ResponseFormat, Query(alias="format", description="응답 형식 (records: 객체 배열, columnar: 필드별 배열)")
+    ] = ResponseFormat.RECORDS,
+    interval: Annotated[Optional[Interval], Query(description="봉 간격 (1w/1M/1Y). 지정하지 않으면 일봉")] = None,
     service: PriceService = Depends(get_price_service),
 ):
-    data = await service.get_price_data_daily(ctry=ctry, ticker=ticker, start_date=start_date, end_date=end_date)
-    return BaseResponse(status_code=200, message="Success", data=data)
+    data = await service.get_price_data_daily(
+        ctry=ctry,
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+        response_format=response_format,
+        interval=interval,
+    )
+    # 서비스에서 직렬화한 JSON 을 그대로 응답 (스키마는 response_model 로 문서화)
+    return RawJSONResponse(response_json(200, "Success", data))
 
 
 @router.get("/summary", response_model=BaseResponse[PriceSummaryItem])
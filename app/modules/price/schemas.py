@@ -34,6 +34,29 @@ class ResponsePriceDataItem(BaseModel):
     price_data: List[PriceDataItem]
 
 
+class PriceDataColumns(BaseModel):
+    """format=columnar 응답의 price_data (필드별 배열, 같은 인덱스가 같은 봉)"""
+
+    date: List[datetime]
+    open: List[float]
+    high: List[float]
+    low: List[float]
+    close: List[float]
+    volume: List[int]
+    daily_price_change_rate: List[float]
+
+
+class ResponsePriceDataColumns(BaseModel):
+    name: str
+    ticker: str
+    market: str
+    market_cap: Optional[float] = None
+    week52_highest: float
+    week52_lowest: float
+    last_day_close: float = 0.0
+    price_data: PriceDataColumns
+
+
 class StockKrFactorItem(BaseModel):
     ticker: str
     name: str
@@ -72,6 +95,18 @@ class PriceDailyItem(BaseModel):
     price_change_rate: float
 
 
+class PriceDailyColumns(BaseModel):
+    """format=columnar 응답의 일봉 데이터 (필드별 배열)"""
+
+    date: List[date]
+    open: List[float]
+    high: List[float]
+    low: List[float]
+    close: List[float]
+    volume: List[int]
+    price_change_rate: List[float]
+
+
 class PriceMinuteItem(BaseModel):
     date: datetime
     open: float
@@ -1,22 +1,47 @@
 import asyncio
-from datetime import date, datetime, timedelta
+from contextlib import aclosing
+from datetime import date, timedelta
 from functools import lru_cache
-from typing import List, Optional, Tuple, Dict
+from typing import AsyncIterator, List, Optional, Tuple, Dict, Union
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from dataclasses import dataclass, field
-from app.modules.common.cache import MemoryCache
-from app.modules.common.enum import Country, Frequency
+from app.modules.common.cache import MemoryCache, cache_tag
+from app.modules.common.enum import Country, ExportFormat, Frequency, Interval, ResponseFormat
+from app.modules.common.market_calendar import (
+    get_cache_expiry,
+    get_data_expiry,
+    get_last_session,
+    get_market_calendar,
+    get_settled_until,
+)
+from app.modules.common.range_cache import RangeCache
+from app.modules.common.resample import resample_ohlcv, source_frequency
 from app.modules.common.schemas import BaseResponse
-from app.modules.price.schemas import PriceDataItem, ResponsePriceDataItem
+from app.modules.common.serialization import (
+    RawJSONResponse,
+    TableStreamWriter,
+    finite_or,
+    frame_json,
+    iso_datetimes,
+    response_json,
+    splice_json,
+)
+from app.modules.price.schemas import ResponsePriceDataItem
 from app.database.crud import database
 from app.core.logging.config import get_logger
-from app.core.exception.custom import DataNotFoundException
+from app.core.exception.custom import DataNotFoundException, InvalidDateRangeException, InvalidIntervalException
+from app.core.registry import service_registry
 
 
 logger = get_logger(__name__)
 
 
+class ChunkFetchError(Exception):
+    """청크 조회 실패"""
+
+
 @dataclass
 class ChunkResult:
     """청크 결과를 담는 클래스"""
@@ -43,6 +68,16 @@ class PriceServiceConfig:
     DAILY_CHUNK_SIZE_DAYS: int = 30
     MAX_CONCURRENT_REQUESTS: int = 10
     MAX_MINUTE_DAYS: int = 14
+    # 내보내기 기본 조회 기간(일) / 분봉 최대 기간(일)
+    EXPORT_DEFAULT_DAYS: Dict[Frequency, int] = field(
+        default_factory=lambda: {
+            Frequency.DAILY: 365 * 10,
+            Frequency.MINUTE: 7,
+        }
+    )
+    EXPORT_MAX_MINUTE_DAYS: int = 31
+    # 서버 측 커서로 한 번에 가져올 행 수
+    STREAM_BATCH_SIZE: int = 5000
     # 캐시 TTL 설정
     CACHE_TTL: Dict[str, int] = field(
         default_factory=lambda: {
@@ -58,6 +93,20 @@ class PriceServiceConfig:
         default_factory=lambda: ["Date", "Ticker", "Open", "High", "Low", "Close", "Volume", "Market"]
     )
     NUMERIC_COLUMNS: List[str] = field(default_factory=lambda: ["Open", "High", "Low", "Close", "Volume"])
+    # 내보내기(Arrow/Parquet) 컬럼 타입 (배치마다 추론된 타입과 관계없이 스키마 고정)
+    ARROW_TYPES: Dict[str, pa.DataType] = field(
+        default_factory=lambda: {
+            "Date": pa.timestamp("ns"),
+            "Ticker": pa.string(),
+            "Open": pa.float64(),
+            "High": pa.float64(),
+            "Low": pa.float64(),
+            "Close": pa.float64(),
+            "Volume": pa.int64(),
+            "Market": pa.string(),
+            "Name": pa.string(),
+        }
+    )
     COUNTRY_SPECIFIC_COLUMNS: Dict[Country, List[str]] = field(
         default_factory=lambda: {
             Country.KR: ["Name"],
@@ -109,56 +158,75 @@ class DataProcessor:
         week52_data: Tuple[float, float],
         end_date: date,
         usa_name: Optional[str] = None,
-    ) -> ResponsePriceDataItem:
-        """DataFrame을 PriceDataItem으로 변환"""
+        columnar: bool = False,
+        bars: Optional[pd.DataFrame] = None,
+    ) -> Optional[bytes]:
+        """DataFrame을 ResponsePriceDataItem(columnar 이면 ResponsePriceDataColumns) 형식의 JSON 으로 변환
+
+        bars: price_data 로 응답할 집계 봉 (기본값 df, 전일 종가 등은 원본 df 기준)
+        """
         if df.empty:
-            return []
+            return None
 
         try:
             week52_highest, week52_lowest = week52_data
 
-            # 가격 변동률 계산
-            df["daily_price_change_rate"] = np.round((df["Close"] - df["Open"]) / df["Open"] * 100, decimals=2).fillna(0)
-
-            df["name"] = usa_name if ctry == Country.US else df.get("Name", "").fillna("")
-
-            # 전일 종가 계산
-            df["last_day_close"] = self.get_last_day_close(df, frequency)
+            if ctry == Country.US:
+                name = usa_name
+            else:
+                name = df["Name"].iloc[0] if "Name" in df.columns else ""
+                name = "" if pd.isna(name) else name
 
             # TODO: 시가총액 Mock 데이터
-            return ResponsePriceDataItem(
-                ticker=str(df["Ticker"].iloc[0]),
-                name=str(df["name"].iloc[0]),
-                market=str(df["Market"].iloc[0]),
-                market_cap=569.87,
-                week52_highest=week52_highest,
-                week52_lowest=week52_lowest,
-                last_day_close=float(df["last_day_close"].iloc[0]),
-                price_data=self._create_price_data_items(df, frequency),
+            header = {
+                "name": str(name),
+                "ticker": str(df["Ticker"].iloc[0]),
+                "market": str(df["Market"].iloc[0]),
+                "market_cap": 569.87,
+                "week52_highest": float(week52_highest),
+                "week52_lowest": float(week52_lowest),
+                # 전일 종가 계산
+                "last_day_close": float(self.get_last_day_close(df, frequency)),
+            }
+            return splice_json(
+                header, "price_data", self._price_data_json(df if bars is None else bars, frequency, columnar)
             )
 
         except Exception as e:
             logger.error(f"Error processing price data: {str(e)}")
             return None
 
-    def _create_price_data_items(self, df: pd.DataFrame, frequency: Frequency) -> List[PriceDataItem]:
-        """PriceDataItem 리스트 생성"""
-        return [
-            PriceDataItem(
-                date=row["Date"],
-                ticker=str(row["Ticker"]),
-                name=str(row["name"]),
-                open=float(row["Open"]),
-                high=float(row["High"]),
-                low=float(row["Low"]),
-                close=float(row["Close"]),
-                volume=int(row["Volume"]),
-                daily_price_change_rate=float(row["daily_price_change_rate"]) if frequency == Frequency.DAILY else 0,
-                last_day_close=float(row["last_day_close"]),
-            )
-            for _, row in df.iterrows()
-            if not pd.isna(row["Open"]) and not pd.isna(row["Close"])
-        ]
+    def _price_data_json(self, df: pd.DataFrame, frequency: Frequency, columnar: bool = False) -> bytes:
+        """PriceDataItem 배열(columnar 이면 필드별 배열) JSON 생성 (시가/종가가 없는 행 제외, 컬럼 단위 변환)"""
+        open_ = df["Open"].to_numpy(dtype=np.float64)
+        close = df["Close"].to_numpy(dtype=np.float64)
+        mask = np.isfinite(open_) & np.isfinite(close)
+        valid, open_, close = df[mask], open_[mask], close[mask]
+
+        # 가격 변동률 계산 (일봉만, 시가가 0 이면 0)
+        if frequency == Frequency.DAILY:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                change_rate = finite_or(np.round((close - open_) / open_ * 100, decimals=2), 0.0)
+        else:
+            change_rate = np.zeros(len(valid))
+
+        # 스키마상 null 불가: 고가/저가가 없으면 시가/종가로, 거래량이 없으면 0 으로 대체
+        high = finite_or(valid["High"].to_numpy(dtype=np.float64), np.maximum(open_, close))
+        low = finite_or(valid["Low"].to_numpy(dtype=np.float64), np.minimum(open_, close))
+        volume = finite_or(valid["Volume"].to_numpy(dtype=np.float64), 0).astype(np.int64)
+
+        return frame_json(
+            {
+                "date": iso_datetimes(valid["Date"].to_numpy(dtype="datetime64[ns]")),
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+                "daily_price_change_rate": change_rate,
+            },
+            columnar,
+        )
 
 
 class DatabaseHandler:
@@ -177,29 +245,67 @@ class DatabaseHandler:
         """국가별 컬럼 리스트 반환"""
         return self.config.BASE_COLUMNS + self.config.COUNTRY_SPECIFIC_COLUMNS.get(ctry, [])
 
+    def get_export_schema(self, ctry: Country) -> pa.Schema:
+        """국가별 내보내기 Arrow 스키마"""
+        return pa.schema([(column, self.config.ARROW_TYPES[column]) for column in self.get_columns_for_country(ctry)])
+
+    async def fetch_table(
+        self, ctry: Country, ticker: str, date_range: Tuple[date, date], frequency: Frequency
+    ) -> pa.Table:
+        """데이터 조회 (컬럼 단위 pyarrow.Table)"""
+        start_date, end_date = date_range
+        # DBAPI 튜플을 바로 컬럼(Arrow)으로 변환 (Row 객체를 만들지 않음)
+        return await self.database._select_arrow_async(
+            table=self.get_table_name(ctry, frequency),
+            columns=self.get_columns_for_country(ctry),
+            order="Date",
+            ascending=True,
+            Ticker=ticker,
+            Date__between=(start_date, end_date),
+        )
+
+    def stream_table(
+        self, ctry: Country, ticker: str, date_range: Tuple[date, date], frequency: Frequency
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """데이터를 서버 측 커서로 STREAM_BATCH_SIZE 행씩 조회 (메모리에는 한 배치 분량만 유지)"""
+        start_date, end_date = date_range
+        return self.database._select_arrow_stream_async(
+            table=self.get_table_name(ctry, frequency),
+            columns=self.get_columns_for_country(ctry),
+            order="Date",
+            ascending=True,
+            batch_size=self.config.STREAM_BATCH_SIZE,
+            Ticker=ticker,
+            Date__between=(start_date, end_date),
+        )
+
     async def fetch_data(
         self, ctry: Country, ticker: str, date_range: Tuple[date, date], frequency: Frequency
     ) -> pd.DataFrame:
         """데이터 조회"""
-        start_date, end_date = date_range
         try:
-            table_name = self.get_table_name(ctry, frequency)
-            columns = self.get_columns_for_country(ctry)
-            conditions = {
-                "Ticker": ticker,
-                "Date__gte": datetime.combine(start_date, datetime.min.time()),
-                "Date__lte": datetime.combine(end_date, datetime.max.time()),
-            }
-
-            result = await asyncio.to_thread(
-                self.database._select, table=table_name, columns=columns, order="Date", ascending=True, **conditions
-            )
-
-            return pd.DataFrame(result, columns=columns) if result else pd.DataFrame(columns=columns)
+            result = await self.fetch_table(ctry, ticker, date_range, frequency)
+            return result.to_pandas() if result.num_rows else pd.DataFrame(columns=self.get_columns_for_country(ctry))
 
         except Exception as e:
+            # 재시도 및 실패 청크 처리를 위해 호출자에게 전달
             logger.error(f"Error fetching data: {str(e)}")
-            return pd.DataFrame(columns=self.get_columns_for_country(ctry))
+            raise
+
+    async def fetch_high_low(
+        self, ctry: Country, ticker: str, date_range: Tuple[date, date]
+    ) -> Optional[Tuple[float, float]]:
+        """기간 내 일봉 최고가/최저가 조회 (DB 에서 MAX/MIN 집계)"""
+        start_date, end_date = date_range
+        result = await self.database._select_async(
+            table=self.get_table_name(ctry, Frequency.DAILY),
+            columns=["High__max", "Low__min"],
+            Ticker=ticker,
+            Date__between=(start_date, end_date),
+        )
+        if not result or result[0].High__max is None:
+            return None
+        return float(result[0].High__max), float(result[0].Low__min)
 
     async def fetch_data_in_chunks(
         self,
@@ -240,7 +346,7 @@ class DatabaseHandler:
         chunks = []
         current_start = start_date
 
-        while current_start < end_date:
+        while current_start <= end_date:
             chunk_end = min(current_start + timedelta(days=chunk_size_days - 1), end_date)
             chunks.append((current_start, chunk_end))
             current_start = chunk_end + timedelta(days=1)
@@ -251,9 +357,7 @@ class DatabaseHandler:
         """US 티커의 종목명 조회"""
         try:
             conditions = {"ticker": ticker}
-            result = await asyncio.to_thread(
-                self.database._select, table="stock_us_tickers", columns=["english_name"], **conditions
-            )
+            result = await self.database._select_async(table="stock_us_tickers", columns=["english_name"], **conditions)
             return result[0].english_name if result else None
         except Exception as e:
             logger.error(f"Error fetching US ticker name: {str(e)}")
@@ -265,7 +369,8 @@ class PriceService:
 
     def __init__(self):
         self.config = PriceServiceConfig()
-        self._cache = MemoryCache()
+        self._cache = MemoryCache(namespace="price_v1")
+        self._range_cache = RangeCache(self._cache)
         self.db_handler = DatabaseHandler(self.config, database)
         self.data_processor = DataProcessor(self.config)
 
@@ -315,32 +420,36 @@ class PriceService:
 
     async def get_52week_data(self, ctry: Country, ticker: str, end_date: date) -> Tuple[float, float]:
         """52주 최고/최저가 조회"""
-        cache_key = f"52week_{ticker}_{end_date.strftime('%Y%m%d')}"
-
-        cached_data = self._cache.get(cache_key)
-        if cached_data is not None:
-            logger.info("Using cached 52-week data")
-            return cached_data["highest"], cached_data["lowest"]
-
-        logger.info("Calculating 52-week high/low...")
-        start_date = end_date - timedelta(days=365)
-        df = await self.db_handler.fetch_data(ctry, ticker, (start_date, end_date), Frequency.DAILY)
+        cache_key = f"52week_{ctry.value}_{ticker}_{end_date.strftime('%Y%m%d')}"
 
-        if df.empty:
+        async def load_52week_data() -> Optional[Dict[str, float]]:
+            logger.info("Calculating 52-week high/low...")
+            start_date = end_date - timedelta(days=365)
+            try:
+                high_low = await self.db_handler.fetch_high_low(ctry, ticker, (start_date, end_date))
+            except Exception:
+                return None
+
+            if high_low is None:
+                return None
+
+            # 딕셔너리 형태로 캐시 저장
+            return {"highest": high_low[0], "lowest": high_low[1]}
+
+        expiry = get_cache_expiry(ctry, end_date, self.config.CACHE_TTL["ONE_DAY"])
+        table_name = self.db_handler.get_table_name(ctry, Frequency.DAILY)
+        cached_data = await self._cache.get_or_load(
+            cache_key,
+            load_52week_data,
+            expiry.ttl,
+            expiry.strategy,
+            expiry.stale_ttl,
+            tags=[cache_tag(table_name, ticker)],
+        )
+        if cached_data is None:
             return 0.0, 0.0
 
-        highest = float(df["High"].max())
-        lowest = float(df["Low"].min())
-
-        # 딕셔너리 형태로 캐시 저장
-        cache_data = {"highest": highest, "lowest": lowest}
-
-        try:
-            self._cache.set(cache_key, cache_data, self.config.CACHE_TTL["ONE_DAY"])
-        except Exception as e:
-            logger.error(f"Error caching 52-week data: {str(e)}")
-
-        return highest, lowest
+        return cached_data["highest"], cached_data["lowest"]
 
     async def read_price_data(
         self,
@@ -349,8 +458,15 @@ class PriceService:
         frequency: Frequency,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> BaseResponse[ResponsePriceDataItem]:
-        """가격 데이터 조회"""
+        response_format: ResponseFormat = ResponseFormat.RECORDS,
+        interval: Optional[Interval] = None,
+    ) -> Union[RawJSONResponse, BaseResponse[ResponsePriceDataItem]]:
+        """가격 데이터 조회
+
+        response_format 이 columnar 이면 price_data 를 필드별 배열로, interval 을 지정하면 해당 간격으로 집계해 응답
+        """
+        if interval is not None and source_frequency(interval) != frequency:
+            raise InvalidIntervalException(interval.value, frequency.value)
 
         query_start_date, query_end_date = self._get_date_range(start_date, end_date, frequency)
 
@@ -368,74 +484,192 @@ class PriceService:
         if ctry == Country.US:
             usa_name = await self.db_handler.get_us_ticker_name(ticker)
 
+        bars = None
+        if interval is not None:
+            bars = self._get_resampled_data(cache_key, df, interval, (query_start_date, query_end_date), ctry, ticker)
+
         # 데이터 처리
-        price_data = self.data_processor.process_price_data(df, ctry, frequency, week52_data, query_end_date, usa_name)
+        price_data = self.data_processor.process_price_data(
+            df,
+            ctry,
+            frequency,
+            week52_data,
+            query_end_date,
+            usa_name,
+            columnar=response_format == ResponseFormat.COLUMNAR,
+            bars=bars,
+        )
 
         if not price_data:
             return BaseResponse(status_code=404, message="No valid data found after conversion", data=None)
 
-        return BaseResponse(status_code=200, message="Data retrieved successfully", data=price_data)
+        # 직접 만든 데이터이므로 pydantic 검증 없이 JSON 으로 응답
+        return RawJSONResponse(response_json(200, "Data retrieved successfully", price_data))
 
     async def _get_cached_or_fetch_data(
         self, cache_key: str, ctry: Country, ticker: str, date_range: Tuple[date, date], frequency: Frequency
     ) -> Optional[pd.DataFrame]:
-        """캐시된 데이터 확인 또는 청크 단위로 새로운 데이터 조회"""
+        """종목별 구간 캐시에서 조회 (비어있는 구간만 청크 단위로 새로 조회)"""
         start_date, end_date = date_range
 
-        # 캐시 확인 (기존 코드와 동일)
+        # 확정되지 않은 최근 구간은 장중에는 짧게, 장 마감 후에는 다음 개장까지 보유
+        expiry = get_cache_expiry(ctry, None, self.config.CACHE_TTL["ONE_HOUR"])
+        try:
+            return await self._range_cache.get(
+                cache_key,
+                start_date,
+                end_date,
+                lambda gap_start, gap_end: self._fetch_range_data(ctry, ticker, (gap_start, gap_end), frequency),
+                settled_until=get_settled_until(ctry),
+                tail_ttl=expiry.ttl,
+                tags=[cache_tag(self.db_handler.get_table_name(ctry, frequency), ticker)],
+                last_session=get_last_session(ctry),
+            )
+        except ChunkFetchError as e:
+            logger.error(str(e))
+            return None
+
+    def _get_resampled_data(
+        self,
+        cache_key: str,
+        df: pd.DataFrame,
+        interval: Interval,
+        date_range: Tuple[date, date],
+        ctry: Country,
+        ticker: str,
+    ) -> pd.DataFrame:
+        """interval 단위 집계 봉 (종목/기간/간격별 캐시)"""
+        start_date, end_date = date_range
+        key = f"{cache_key}_{interval.value}_{start_date:%Y%m%d}_{end_date:%Y%m%d}"
+        bars = self._cache.get(key)
+        if bars is None:
+            # 분봉 구간은 거래소 개장 시각 기준 (Date 는 거래소 현지 시각)
+            calendar = get_market_calendar(ctry)
+            bars = resample_ohlcv(df, interval, calendar.open_time if calendar else None)
+            last_loaded = df["Date"].max() if not df.empty else None
+            expiry = get_data_expiry(
+                ctry, end_date, self.config.CACHE_TTL["ONE_HOUR"], None if pd.isna(last_loaded) else last_loaded.date()
+            )
+            table_name = self.db_handler.get_table_name(ctry, source_frequency(interval))
+            self._cache.set(key, bars, expiry.ttl, expiry.strategy, tags=[cache_tag(table_name, ticker)])
+        return bars
 
-        cached_df = self._cache.get(cache_key)
-        if cached_df is not None:
-            logger.info("Cache hit!")
-            try:
-                if isinstance(cached_df, dict):
-                    cached_df = pd.DataFrame(cached_df)
-
-                mask = (cached_df["Date"] >= pd.Timestamp(start_date)) & (cached_df["Date"] <= pd.Timestamp(end_date))
-                df = cached_df[mask].copy()
-
-                if not (
-                    df.empty or df["Date"].min() > pd.Timestamp(start_date) or df["Date"].max() < pd.Timestamp(end_date)
-                ):
-                    logger.info(f"Using cached data with {len(df)} records")
-                    return df
-            except Exception as e:
-                logger.error(f"Error processing cached data: {str(e)}")
-
-        # 청크 단위로 새로운 데이터 조회
-        logger.info("Fetching data from database in chunks...")
+    async def _fetch_range_data(
+        self, ctry: Country, ticker: str, date_range: Tuple[date, date], frequency: Frequency
+    ) -> pd.DataFrame:
+        """청크 단위로 데이터 조회"""
+        logger.info(f"Fetching data from database in chunks: {date_range[0]} ~ {date_range[1]}")
         chunk_size = self._get_chunk_size(frequency)
         chunk_results = await self.db_handler.fetch_data_in_chunks(ctry, ticker, date_range, frequency, chunk_size)
 
-        # 실패한 청크가 있는지 확인
+        # 실패한 청크가 있으면 구간 전체를 실패 처리 (빈 구간이 캐싱되지 않도록)
         failed_chunks = [result for result in chunk_results if not result.success]
         if failed_chunks:
             chunk_errors = [f"{result.start_date}-{result.end_date}: {result.error}" for result in failed_chunks]
-            logger.error(f"Failed to fetch some chunks: {chunk_errors}")
-            return None
+            raise ChunkFetchError(f"Failed to fetch some chunks: {chunk_errors}")
 
         # 모든 청크 데이터 합치기
         dfs = [result.df for result in chunk_results if not result.df.empty]
         if not dfs:
-            return pd.DataFrame()
+            return pd.DataFrame(columns=self.db_handler.get_columns_for_country(ctry))
 
         df = pd.concat(dfs, ignore_index=True)
         df = df.sort_values("Date").reset_index(drop=True)
         df = self.data_processor.preprocess_dataframe(df)
 
+        logger.info(f"Fetched {len(df)} records from database")
+
+        return df
+
+    async def export_price_history(
+        self,
+        ctry: Country,
+        tickers: List[str],
+        frequency: Frequency,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        export_format: ExportFormat = ExportFormat.ARROW,
+    ) -> AsyncIterator[bytes]:
+        """가격 이력 내보내기 (Arrow IPC stream / Parquet 바이트 조각)
+
+        서버 측 커서의 배치를 고정 스키마로 변환해 바로 기록하며 JSON/DataFrame 을 거치지 않는다.
+        첫 종목의 첫 배치는 응답 시작 전에 조회하므로 단일 종목에 데이터가 없으면 404 로 응답한다.
+        """
+        date_range = self._get_export_date_range(start_date, end_date, frequency)
+        first = self.db_handler.stream_table(ctry, tickers[0], date_range, frequency)
         try:
-            # DataFrame을 딕셔너리로 변환하여 캐시 저장
-            cache_data = df.to_dict("records")
-            self._cache.set(cache_key, cache_data, self.config.CACHE_TTL["ONE_HOUR"])
-            logger.info(f"Cached {len(df)} records")
+            first_batch = await first.__anext__()
+        except StopAsyncIteration:
+            first_batch = None
+        except BaseException:
+            await first.aclose()
+            raise
+        if len(tickers) == 1 and first_batch is None:
+            await first.aclose()
+            raise DataNotFoundException(tickers[0], "price")
+
+        return self._export_chunks(ctry, tickers, frequency, date_range, export_format, first, first_batch)
+
+    async def _export_chunks(
+        self,
+        ctry: Country,
+        tickers: List[str],
+        frequency: Frequency,
+        date_range: Tuple[date, date],
+        export_format: ExportFormat,
+        first: AsyncIterator[pa.RecordBatch],
+        first_batch: Optional[pa.RecordBatch],
+    ) -> AsyncIterator[bytes]:
+        """종목 순서대로 배치 단위로 조회하며 기록 (메모리에는 한 배치 분량만 유지)"""
+        schema = self.db_handler.get_export_schema(ctry)
+        writer = TableStreamWriter(schema, export_format)
+        stream = first
+        try:
+            if first_batch is not None:
+                yield writer.write(self._export_table(first_batch, schema))
+            for index, ticker in enumerate(tickers):
+                if index:
+                    stream = self.db_handler.stream_table(ctry, ticker, date_range, frequency)
+                async with aclosing(stream):
+                    async for batch in stream:
+                        yield writer.write(self._export_table(batch, schema))
+            yield writer.close()
         except Exception as e:
-            logger.error(f"Error caching data: {str(e)}")
+            # 응답 헤더가 이미 전송되었으므로 연결을 끊어 불완전한 파일임을 알림
+            logger.error(f"Error exporting price data: {str(e)}")
+            raise
+        finally:
+            # 첫 종목 조회 전에 중단된 경우에도 connection 반환
+            await first.aclose()
+
+    @staticmethod
+    def _export_table(batch: pa.RecordBatch, schema: pa.Schema) -> pa.Table:
+        return pa.Table.from_batches([batch]).select(schema.names).cast(schema)
+
+    def _get_export_date_range(
+        self, start_date: Optional[date], end_date: Optional[date], frequency: Frequency
+    ) -> Tuple[date, date]:
+        """내보내기 기간 (기본 기간 적용, 분봉은 EXPORT_MAX_MINUTE_DAYS 로 제한)"""
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=self.config.EXPORT_DEFAULT_DAYS[frequency])
+        if start_date > end_date:
+            raise InvalidDateRangeException(start_date, end_date)
 
-        logger.info(f"Fetched {len(df)} records from database")
+        if frequency == Frequency.MINUTE and (end_date - start_date).days > self.config.EXPORT_MAX_MINUTE_DAYS:
+            end_date = start_date + timedelta(days=self.config.EXPORT_MAX_MINUTE_DAYS)
 
-        return df
+        return start_date, end_date
+
+    async def warmup(self, ctry: Country, ticker: str) -> None:
+        """52주 최고/최저가 캐시 적재"""
+        await self.get_52week_data(ctry, ticker, date.today())
+
+
+service_registry.register(PriceService)
 
 
 def get_price_service() -> PriceService:
-    """PriceService 인스턴스 생성"""
-    return PriceService()
+    """PriceService 인스턴스 조회 (워커 단위 공유)"""
+    return service_registry.get(PriceService)
@@ -1,16 +1,28 @@
 import asyncio
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+import numpy as np
 import pandas as pd
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import text
-from app.core.exception.custom import DataNotFoundException
+from app.core.exception.custom import AnalysisException, DataNotFoundException, InvalidIntervalException
 from app.core.logging.config import get_logger
-from app.modules.common.enum import Country
-from app.modules.common.cache import MemoryCache
-from app.modules.price.schemas import PriceDailyItem, PriceSummaryItem
-from app.database.conn import db
+from app.core.registry import service_registry
+from app.modules.common.enum import Country, Frequency, Interval, ResponseFormat
+from app.modules.common.cache import EvictionPolicy, MemoryCache, cache_tag
+from app.modules.common.disk_cache import DiskCache
+from app.modules.common.invalidation import invalidation_bus
+from app.modules.common.market_calendar import (
+    get_cache_expiry,
+    get_data_expiry,
+    get_market_calendar,
+    get_last_session,
+    get_settled_until,
+)
+from app.modules.common.range_cache import RangeCache
+from app.modules.common.resample import resample_ohlcv, source_frequency
+from app.modules.common.serialization import finite_or, frame_json, iso_dates
+from app.modules.price.schemas import PriceSummaryItem
 from app.database.crud import database
 
 
@@ -30,9 +42,12 @@ class ChunkResult:
 
 class PriceService:
     def __init__(self):
-        self._cache = MemoryCache()
+        self._cache = MemoryCache(namespace="price", policy=EvictionPolicy.LFU)
+        # 마감된 월의 일봉 (종목/월 단위 Arrow 파일)
+        self._disk_cache = DiskCache(namespace="price_daily")
+        self._range_cache = RangeCache(self._cache)
+        invalidation_bus.subscribe(self._invalidate_disk_cache)
         self._db = database
-        self._async_db = db
         self.cache_ttl_day = 60 * 60 * 24
         self.cache_ttl_week = 60 * 60 * 24 * 7
         self.cache_ttl_month = 60 * 60 * 24 * 30
@@ -41,27 +56,49 @@ class PriceService:
         self.country_specific_columns = {Country.KR: self.base_columns + ["Name"], Country.US: self.base_columns}
         self.price_columns = ["Date", "Open", "High", "Low", "Close", "Volume"]
 
-    def _fetch_52week_data(self, ctry: Country, ticker: str) -> pd.DataFrame:
+    @staticmethod
+    def _table_name(ctry: Country) -> str:
+        return f"stock_{ctry.value.lower()}_1d"
+
+    def _invalidate_disk_cache(self, tags: List[str]) -> None:
+        """일봉 테이블 변경 시 디스크 캐시 삭제 (테이블/종목/월 단위)"""
+        tables = {self._table_name(ctry): ctry for ctry in Country}
+        for tag in tags:
+            table, _, rest = tag.partition(":")
+            ticker, _, month = rest.partition("@")
+            if table not in tables:
+                continue
+            if month:
+                self._disk_cache.delete(tables[table].value, ticker, month)
+            elif ticker:
+                self._disk_cache.delete_tree(tables[table].value, ticker)
+            else:
+                self._disk_cache.delete_tree(tables[table].value)
+
+    async def _fetch_52week_data(self, ctry: Country, ticker: str) -> Tuple[Any, pd.DataFrame]:
         """
         52주 데이터 조회
+        최고/최저가는 DB 에서 MAX/MIN 으로 집계하고, 행 데이터는 최근 2 거래일만 조회
         """
         end_date = date.today()
         start_date = end_date - timedelta(days=365)
 
-        table_name = f"stock_{ctry.value.lower()}_1d"
+        table_name = self._table_name(ctry)
         columns = self.country_specific_columns.get(ctry, self.base_columns)
+        conditions = {
+            "Ticker": ticker,
+            "Date__between": (start_date, end_date),
+        }
 
-        result = self._db._select(
-            table=table_name,
-            columns=columns,
-            Ticker=ticker,
-            Date__gte=datetime.combine(start_date, datetime.min.time()),
-            Date__lte=datetime.combine(end_date, datetime.max.time()),
-            order="Date",
-            ascending=True,
+        high_low, recent = await asyncio.gather(
+            self._db._select_async(table=table_name, columns=["High__max", "Low__min"], **conditions),
+            self._db._select_async(
+                table=table_name, columns=columns, order="Date", ascending=False, limit=2, **conditions
+            ),
         )
 
-        return pd.DataFrame(result, columns=columns) if result else pd.DataFrame(columns=columns)
+        df = pd.DataFrame(recent, columns=columns) if recent else pd.DataFrame(columns=columns)
+        return high_low[0], df
 
     def _get_last_day_close(self, df: pd.DataFrame) -> float:
         """직전 거래일의 종가 반환"""
@@ -74,21 +111,21 @@ class PriceService:
         # 가장 최근 날짜를 제외한 첫 번째 데이터의 종가를 반환
         return float(sorted_df.iloc[1]["Close"])
 
-    def _process_price_data(self, df: pd.DataFrame) -> Tuple[float, float, float]:
+    def _process_price_data(self, high_low, df: pd.DataFrame) -> Tuple[float, float, float]:
         """
         52주 최고가, 52주 최저가, 최근 종가 반환
         """
-        week_52_high = df["High"].max()
-        week_52_low = df["Low"].min()
+        week_52_high = float(high_low.High__max)
+        week_52_low = float(high_low.Low__min)
         last_day_close = self._get_last_day_close(df)
 
         return week_52_high, week_52_low, last_day_close
 
-    def _get_us_ticker_name(self, ticker: str) -> str:  # TODO: RDS DB에 추가하여 조회 로직 없애기
+    async def _get_us_ticker_name(self, ticker: str) -> str:  # TODO: RDS DB에 추가하여 조회 로직 없애기
         """
         US 종목 이름 조회
         """
-        result = self._db._select(table="stock_us_tickers", columns=["english_name"], ticker=ticker)
+        result = await self._db._select_async(table="stock_us_tickers", columns=["english_name"], ticker=ticker)
         return result[0].english_name if result else None
 
     def _validate_date_range(self, start_date: Optional[date], end_date: Optional[date]) -> Tuple[date, date]:
@@ -139,28 +176,19 @@ class PriceService:
 
     async def _fetch_daily_data(self, ctry: Country, ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
         """일별 데이터 조회"""
-        table_name = f"stock_{ctry.value.lower()}_1d"
+        table_name = self._table_name(ctry)
         columns = self.country_specific_columns[ctry]
 
-        query = text(f"""
-            SELECT {', '.join(columns)}
-            FROM {table_name}
-            WHERE Ticker = :ticker
-              AND Date >= :start_date
-              AND Date <= :end_date
-            ORDER BY Date ASC
-        """)
-
-        result = await self._async_db.execute_async_query(
-            query,
-            {
-                "ticker": ticker,
-                "start_date": datetime.combine(start_date, datetime.min.time()),
-                "end_date": datetime.combine(end_date, datetime.max.time()),
-            },
+        result = await self._db._select_arrow_async(
+            table=table_name,
+            columns=columns,
+            order="Date",
+            ascending=True,
+            Ticker=ticker,
+            Date__between=(start_date, end_date),
         )
 
-        return pd.DataFrame(result.fetchall(), columns=columns) if result else pd.DataFrame(columns=columns)
+        return result.to_pandas() if result.num_rows else pd.DataFrame(columns=columns)
 
     async def _fetch_chunk_with_retry(
         self, ctry: Country, ticker: str, chunk_dates: Tuple[date, date], semaphore: asyncio.Semaphore
@@ -181,121 +209,186 @@ class PriceService:
                         return ChunkResult(pd.DataFrame(), chunk_start, chunk_end, False, str(e))
                     await asyncio.sleep(1 * (attempt + 1))  # 지수 백오프
 
-    def _price_change_rate_data(self, df: pd.DataFrame) -> List[PriceDailyItem]:
+    def _price_change_rate_data(self, df: pd.DataFrame, columnar: bool = False) -> Optional[bytes]:
         """
         일봉 데이터 조회
+        PriceDailyItem 배열(columnar 이면 PriceDailyColumns) JSON 을 컬럼 단위로 생성 (시가/종가가 없는 행 제외, 유효한 행이 없으면 None)
         """
-        df = df.dropna(subset=["Open", "Close"])
-
-        df["price_change_rate"] = ((df["Close"] - df["Open"]) / df["Open"] * 100).round(2)
-
-        result_df = df.assign(
-            date=df["Date"].dt.date,
-            open=df["Open"].astype(float),
-            high=df["High"].astype(float),
-            low=df["Low"].astype(float),
-            close=df["Close"].astype(float),
-            volume=df["Volume"].astype(int),
-            price_change_rate=df["price_change_rate"].astype(float),
-        )[["date", "open", "high", "low", "close", "volume", "price_change_rate"]]
-
-        return result_df.to_dict("records")
+        open_ = df["Open"].to_numpy(dtype=np.float64)
+        close = df["Close"].to_numpy(dtype=np.float64)
+        mask = np.isfinite(open_) & np.isfinite(close)
+        if not mask.any():
+            return None
+        valid, open_, close = df[mask], open_[mask], close[mask]
+
+        # 시가가 0 이면 변동률 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price_change_rate = finite_or(np.round((close - open_) / open_ * 100, 2), 0.0)
+
+        # 스키마상 null 불가: 고가/저가가 없으면 시가/종가로, 거래량이 없으면 0 으로 대체
+        high = finite_or(valid["High"].to_numpy(dtype=np.float64), np.maximum(open_, close))
+        low = finite_or(valid["Low"].to_numpy(dtype=np.float64), np.minimum(open_, close))
+        volume = finite_or(valid["Volume"].to_numpy(dtype=np.float64), 0).astype(np.int64)
+
+        return frame_json(
+            {
+                "date": iso_dates(valid["Date"].to_numpy(dtype="datetime64[ns]")),
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+                "price_change_rate": price_change_rate,
+            },
+            columnar,
+        )
 
     async def _fetch_parallel_data(
         self, ctry: Country, ticker: str, start_date: date, end_date: date
-    ) -> List[PriceDailyItem]:
-        """장기 데이터 병렬 처리"""
+    ) -> List[pd.DataFrame]:
+        """기간 데이터 조회 (월 단위 병렬 처리, 월별 조각을 날짜순으로 반환하며 병합은 RangeCache 에서 한 번만 수행)"""
         periods = self._get_monthly_periods(start_date, end_date)
         semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
         chunk_results = await asyncio.gather(
-            *[self._fetch_chunk_with_retry(ctry, ticker, period, semaphore) for period in periods]
+            *[self._fetch_monthly_data(ctry, ticker, period, semaphore) for period in periods]
         )
 
-        # 실패한 청크 확인
+        # 실패한 청크가 있으면 구간 전체를 실패 처리 (빈 구간이 캐싱되지 않도록)
         failed_chunks = [result for result in chunk_results if not result.success]
         if failed_chunks:
             chunk_errors = [f"{result.start_date}-{result.end_date}: {result.error}" for result in failed_chunks]
             logger.error(f"Failed chunks: {chunk_errors}")
+            raise AnalysisException(analysis_type="일봉 조회", detail=", ".join(chunk_errors))
 
-        # 성공한 청크 데이터 병합
-        all_data = []
-        for result in chunk_results:
-            if result.success and not result.df.empty:
-                processed_data = self._price_change_rate_data(result.df)
-                all_data.extend(processed_data)
+        dfs = [result.df for result in chunk_results if not result.df.empty]
+        if not dfs:
+            return [pd.DataFrame(columns=self.country_specific_columns[ctry])]
 
-        if not all_data:
-            raise DataNotFoundException(ticker, "daily")
+        return dfs
 
-        return [PriceDailyItem(**item) for item in all_data]
+    @staticmethod
+    def _month_bounds(day: date) -> Tuple[date, date]:
+        """해당 월의 (1일, 말일)"""
+        month_start = day.replace(day=1)
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        return month_start, next_month - timedelta(days=1)
 
-    async def _fetch_short_term_data(
-        self, ctry: Country, ticker: str, start_date: date, end_date: date
-    ) -> List[PriceDailyItem]:
-        """단기 데이터 조회"""
-        df = await self._fetch_daily_data(ctry, ticker, start_date, end_date)
-        if df.empty:
-            raise DataNotFoundException(ticker, "daily")
+    def _is_closed_month(self, ctry: Country, month_end: date) -> bool:
+        """월이 마감되어 더 이상 데이터가 바뀌지 않는지 여부 (거래소 캘린더 기준)"""
+        calendar = get_market_calendar(ctry)
+        if calendar is None:
+            return month_end < date.today()
+        return calendar.is_settled(month_end)
 
-        processed_data = self._price_change_rate_data(df)
-        if not processed_data:
-            raise DataNotFoundException(ticker, "daily")
+    def _is_complete_month(self, ctry: Country, month_end: date, month_df: pd.DataFrame) -> bool:
+        """마감된 월의 마지막 거래일 일봉까지 적재되었는지 여부 (늦게/일부만 적재된 월은 영구 보관하지 않음)
 
-        return [PriceDailyItem(**item) for item in processed_data]
+        휴장일 표 이전의 월은 마지막 거래일을 알 수 없으므로 데이터가 있으면 완료로 본다.
+        """
+        if month_df.empty:
+            return False
+        calendar = get_market_calendar(ctry)
+        if calendar is None:
+            return True
+        last_day = calendar.expected_last_session(month_end)
+        if last_day is None:
+            return True
+        return month_df["Date"].max() >= pd.Timestamp(last_day)
 
     async def _fetch_monthly_data(
         self, ctry: Country, ticker: str, period: tuple[date, date], semaphore: asyncio.Semaphore
-    ) -> List[Dict[str, Any]]:
-        """월별 데이터 조회 (세마포어 적용)"""
+    ) -> ChunkResult:
+        """월별 데이터 조회
+
+        마감된 월은 L2(디스크) -> DB 순서로 조회하며, 월 전체를 읽은 뒤 요청 구간만 복사 없이 잘라 반환한다.
+        디스크에서 읽은 월은 매핑된 버퍼를 공유하는 view 이며, RangeCache 에 병합될 때 한 번만 복사된다.
+        메모리(L1)는 호출자인 종목별 구간 캐시(RangeCache)가 보관하므로 월 단위로 따로 저장하지 않는다.
+        마지막 거래일 일봉이 없는 월은 디스크에 쓰지 않는다.
+        진행 중인 월은 DB 에서 요청 구간만 조회한다.
+        """
         start_date, end_date = period
-        cache_key = f"daily_{ctry.value}_{ticker}_{start_date}_{end_date}"
+        month_start, month_end = self._month_bounds(start_date)
 
-        # 캐시 확인
-        cached_data = self._cache.get(cache_key)
-        if cached_data:
-            logger.info(f"Cache hit for {cache_key}")
-            return cached_data
+        if not self._is_closed_month(ctry, month_end):
+            return await self._fetch_chunk_with_retry(ctry, ticker, period, semaphore)
 
-        # 세마포어로 동시 요청 제한
-        async with semaphore:
-            df = await self._fetch_daily_data(ctry, ticker, start_date, end_date)
-            if df.empty:
-                return []
+        period_end = datetime.combine(end_date, datetime.max.time())
 
-            response_data = self._process_price_data(df)
-            if response_data:
-                self._cache.set(cache_key, response_data, self.cache_ttl_month)
-            return response_data
+        # L2 (디스크 읽기는 스레드에서 처리, 매핑된 파일을 복사 없이 읽음)
+        month_data = await asyncio.to_thread(self._disk_cache.read, ctry.value, ticker, f"{month_start:%Y-%m}")
+        if month_data is not None and self._is_complete_month(ctry, month_end, month_data.to_frame()):
+            # 날짜 이진 탐색으로 요청 구간만 view 로 잘라냄
+            return ChunkResult(month_data.slice(start_date, period_end), start_date, end_date, True)
+
+        result = await self._fetch_chunk_with_retry(ctry, ticker, (month_start, month_end), semaphore)
+        if not result.success:
+            return ChunkResult(result.df, start_date, end_date, False, result.error)
+        month_df = result.df
+        if self._is_complete_month(ctry, month_end, month_df):
+            await asyncio.to_thread(self._disk_cache.write, month_df, ctry.value, ticker, f"{month_start:%Y-%m}")
+
+        # DB 조회 결과는 날짜순이므로 이진 탐색으로 잘라냄 (행 단위 마스크 복사 없음)
+        dates = month_df["Date"]
+        lo = int(dates.searchsorted(pd.Timestamp(start_date), side="left"))
+        hi = int(dates.searchsorted(pd.Timestamp(period_end), side="right"))
+        return ChunkResult(month_df.iloc[lo:hi], start_date, end_date, True)
 
     async def get_price_data_daily(
-        self, ctry: Country, ticker: str, start_date: Optional[date] = None, end_date: Optional[date] = None
-    ) -> List[PriceDailyItem]:
-        """일봉 데이터 조회"""
+        self,
+        ctry: Country,
+        ticker: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        response_format: ResponseFormat = ResponseFormat.RECORDS,
+        interval: Optional[Interval] = None,
+    ) -> bytes:
+        """일봉 데이터 조회 (PriceDailyItem 배열, columnar 이면 필드별 배열 JSON, interval 지정 시 주/월/연봉 집계)"""
+        if interval is not None and source_frequency(interval) != Frequency.DAILY:
+            raise InvalidIntervalException(interval.value, Frequency.DAILY.value)
+
         start_date, end_date = self._validate_date_range(start_date, end_date)
 
-        cache_key = f"daily_{ctry.value}_{ticker}_{start_date}_{end_date}"
-        cached_data = self._cache.get(cache_key)
-        if cached_data:
-            logger.info(f"Cache hit for {cache_key}")
-            return [PriceDailyItem(**item) for item in cached_data]
-
-        # 60일 이상 데이터는 병렬 처리, 그 외는 단일 요청
-        data_diff = (end_date - start_date).days
-        data = (
-            await self._fetch_parallel_data(ctry, ticker, start_date, end_date)
-            if data_diff > 60
-            else await self._fetch_short_term_data(ctry, ticker, start_date, end_date)
+        # 종목별 구간 캐시(L1)에서 요청 구간을 잘라내고, 비어있는 구간만 월 단위 디스크 캐시(L2)/DB 조회
+        expiry = get_cache_expiry(ctry, None, self.cache_ttl_day)
+        df = await self._range_cache.get(
+            f"daily_{ctry.value}_{ticker}",
+            start_date,
+            end_date,
+            lambda gap_start, gap_end: self._fetch_parallel_data(ctry, ticker, gap_start, gap_end),
+            settled_until=get_settled_until(ctry),
+            tail_ttl=expiry.ttl,
+            tags=[cache_tag(self._table_name(ctry), ticker)],
+            last_session=get_last_session(ctry),
         )
+        if df.empty:
+            raise DataNotFoundException(ticker, "daily")
+
+        if interval is not None:
+            df = self._get_resampled_data(ctry, ticker, df, interval, start_date, end_date)
 
-        # 캐시 저장
-        try:
-            cache_data = [item.dict() for item in data]
-            self._cache.set(cache_key, cache_data, self.cache_ttl_day)
-        except Exception as e:
-            logger.error(f"Failed to set cache for {cache_key}: {e}")
+        processed_data = self._price_change_rate_data(df, columnar=response_format == ResponseFormat.COLUMNAR)
+        if not processed_data:
+            raise DataNotFoundException(ticker, "daily")
 
-        return data
+        return processed_data
+
+    def _get_resampled_data(
+        self, ctry: Country, ticker: str, df: pd.DataFrame, interval: Interval, start_date: date, end_date: date
+    ) -> pd.DataFrame:
+        """interval 단위 집계 봉 (종목/기간/간격별 캐시)"""
+        cache_key = f"daily_{ctry.value}_{ticker}_{interval.value}_{start_date:%Y%m%d}_{end_date:%Y%m%d}"
+        bars = self._cache.get(cache_key)
+        if bars is None:
+            bars = resample_ohlcv(df, interval)
+            last_loaded = df["Date"].max() if not df.empty else None
+            expiry = get_data_expiry(
+                ctry, end_date, self.cache_ttl_day, None if pd.isna(last_loaded) else last_loaded.date()
+            )
+            self._cache.set(
+                cache_key, bars, expiry.ttl, expiry.strategy, tags=[cache_tag(self._table_name(ctry), ticker)]
+            )
+        return bars
 
     async def get_price_data_summary(self, ctry: Country, ticker: str) -> PriceSummaryItem:
         """
@@ -303,36 +396,43 @@ class PriceService:
         """
         cache_key = f"summary_{ctry.value}_{ticker}"
 
-        cached_data = self._cache.get(cache_key)
-        if cached_data:
-            logger.info(f"Cache hit for {cache_key}")
-            return PriceSummaryItem(**cached_data)
+        async def load_summary_data() -> Dict[str, Any]:
+            high_low, df = await self._fetch_52week_data(ctry, ticker)
+            if df.empty:
+                raise DataNotFoundException(ticker, "52week")
 
-        df = self._fetch_52week_data(ctry, ticker)
-        if df.empty:
-            raise DataNotFoundException(ticker, "52week")
+            week_52_high, week_52_low, last_day_close = self._process_price_data(high_low, df)
 
-        week_52_high, week_52_low, last_day_close = self._process_price_data(df)
+            name = await self._get_us_ticker_name(ticker) if ctry == Country.US else df["Name"].iloc[0]
 
-        name = self._get_us_ticker_name(ticker) if ctry == Country.US else df["Name"].iloc[0]
+            return {
+                "name": name,
+                "ticker": ticker,
+                "market": df["Market"].iloc[0],
+                "sector": "추후 업뎃 예정",
+                "last_day_close": last_day_close,
+                "week_52_low": week_52_low,
+                "week_52_high": week_52_high,
+            }
+
+        # 최신 52주 구간이므로 영구 캐싱하지 않음
+        expiry = get_cache_expiry(ctry, None, self.cache_ttl_day)
+        tags = [cache_tag(self._table_name(ctry), ticker)]
+        if ctry == Country.US:
+            tags.append(cache_tag("stock_us_tickers", ticker))
+        response_data = await self._cache.get_or_load(
+            cache_key, load_summary_data, expiry.ttl, expiry.strategy, expiry.stale_ttl, tags=tags
+        )
+        return PriceSummaryItem(**response_data)
 
-        response_data = {
-            "name": name,
-            "ticker": ticker,
-            "market": df["Market"].iloc[0],
-            "sector": "추후 업뎃 예정",
-            "last_day_close": last_day_close,
-            "week_52_low": week_52_low,
-            "week_52_high": week_52_high,
-        }
+    async def warmup(self, ctry: Country, ticker: str) -> None:
+        """요약 및 기본(30일) 일봉 데이터 캐시 적재"""
+        await self.get_price_data_summary(ctry, ticker)
+        await self.get_price_data_daily(ctry, ticker)
 
-        try:
-            self._cache.set(cache_key, response_data, self.cache_ttl_day)
-        except Exception as e:
-            logger.error(f"Failed to set cache for {cache_key}: {e}")
 
-        return PriceSummaryItem(**response_data)
+service_registry.register(PriceService)
 
 
 def get_price_service() -> PriceService:
-    return PriceService()
+    return service_registry.get(PriceService)
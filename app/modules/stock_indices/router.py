@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends
 from app.modules.stock_indices.schemas import IndicesData, IndexSummary
-from .services import StockIndicesService
+from .services import StockIndicesService, get_stock_indices_service
 
 router = APIRouter()
 
 
 @router.get("", summary="코스피/코스닥/나스닥/S&P500 지수 조회 일봉 간격", response_model=IndicesData)
 async def get_stock_indices(
-    service: StockIndicesService = Depends(StockIndicesService),
+    service: StockIndicesService = Depends(get_stock_indices_service),
 ) -> IndicesData:
     try:
         result = await service.get_indices_data()
@@ -2,10 +2,11 @@ import logging
 import yfinance as yf
 from typing import Tuple
 import asyncio
-from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+from app.core.registry import service_registry
 from app.database.crud import database
+from app.modules.common.cache import MemoryCache
 from app.modules.stock_indices.schemas import IndexSummary, IndicesData, IndicesResponse, TimeData
 
 
@@ -13,12 +14,16 @@ class StockIndicesService:
     def __init__(self):
         self.db = database
         self.symbols = {"kospi": "^KS11", "kosdaq": "^KQ11", "nasdaq": "^IXIC", "sp500": "^GSPC"}
-        self._cache = {}
+        self._cache = MemoryCache(namespace="stock_indices")
         self._cache_timeout = 300
         self._executor = ThreadPoolExecutor(max_workers=8)
         self._lock = asyncio.Lock()
         self._background_task_running = False
 
+    def close(self):
+        """executor 정리"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     async def _update_cache_background(self):
         """백그라운드에서 캐시 업데이트"""
         if self._background_task_running:
@@ -42,15 +47,9 @@ class StockIndicesService:
         try:
             cache_key_daily = f"{name}_daily"
             cache_key_min5 = f"{name}_min5"
-            now = datetime.now()
 
-            if cache_key_daily in self._cache and cache_key_min5 in self._cache:
-                cached_daily, timestamp_daily = self._cache[cache_key_daily]
-                cached_min5, timestamp_min5 = self._cache[cache_key_min5]
-                if now - timestamp_daily < timedelta(seconds=self._cache_timeout) and now - timestamp_min5 < timedelta(
-                    seconds=self._cache_timeout
-                ):
-                    return
+            if self._cache.get(cache_key_daily) is not None and self._cache.get(cache_key_min5) is not None:
+                return
 
             async def fetch_history(period, interval=None):
                 try:
@@ -74,7 +73,7 @@ class StockIndicesService:
                     "open": round(float(daily_df["Open"].iloc[0]), 2),
                     "close": round(float(daily_df["Close"].iloc[0]), 2),
                 }
-                self._cache[cache_key_daily] = (daily_data, now)
+                self._cache.set(cache_key_daily, daily_data, self._cache_timeout)
 
             if not min5_df.empty:
                 min5_data = {
@@ -87,7 +86,7 @@ class StockIndicesService:
                     )
                     for index, row in min5_df.iterrows()
                 }
-                self._cache[cache_key_min5] = (min5_data, now)
+                self._cache.set(cache_key_min5, min5_data, self._cache_timeout)
 
         except Exception as e:
             print(f"Error fetching data for {name}: {e}")
@@ -154,13 +153,11 @@ class StockIndicesService:
         """최적화된 시장 등락비율 조회"""
         try:
             cache_key = f"{market}_ratio"
-            now = datetime.now()
 
             # 캐시 확인
-            if cache_key in self._cache:
-                data, timestamp = self._cache[cache_key]
-                if now - timestamp < timedelta(seconds=self._cache_timeout):
-                    return data
+            cached_ratios = self._cache.get(cache_key)
+            if cached_ratios is not None:
+                return cached_ratios
 
             # 고정된 테스트 데이터 반환
             ratios = {
@@ -173,7 +170,7 @@ class StockIndicesService:
             test_ratios = ratios.get(market.lower(), (33.33, 33.33, 33.34))
 
             # 캐시에 저장
-            self._cache[cache_key] = (test_ratios, now)
+            self._cache.set(cache_key, test_ratios, self._cache_timeout)
             return test_ratios
 
         except Exception as e:
@@ -196,8 +193,8 @@ class StockIndicesService:
                 cache_key_daily = f"{name}_daily"
                 cache_key_min5 = f"{name}_min5"
 
-                if cache_key_daily in self._cache:
-                    daily_data, _ = self._cache[cache_key_daily]
+                daily_data = self._cache.get(cache_key_daily)
+                if daily_data is not None:
                     change = daily_data["close"] - daily_data["open"]
                     change_percent = round((change / daily_data["open"]) * 100, 2) if daily_data["open"] != 0 else 0.00
 
@@ -221,7 +218,7 @@ class StockIndicesService:
                         unchanged_ratio=0.00,
                     )
 
-                indices_data[name] = self._cache.get(cache_key_min5, ({}, None))[0]
+                indices_data[name] = self._cache.get(cache_key_min5) or {}
 
             return IndicesData(
                 status_code=200,
@@ -251,3 +248,10 @@ class StockIndicesService:
                 sp500=empty_summary,
                 data=None,
             )
+
+
+service_registry.register(StockIndicesService)
+
+
+def get_stock_indices_service() -> StockIndicesService:
+    return service_registry.get(StockIndicesService)
@@ -1,9 +1,12 @@
+import asyncio
 import pandas as pd
 from app.database.crud import database
 from app.core.exception.custom import DataNotFoundException
+from app.modules.common.cache import MemoryCache
 from app.modules.common.enum import Country
 from app.modules.stock_info.schemas import Indicators, StockInfo
 from app.core.logging.config import get_logger
+from app.core.registry import service_registry
 
 logger = get_logger(__name__)
 
@@ -13,6 +16,15 @@ class StockInfoService:
         self.db = database
         self.file_path = "static"
         self.file_name = "stock_{}_info.csv"
+        self._cache = MemoryCache(namespace="stock_info")
+        self.cache_ttl = 60 * 60 * 24
+
+    async def _read_file(self, file_path: str) -> pd.DataFrame:
+        """
+        정적 파일 조회 (캐싱 및 동시 요청 병합)
+        """
+        reader = pd.read_parquet if file_path.endswith(".parquet") else pd.read_csv
+        return await self._cache.get_or_load(file_path, lambda: asyncio.to_thread(reader, file_path), self.cache_ttl)
 
     async def get_stock_info(self, ctry: Country, ticker: str) -> StockInfo:
         """
@@ -21,16 +33,19 @@ class StockInfoService:
         if ctry != Country.US:
             raise DataNotFoundException(ticker=ctry.name, data_type="stock_info")
 
-        file_name = self.file_name.format(ctry.name)
+        # 파일명은 소문자 국가 코드 (static/stock_us_info.csv, static/summary_us.parquet)
+        file_name = self.file_name.format(ctry.value)
         info_file_path = f"{self.file_path}/{file_name}"
-        df = pd.read_csv(info_file_path)
-        result = df.loc[df["ticker"] == ticker].to_dict(orient="records")[0]
-        if result is None:
+        df = await self._read_file(info_file_path)
+        records = df.loc[df["ticker"] == ticker].to_dict(orient="records")
+        if not records:
             raise DataNotFoundException(ticker=ticker, data_type="stock_info")
+        result = records[0]
 
-        intro_file_path = f"{self.file_path}/summary_{ctry.name}.parquet"
-        intro_df = pd.read_parquet(intro_file_path)
-        intro_result = intro_df.loc[intro_df["Code"] == ticker].to_dict(orient="records")[0]
+        intro_file_path = f"{self.file_path}/summary_{ctry.value}.parquet"
+        intro_df = await self._read_file(intro_file_path)
+        intro_records = intro_df.loc[intro_df["Code"] == ticker].to_dict(orient="records")
+        intro_result = intro_records[0] if intro_records else {}
 
         result = StockInfo(
             introduction=intro_result.get("translated_overview", ""),
@@ -116,6 +131,14 @@ class StockInfoService:
         #     print(f"Error: {str(e)}")
         #     raise e
 
+    async def warmup(self, ctry: Country, ticker: str) -> None:
+        """종목 정보 파일 캐시 적재"""
+        if ctry == Country.US:
+            await self.get_stock_info(ctry, ticker)
+
+
+service_registry.register(StockInfoService)
+
 
 def get_stock_info_service() -> StockInfoService:
-    return StockInfoService()
+    return service_registry.get(StockInfoService)
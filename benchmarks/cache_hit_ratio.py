@@ -0,0 +1,80 @@
+"""
+캐시 적중률 벤치마크
+
+/api/v2/price/daily 와 /api/v1/stock-indices 를 앱 프로세스 내부(ASGI)에서 반복 호출하고
+워커 단위로 공유되는 서비스 캐시의 hit/miss 를 출력한다.
+
+`--per-request` 옵션은 요청마다 서비스 인스턴스를 폐기하여 기존 동작(요청마다 새 서비스 생성)을 재현한다.
+
+실행 예시:
+    ENV=dev python -m benchmarks.cache_hit_ratio --tickers 005930,000660 --rounds 20
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.registry import service_registry
+from app.main import app
+from app.modules.price import services_v2
+from app.modules.stock_indices.services import StockIndicesService
+
+
+def collect_stats(totals: dict) -> None:
+    """현재 서비스 캐시의 hit/miss 를 누적"""
+    caches = {
+        "price v2": service_registry.get(services_v2.PriceService)._cache,
+        "stock-indices": service_registry.get(StockIndicesService)._cache,
+    }
+    for name, cache in caches.items():
+        stats = cache.get_stats()
+        total = totals.setdefault(name, {"hits": 0, "misses": 0})
+        total["hits"] += stats["hits"]
+        total["misses"] += stats["misses"]
+
+
+async def run(tickers: list[str], ctry: str, rounds: int, per_request: bool) -> None:
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    totals = {}
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(rounds):
+                for ticker in tickers:
+                    started = time.perf_counter()
+                    await client.get("/api/v2/price/daily", params={"ctry": ctry, "ticker": ticker})
+                    await client.get("/api/v1/stock-indices")
+                    latencies.append(time.perf_counter() - started)
+
+                    if per_request:
+                        collect_stats(totals)
+                        await service_registry.shutdown()
+
+            if not per_request:
+                collect_stats(totals)
+
+    latencies.sort()
+    print(f"mode: {'per-request services' if per_request else 'shared services'}")
+    print(f"requests: {len(latencies)} (p50 {latencies[len(latencies) // 2] * 1000:.1f} ms)")
+    for name, stats in totals.items():
+        lookups = stats["hits"] + stats["misses"]
+        hit_ratio = stats["hits"] / lookups if lookups else 0.0
+        print(f"[{name}] hits={stats['hits']} misses={stats['misses']} hit_ratio={hit_ratio:.2%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Shared service cache hit ratio benchmark")
+    parser.add_argument("--tickers", default="005930,000660,035420", help="쉼표로 구분된 티커 목록")
+    parser.add_argument("--ctry", default="kr", help="국가 코드 (kr/us)")
+    parser.add_argument("--rounds", type=int, default=10, help="티커별 반복 횟수")
+    parser.add_argument("--per-request", action="store_true", help="요청마다 서비스 인스턴스 폐기")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.tickers.split(","), args.ctry, args.rounds, args.per_request))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+컬럼 단위 조회 벤치마크
+
+Row -> DataFrame 변환(기존 경로)과 DBAPI 튜플 -> Arrow/NumPy 변환(`_select_arrow`, `_select_columns`)을
+일봉 250개, 재무제표 40분기 조회로 비교한다.
+
+실행 예시:
+    ENV=dev python -m benchmarks.columnar_fetch --ticker 005930 --iterations 200
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from app.database.crud import database
+
+
+def measure(func, iterations: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def compare(name: str, query: dict, iterations: int) -> None:
+    columns = query.get("columns")
+
+    def rows_to_frame():
+        rows = database._select(**query)
+        return pd.DataFrame([{col: val for col, val in zip(row._fields, row)} for row in rows], columns=columns)
+
+    def arrow_to_frame():
+        return database._select_arrow(**query).to_pandas()
+
+    def numpy_columns():
+        return database._select_columns(**query)
+
+    rows = len(database._select(**query))
+    print(f"[{name}] rows={rows}")
+    for label, func in (
+        ("rows -> DataFrame", rows_to_frame),
+        ("arrow -> DataFrame", arrow_to_frame),
+        ("numpy", numpy_columns),
+    ):
+        print(f"  {label:<20} {measure(func, iterations):.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Columnar fetch benchmark")
+    parser.add_argument("--ctry", default="kr", help="국가 코드 (kr/us)")
+    parser.add_argument("--ticker", default="005930", help="종목 코드")
+    parser.add_argument("--iterations", type=int, default=200, help="반복 횟수")
+    args = parser.parse_args()
+
+    daily = dict(
+        table=f"stock_{args.ctry}_1d",
+        columns=["Date", "Ticker", "Open", "High", "Low", "Close", "Volume"],
+        order="Date",
+        ascending=False,
+        limit=250,
+        Ticker=args.ticker,
+    )
+    income_table = {"kr": "KOR_income", "us": "USA_income"}[args.ctry]
+    quarters = dict(table=income_table, order="period_q", ascending=False, limit=40, Code=args.ticker)
+
+    compare("daily bars x250", daily, args.iterations)
+    compare("income statements x40", quarters, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+/financial/financial-ratio 동시 요청 벤치마크
+
+동시 클라이언트 N 개가 /api/v1/financial/financial-ratio 를 호출할 때의 처리량(req/s)과 지연 시간을 측정한다.
+DB 조회 경로를 비교하기 위해 FinancialService 캐시를 우회하고 매 요청마다 DB 를 조회한다.
+
+- thread: 동기 `Database._select` 를 asyncio.to_thread 로 실행 (기본 executor 크기에 동시성이 제한됨)
+- async: aiomysql 엔진의 `Database._select_async` 사용
+
+실행 예시:
+    ENV=dev python -m benchmarks.financial_ratio_concurrency --ticker 005930 --clients 200 --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.registry import service_registry
+from app.database.crud import database
+from app.main import app
+from app.modules.financial.services import FinancialService
+
+
+def use_query_path(mode: str) -> None:
+    """FinancialService 의 DB 조회 경로 교체 (캐시 우회)"""
+    service = service_registry.get(FinancialService)
+    if mode == "thread":
+        service._select = lambda table, **kwargs: asyncio.to_thread(database._select, table=table, **kwargs)
+    else:
+        service._select = lambda table, **kwargs: database._select_async(table=table, **kwargs)
+
+
+async def run(mode: str, ctry: str, ticker: str, clients: int, total_requests: int) -> None:
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total_requests):
+        queue.put_nowait(None)
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        while not queue.empty():
+            queue.get_nowait()
+            started = time.perf_counter()
+            response = await client.get("/api/v1/financial/financial-ratio", params={"ctry": ctry, "ticker": ticker})
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    async with app.router.lifespan_context(app):
+        use_query_path(mode)
+        limits = httpx.Limits(max_connections=clients)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", limits=limits) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*[client_loop(client) for _ in range(clients)])
+            elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"mode: {mode} (clients={clients})")
+    print(f"requests: {len(latencies)} errors: {errors} elapsed: {elapsed:.2f}s rps: {len(latencies) / elapsed:.1f}")
+    print(
+        f"latency p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Financial ratio concurrency benchmark")
+    parser.add_argument("--ctry", default="KOR", help="국가 코드 (KOR/USA)")
+    parser.add_argument("--ticker", default="005930", help="종목 코드")
+    parser.add_argument("--clients", type=int, default=200, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=2000, help="전체 요청 수")
+    parser.add_argument("--mode", choices=["thread", "async", "both"], default="both", help="DB 조회 경로")
+    args = parser.parse_args()
+
+    modes = ["thread", "async"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        asyncio.run(run(mode, args.ctry, args.ticker, args.clients, args.requests))
+
+
+if __name__ == "__main__":
+    main()
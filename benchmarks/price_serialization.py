@@ -0,0 +1,87 @@
+"""
+가격 응답 직렬화 벤치마크
+
+합성 분봉/일봉 DataFrame 으로 pydantic 모델(PriceDataItem) 생성 + JSON 직렬화 경로와
+컬럼 단위 JSON 생성(`DataProcessor._price_data_json`, records / columnar) 경로를 비교한다. DB 연결이 필요 없다.
+
+실행 예시:
+    python -m benchmarks.price_serialization --rows 5000 --iterations 50
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
+
+from app.modules.common.enum import Frequency
+from app.modules.price.schemas import PriceDataItem
+from app.modules.price.services import DataProcessor, PriceServiceConfig
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.001, rows))
+    return pd.DataFrame(
+        {
+            "Date": pd.date_range("2024-01-02 09:30", periods=rows, freq="min"),
+            "Ticker": "AAPL",
+            "Open": close * (1 + rng.normal(0, 0.0005, rows)),
+            "High": close * 1.001,
+            "Low": close * 0.999,
+            "Close": close,
+            "Volume": rng.integers(100, 10000, rows),
+        }
+    )
+
+
+def measure(func, iterations: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Price response serialization benchmark")
+    parser.add_argument("--rows", type=int, default=5000, help="봉 개수")
+    parser.add_argument("--iterations", type=int, default=50, help="반복 횟수")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    processor = DataProcessor(PriceServiceConfig())
+    adapter = TypeAdapter(list[PriceDataItem])
+
+    def pydantic_path():
+        rate = np.round((df["Close"] - df["Open"]) / df["Open"] * 100, decimals=2).fillna(0)
+        items = [
+            PriceDataItem(
+                date=row["Date"],
+                open=float(row["Open"]),
+                high=float(row["High"]),
+                low=float(row["Low"]),
+                close=float(row["Close"]),
+                volume=int(row["Volume"]),
+                daily_price_change_rate=float(change),
+            )
+            for (_, row), change in zip(df.iterrows(), rate)
+            if not pd.isna(row["Open"]) and not pd.isna(row["Close"])
+        ]
+        return adapter.dump_json(items)
+
+    def records_path():
+        return processor._price_data_json(df, Frequency.DAILY)
+
+    def columnar_path():
+        return processor._price_data_json(df, Frequency.DAILY, columnar=True)
+
+    print(f"rows={args.rows}")
+    print(f"  {'iterrows + pydantic':<22} {measure(pydantic_path, args.iterations):.3f} ms")
+    print(f"  {'records JSON':<22} {measure(records_path, args.iterations):.3f} ms ({len(records_path())} bytes)")
+    print(f"  {'columnar JSON':<22} {measure(columnar_path, args.iterations):.3f} ms ({len(columnar_path())} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Database._select 쿼리 생성 오버헤드 벤치마크
+
+같은 형태의 조회를 반복하며 문장 캐시(DB_STATEMENT_CACHE_SIZE) 사용 여부에 따른
+쿼리 생성 시간과 `_select` 전체 시간을 비교한다.
+
+실행 예시:
+    ENV=dev python -m benchmarks.select_overhead --ticker 005930 --iterations 2000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from app.database.crud import database
+
+
+def measure(func, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Select statement overhead benchmark")
+    parser.add_argument("--table", default="stock_kr_1d", help="조회 테이블")
+    parser.add_argument("--ticker", default="005930", help="종목 코드")
+    parser.add_argument("--iterations", type=int, default=2000, help="반복 횟수")
+    args = parser.parse_args()
+
+    end = datetime.now()
+    conditions = {"Ticker": args.ticker, "Date__gte": end - timedelta(days=7), "Date__lte": end}
+    query = dict(table=args.table, columns=["Date", "Close"], order="Date", ascending=True, limit=5, **conditions)
+
+    cache = database.statement_cache
+    maxsize = cache.maxsize
+    for enabled in (False, True):
+        cache.maxsize = maxsize if enabled else 0
+        cache.clear()
+        build_us = measure(lambda: database._build_select(**query), args.iterations)
+        select_us = measure(lambda: database._select(**query), args.iterations)
+        print(f"statement cache {'on ' if enabled else 'off'}: build {build_us:.1f} us, _select {select_us:.1f} us")
+    cache.maxsize = maxsize
+    print(cache.get_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.database.conn import db
+from app.database.crud import database
+
+# SQLite TIMESTAMP 컬럼을 datetime 으로 읽도록 등록 (MySQL 드라이버와 같은 타입으로 비교)
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
+
+@pytest.fixture
+def sqlite_database(tmp_path):
+    """database 싱글턴을 임시 SQLite 파일로 연결 (종료 시 원래 엔진으로 복원, 스키마는 엔진이 바뀌면 다시 로드)"""
+    path = tmp_path / "test.db"
+    options = {"native_datetime": True, "connect_args": {"detect_types": sqlite3.PARSE_DECLTYPES}}
+    read_options = {**options, "isolation_level": "AUTOCOMMIT", "pool_reset_on_return": None}
+    engines = {
+        "_engine": create_engine(f"sqlite:///{path}", **options),
+        "_async_engine": create_async_engine(f"sqlite+aiosqlite:///{path}", **options),
+        "_read_engine": create_engine(f"sqlite:///{path}", **read_options),
+        "_async_read_engine": create_async_engine(f"sqlite+aiosqlite:///{path}", **read_options),
+    }
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "DATA_DIR", str(tmp_path))
+        for name, engine in engines.items():
+            mp.setattr(db, name, engine)
+        database.init_meta()
+        try:
+            yield database
+        finally:
+            for engine in engines.values():
+                if hasattr(engine, "sync_engine"):
+                    engine.sync_engine.dispose()
+                else:
+                    engine.dispose()
@@ -0,0 +1,230 @@
+import asyncio
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.modules.common.cache import CacheStrategy, EvictionPolicy, MemoryCache, _LFUIndex, get_caches
+
+
+def _cache(**kwargs) -> MemoryCache:
+    return MemoryCache(namespace="test", **kwargs)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = _cache(max_items=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+
+    cache.set("c", 3, 60)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = _cache(max_items=2, policy=EvictionPolicy.LFU)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    cache.set("c", 3, 60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+
+def test_lfu_tie_evicts_oldest():
+    cache = _cache(max_items=2, policy=EvictionPolicy.LFU)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("b")
+    cache.get("a")
+
+    cache.set("c", 3, 60)
+
+    # a, b 모두 빈도 2 -> 먼저 빈도 2 가 된 b 제거
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+
+def test_lfu_overwrite_keeps_frequency():
+    cache = _cache(max_items=2, policy=EvictionPolicy.LFU)
+    cache.set("hot", np.zeros(10), 60)
+    for _ in range(5):
+        cache.get("hot")
+    cache.set("cold", 1, 60)
+    cache.get("cold")
+
+    # 주기적 갱신으로 값이 교체되어도 빈도는 유지
+    for _ in range(3):
+        cache.set("hot", np.zeros(20), 60)
+    cache.set("new", 2, 60)
+
+    assert cache.get("cold") is None
+    assert cache.get("hot").shape == (20,)
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["bytes"] == sum(entry.size for entry in cache._cache.values())
+
+
+def test_hot_keys_survive_overwrite():
+    cache = _cache(max_items=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    for _ in range(3):
+        cache.get("a")
+    cache.get("b")
+
+    cache.set("a", 10, 60)
+    assert cache.hot_keys() == [
+        {"key": "a", "hits": 3, "bytes": cache._cache["a"].size, "ttl": pytest.approx(60, abs=1)},
+        {"key": "b", "hits": 1, "bytes": cache._cache["b"].size, "ttl": pytest.approx(60, abs=1)},
+    ]
+
+    # 제거/무효화된 키는 조회 수도 삭제
+    cache.set("c", 3, 60)
+    cache.clear("a")
+    assert cache.hot_keys() == []
+    assert cache._key_hits == {}
+
+
+def test_lfu_index_min_frequency():
+    index = _LFUIndex()
+    for key in "abc":
+        index.add(key)
+    for _ in range(5):
+        index.touch("c")
+    index.touch("b")
+
+    assert index.victim() == "a"
+    index.remove("a")
+    assert index.victim() == "b"
+    index.remove("b")
+    assert index.victim() == "c"
+    index.add("d")
+    assert index.victim() == "d"
+    index.remove("d")
+    index.remove("c")
+    assert index.victim() is None
+
+
+def test_byte_quota_eviction():
+    cache = _cache(max_bytes=2000)
+    for key in "abc":
+        cache.set(key, np.zeros(100), 60)
+
+    assert cache.get("a") is None
+    assert cache.get_stats()["bytes"] == 1600
+
+
+def test_oversized_entry_is_skipped():
+    cache = _cache(max_bytes=1000)
+    cache.set("a", np.zeros(10), 60)
+
+    cache.set("big", np.zeros(1000), 60)
+
+    assert cache.get("big") is None
+    assert cache.get("a") is not None
+
+
+def test_empty_frame_not_cached():
+    cache = _cache()
+    cache.set("a", pd.DataFrame(), 60)
+
+    assert cache.get("a") is None
+
+
+def test_same_namespace_registered_separately():
+    first, second = _cache(), _cache()
+
+    assert first.name != second.name
+    assert get_caches()[first.name] is first
+    assert get_caches()[second.name] is second
+
+
+def _loader(values: list):
+    calls = []
+
+    async def load():
+        calls.append(None)
+        await asyncio.sleep(0)
+        return values[len(calls) - 1]
+
+    return load, calls
+
+
+def test_get_or_load_caches_result():
+    cache = _cache()
+    load, calls = _loader(["a", "b"])
+
+    async def main():
+        return await cache.get_or_load("k", load, 60), await cache.get_or_load("k", load, 60)
+
+    assert asyncio.run(main()) == ("a", "a")
+    assert len(calls) == 1
+
+
+def test_stale_served_then_refreshed_once():
+    cache = _cache()
+    load, calls = _loader(["new"])
+    cache.set("k", "old", 0, stale_ttl=60)
+
+    async def main():
+        # 같은 loop tick 의 stale 조회 두 건은 갱신을 한 번만 예약
+        first = await cache.get_or_load("k", load, 60)
+        second = await cache.get_or_load("k", load, 60)
+        await asyncio.gather(*cache._refresh_tasks)
+        return first, second, await cache.get_or_load("k", load, 60)
+
+    assert asyncio.run(main()) == ("old", "old", "new")
+    assert len(calls) == 1
+    assert cache.get_stats()["refreshes"] == 1
+    assert cache.get_stats()["stale_hits"] == 2
+
+
+def test_expired_entry_is_reloaded():
+    cache = _cache()
+    load, calls = _loader(["new"])
+    cache.set("k", "old", 0, stale_ttl=0)
+
+    assert asyncio.run(cache.get_or_load("k", load, 60)) == "new"
+    assert len(calls) == 1
+
+
+def test_permanent_entry_never_goes_stale():
+    cache = _cache()
+    cache.set("k", "v", 0, CacheStrategy.PERMANENT)
+
+    assert cache.get("k") == "v"
+    assert cache._cache["k"].expires_at == math.inf
+
+
+def test_no_cache_always_loads():
+    cache = _cache()
+    load, calls = _loader(["a", "b"])
+
+    async def main():
+        return (
+            await cache.get_or_load("k", load, 60, CacheStrategy.NO_CACHE),
+            await cache.get_or_load("k", load, 60, CacheStrategy.NO_CACHE),
+        )
+
+    assert asyncio.run(main()) == ("a", "b")
+    assert cache.get("k") is None
+
+
+def test_loader_error_is_not_cached():
+    cache = _cache()
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.get_or_load("k", fail, 60))
+    assert cache.get("k") is None
+    assert cache.get_stats()["load_errors"] == 1
@@ -0,0 +1,208 @@
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from sqlalchemy import text
+
+from app.database.crud import _range_bounds
+from app.modules.common.cache import cache_tag
+from app.modules.common.invalidation import invalidation_bus
+
+START = datetime(2024, 1, 2)
+ROWS = 25
+
+
+@pytest.fixture
+def prices(sqlite_database):
+    with sqlite_database.get_connection() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE stock_us_1d (Date TIMESTAMP, Ticker TEXT, Open REAL, Close REAL, Volume INTEGER, "
+                "Market TEXT, PRIMARY KEY (Ticker, Date))"
+            )
+        )
+        connection.execute(
+            text("INSERT INTO stock_us_1d VALUES (:Date, :Ticker, :Open, :Close, :Volume, :Market)"),
+            [
+                {
+                    "Date": START + timedelta(days=i),
+                    "Ticker": "AAPL",
+                    "Open": 100.0 + i,
+                    "Close": 100.5 + i,
+                    "Volume": 1000 + i,
+                    "Market": "NAS",
+                }
+                for i in range(ROWS)
+            ],
+        )
+    return sqlite_database
+
+
+def _select(database, **kwargs) -> pa.Table:
+    return database._select_arrow("stock_us_1d", order="Date", ascending=True, Ticker="AAPL", **kwargs)
+
+
+def test_select_arrow_types(prices):
+    table = _select(prices)
+
+    assert table.num_rows == ROWS
+    assert table.schema.field("Date").type == pa.timestamp("ns")
+    assert table.schema.field("Volume").type == pa.int64()
+    assert table.schema.field("Close").type == pa.float64()
+    assert table.column("Date")[0].as_py() == START
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 7, ROWS, 1000])
+def test_select_arrow_batched_matches_unbatched(prices, batch_size):
+    expected = _select(prices)
+
+    assert _select(prices, batch_size=batch_size).equals(expected)
+    assert asyncio.run(
+        prices._select_arrow_async("stock_us_1d", order="Date", ascending=True, Ticker="AAPL", batch_size=batch_size)
+    ).equals(expected)
+
+
+@pytest.mark.parametrize("batch_size", [0, 10])
+def test_select_arrow_empty(prices, batch_size):
+    table = _select(prices, batch_size=batch_size, Date__gte=START + timedelta(days=ROWS))
+
+    assert table.num_rows == 0
+    assert table.column_names == ["Date", "Ticker", "Open", "Close", "Volume", "Market"]
+    assert table.schema.field("Date").type == pa.timestamp("ns")
+
+
+def test_select_columns(prices):
+    columns = prices._select_columns("stock_us_1d", columns=["Date", "Close"], order="Date", ascending=True)
+
+    assert list(columns) == ["Date", "Close"]
+    assert columns["Close"][0] == 100.5
+    assert len(columns["Date"]) == ROWS
+
+
+def test_bulk_upsert(prices):
+    source = pd.DataFrame(
+        {
+            "Date": pd.to_datetime([START + timedelta(days=ROWS - 1), START + timedelta(days=ROWS)]),
+            "Ticker": ["AAPL", "AAPL"],
+            "Open": [1.0, 2.0],
+            "Close": [1.5, 2.5],
+            "Volume": [10, 20],
+            "Market": ["NAS", "NAS"],
+        }
+    )
+
+    result = prices._bulk_upsert("stock_us_1d", source, batch_size=1)
+
+    assert (result.rows, result.batches) == (2, 2)
+    table = _select(prices)
+    assert table.num_rows == ROWS + 1
+    assert table.column("Close").to_pylist()[-2:] == [1.5, 2.5]
+    assert table.column("Volume").to_pylist()[-2:] == [10, 20]
+    assert table.column("Close")[0].as_py() == 100.5
+
+
+def test_bulk_upsert_update_columns(prices):
+    rows = [{"Date": START, "Ticker": "AAPL", "Open": 1.0, "Close": 1.5, "Volume": 10, "Market": "NAS"}]
+
+    prices._bulk_upsert("stock_us_1d", rows, update_columns=["Close"])
+
+    table = _select(prices, limit=1)
+    assert table.column("Close")[0].as_py() == 1.5
+    assert table.column("Open")[0].as_py() == 100.0
+
+
+def test_bulk_upsert_unknown_column(prices):
+    with pytest.raises(ValueError):
+        prices._bulk_upsert("stock_us_1d", [{"Date": START, "Ticker": "AAPL", "Price": 1.0}])
+
+
+def _dates(table: pa.Table) -> list:
+    return [value.date() for value in table.column("Date").to_pylist()]
+
+
+def test_between_dates_include_whole_end_day(prices):
+    prices._insert(
+        "stock_us_1d",
+        {"Date": datetime(2024, 1, 5, 15, 30), "Ticker": "MSFT", "Open": 1.0, "Close": 1.0, "Volume": 1, "Market": "NAS"},
+    )
+
+    table = prices._select_arrow(
+        "stock_us_1d", order="Date", ascending=True, Date__between=(date(2024, 1, 3), date(2024, 1, 5))
+    )
+
+    assert _dates(table) == [date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5), date(2024, 1, 5)]
+
+
+def test_between_datetimes_are_inclusive(prices):
+    table = _select(prices, Date__between=(START + timedelta(days=1), START + timedelta(days=3)))
+
+    assert table.num_rows == 3
+
+
+def test_year_and_month(prices):
+    assert _select(prices, Date__year=2024).num_rows == ROWS
+    assert _select(prices, Date__year=2023).num_rows == 0
+    assert _select(prices, Date__month="2024-01").num_rows == ROWS
+    assert _select(prices, Date__month=(2023, 12)).num_rows == 0
+
+
+def test_startswith_escapes_wildcards(prices):
+    prices._insert(
+        "stock_us_1d",
+        [
+            {"Date": START, "Ticker": "A_B", "Open": 1.0, "Close": 1.0, "Volume": 1, "Market": "NAS"},
+            {"Date": START, "Ticker": "AXB", "Open": 1.0, "Close": 1.0, "Volume": 1, "Market": "NAS"},
+        ],
+    )
+
+    table = prices._select_arrow("stock_us_1d", columns=["Ticker"], Ticker__startswith="A_")
+
+    assert table.column("Ticker").to_pylist() == ["A_B"]
+    assert prices._select_arrow("stock_us_1d", columns=["Ticker"], Ticker__startswith="AA").num_rows == ROWS
+
+
+@pytest.mark.parametrize(
+    "op, value, bounds",
+    [
+        ("between", (date(2024, 1, 3), date(2024, 1, 5)), (datetime(2024, 1, 3), datetime(2024, 1, 6))),
+        ("year", 2024, (datetime(2024, 1, 1), datetime(2025, 1, 1))),
+        ("month", "202412", (datetime(2024, 12, 1), datetime(2025, 1, 1))),
+        ("month", date(2024, 2, 15), (datetime(2024, 2, 1), datetime(2024, 3, 1))),
+    ],
+)
+def test_range_bounds(op, value, bounds):
+    assert _range_bounds(op, value) == bounds
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        {"Ticker__year": 2024},
+        {"Ticker__month": "2024-01"},
+        {"Date__like": "2024"},
+        {"Date__gt__lt": 1},
+        {"Ticker__in": None},
+        {"Date__between": None},
+        {"Date__between": date(2024, 1, 1)},
+        {"Date__between": (date(2024, 1, 1),)},
+        {"or__": [{"Date__between": None}]},
+    ],
+)
+def test_invalid_conditions(prices, condition):
+    with pytest.raises(ValueError):
+        prices._select_arrow("stock_us_1d", **condition)
+
+
+def test_bulk_upsert_invalidates_written_months(prices, monkeypatch):
+    published = []
+    monkeypatch.setattr(invalidation_bus, "publish", published.append)
+    rows = [
+        {"Date": datetime(2024, 2, 1), "Ticker": "AAPL", "Open": 1.0, "Close": 1.0, "Volume": 1, "Market": "NAS"},
+        {"Date": datetime(2024, 3, 1), "Ticker": "MSFT", "Open": 1.0, "Close": 1.0, "Volume": 1, "Market": "NAS"},
+    ]
+
+    prices._bulk_upsert("stock_us_1d", rows)
+
+    assert published == [[cache_tag("stock_us_1d", "AAPL", "2024-02"), cache_tag("stock_us_1d", "MSFT", "2024-03")]]
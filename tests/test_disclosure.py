@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.core.exception.custom import InvalidCursorException
+from app.modules.common.enum import FinancialCountry
+from app.modules.disclosure.services import DisclosureService
+
+ROWS = 14
+SIZE = 4
+
+
+@pytest.fixture
+def service(sqlite_database, monkeypatch):
+    with sqlite_database.get_connection() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE usa_disclosure (id INTEGER PRIMARY KEY, form_type TEXT, ticker TEXT, filing_date TIMESTAMP, "
+                "sec_url TEXT, ai_processed INTEGER, company_name TEXT, summary TEXT)"
+            )
+        )
+        # 두 건씩 같은 filing_date (keyset 은 id 로 구분)
+        connection.execute(
+            text(
+                "INSERT INTO usa_disclosure (id, form_type, ticker, filing_date, sec_url, ai_processed, company_name, summary) "
+                "VALUES (:id, '10-K', 'AAPL', :filing_date, 'url', 1, 'Apple', :summary)"
+            ),
+            [
+                {"id": i, "filing_date": datetime(2025, 1, 1) + timedelta(days=i // 2), "summary": f"s{i}"}
+                for i in range(1, ROWS + 1)
+            ],
+        )
+
+    service = DisclosureService()
+    service.queries = []
+    select_async = sqlite_database._select_async
+
+    async def spy(**kwargs):
+        service.queries.append(kwargs)
+        return await select_async(**kwargs)
+
+    monkeypatch.setattr(service.db, "_select_async", spy)
+    return service
+
+
+def _get(service: DisclosureService, **kwargs) -> dict:
+    return asyncio.run(service.get_disclosure(FinancialCountry.USA, "AAPL", "2025", size=SIZE, **kwargs))
+
+
+def _summaries(result: dict) -> list:
+    return [item["summary"] for item in result["data"]]
+
+
+def _page_queries(service: DisclosureService) -> list:
+    return [query for query in service.queries if query["columns"] != ["*__count"]]
+
+
+def test_sequential_pages_use_cached_cursor(service):
+    pages = [_get(service, page=page) for page in (1, 2, 3, 4)]
+
+    assert [_summaries(page) for page in pages] == [
+        [f"s{i}" for i in range(ROWS - SIZE * n, max(ROWS - SIZE * (n + 1), 0), -1)] for n in range(4)
+    ]
+    assert [page["offset"] for page in pages] == [0, 4, 8, 12]
+    assert pages[-1]["next_cursor"] is None
+    assert [query["offset"] for query in _page_queries(service)] == [0, 0, 0, 0]
+    assert all("or__" in query for query in _page_queries(service)[1:])
+
+
+def test_client_cursor(service):
+    first = _get(service, page=1)
+
+    second = _get(service, page=1, cursor=first["next_cursor"])
+
+    assert _summaries(second) == ["s10", "s9", "s8", "s7"]
+    assert second["offset"] is None
+    # 클라이언트 커서는 page 번호와 무관하므로 page -> 커서 캐시를 덮어쓰지 않음
+    assert _summaries(_get(service, page=2)) == ["s10", "s9", "s8", "s7"]
+
+
+def test_page_jump_without_cursor_uses_offset(service):
+    result = _get(service, page=3)
+
+    assert _summaries(result) == ["s6", "s5", "s4", "s3"]
+    assert _page_queries(service)[0]["offset"] == 8
+
+
+def test_count_is_cached(service):
+    _get(service, page=1)
+    _get(service, page=2)
+
+    assert _get(service, page=1)["total_count"] == ROWS
+    assert len([query for query in service.queries if query["columns"] == ["*__count"]]) == 1
+
+
+def test_invalid_cursor(service):
+    with pytest.raises(InvalidCursorException):
+        _get(service, cursor="not-a-cursor")
@@ -0,0 +1,78 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+
+from app.modules.common.cache import MemoryCache
+from app.modules.common.disk_cache import DiskCache
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Date": pd.date_range("2024-01-02", periods=5),
+            "Ticker": ["AAPL"] * 5,
+            "Close": np.arange(5.0),
+            "Volume": np.arange(5, dtype="int64"),
+        }
+    )
+
+
+def test_read_shares_mapped_buffers(tmp_path):
+    disk = DiskCache("test", root=str(tmp_path))
+    disk.write(_frame(), "us", "AAPL", "2024-01")
+
+    snapshot = disk.read("us", "AAPL", "2024-01")
+
+    tm.assert_frame_equal(snapshot.to_frame(), _frame())
+    close = snapshot.to_frame()["Close"].to_numpy()
+    assert not close.flags.owndata
+    assert not close.flags.writeable
+    assert snapshot.slice("2024-01-03", "2024-01-04")["Close"].tolist() == [1.0, 2.0]
+
+
+def test_snapshot_cached_as_is(tmp_path):
+    disk = DiskCache("test", root=str(tmp_path))
+    disk.write(_frame(), "us", "AAPL", "2024-01")
+    snapshot = disk.read("us", "AAPL", "2024-01")
+    cache = MemoryCache(namespace="test")
+
+    cache.set("month", snapshot, 60)
+
+    assert cache.get_snapshot("month") is snapshot
+    disk.delete("us", "AAPL", "2024-01")
+    tm.assert_frame_equal(cache.get("month"), _frame())
+
+
+def test_read_missing(tmp_path):
+    assert DiskCache("test", root=str(tmp_path)).read("us", "AAPL", "2024-01") is None
+
+
+def test_prune_by_size_keeps_recently_used(tmp_path):
+    disk = DiskCache("test", root=str(tmp_path), max_age=0, prune_interval=3600)
+    for i, month in enumerate(["2024-01", "2024-02", "2024-03"]):
+        disk.write(_frame(), "us", "AAPL", month)
+        os.utime(disk.path("us", "AAPL", month), (1000 + i, 1000 + i))
+    size = os.path.getsize(disk.path("us", "AAPL", "2024-01"))
+    disk.read("us", "AAPL", "2024-01")
+
+    disk.max_bytes = size * 2
+    assert disk.prune() == 1
+
+    assert disk.read("us", "AAPL", "2024-02") is None
+    assert disk.read("us", "AAPL", "2024-01") is not None
+    assert disk.read("us", "AAPL", "2024-03") is not None
+
+
+def test_prune_by_age(tmp_path):
+    disk = DiskCache("test", root=str(tmp_path), max_age=60, prune_interval=3600)
+    disk.write(_frame(), "us", "AAPL", "2024-01")
+    disk.write(_frame(), "us", "AAPL", "2024-02")
+    old = time.time() - 120
+    os.utime(disk.path("us", "AAPL", "2024-01"), (old, old))
+
+    assert disk.prune() == 1
+    assert disk.read("us", "AAPL", "2024-01") is None
+    assert disk.read("us", "AAPL", "2024-02") is not None
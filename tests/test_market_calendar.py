@@ -0,0 +1,107 @@
+import json
+from dataclasses import replace
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from app.modules.common.cache import CacheStrategy
+from app.modules.common.enum import Country
+from app.modules.common.market_calendar import (
+    MARKET_OPEN_TTL,
+    KRX,
+    NYSE,
+    check_holiday_coverage,
+    get_cache_expiry,
+    get_data_expiry,
+    load_holidays,
+)
+
+
+@pytest.fixture
+def nyse():
+    return replace(NYSE, settle=timedelta(minutes=120))
+
+
+def test_trading_days(nyse):
+    assert not nyse.is_trading_day(date(2026, 1, 19))  # MLK Day
+    assert nyse.previous_trading_day(date(2026, 1, 20)) == date(2026, 1, 16)
+    assert nyse.next_trading_day(date(2026, 7, 2)) == date(2026, 7, 6)
+
+
+def test_early_close(nyse):
+    assert nyse.session(date(2026, 11, 27))[1].time() == time(13, 0)
+    assert nyse.is_open(datetime(2026, 11, 27, 14, 0))
+    assert not nyse.is_open(datetime(2026, 11, 27, 15, 30))
+
+
+def test_settles_after_close_plus_delay(nyse):
+    assert nyse.last_settled_session(datetime(2026, 3, 10, 17, 0)) == date(2026, 3, 9)
+    assert nyse.last_settled_session(datetime(2026, 3, 10, 18, 30)) == date(2026, 3, 10)
+    assert not nyse.is_settled(date(2026, 3, 10), datetime(2026, 3, 10, 17, 0))
+    assert nyse.is_settled(date(2026, 3, 10), datetime(2026, 3, 10, 18, 30))
+
+
+def test_weekend_settles_with_friday(nyse):
+    assert nyse.settled_until(datetime(2026, 3, 13, 19, 0)) == date(2026, 3, 15)
+
+
+def test_not_settled_past_coverage(nyse):
+    now = datetime(2027, 1, 6, 19, 0)
+
+    assert nyse.settled_until(now) == nyse.covered_until == date(2026, 12, 31)
+    assert not nyse.is_settled(date(2027, 1, 4), now)
+
+
+def test_cache_expiry(nyse):
+    assert nyse.cache_expiry(date(2026, 3, 9), datetime(2026, 3, 10, 11, 0)).strategy == CacheStrategy.PERMANENT
+
+    open_expiry = nyse.cache_expiry(None, datetime(2026, 3, 10, 11, 0))
+    assert (open_expiry.strategy, open_expiry.ttl) == (CacheStrategy.TEMPORARY, MARKET_OPEN_TTL)
+
+    # 마감 확정 후에는 다음 개장(다음 날 09:30)까지 유효
+    closed_expiry = nyse.cache_expiry(None, datetime(2026, 3, 10, 19, 30))
+    assert (closed_expiry.strategy, closed_expiry.ttl) == (CacheStrategy.TEMPORARY, 14 * 60 * 60)
+
+
+def test_cache_expiry_without_calendar():
+    expiry = get_cache_expiry(Country.JP, date(2020, 1, 1), 300)
+
+    assert (expiry.strategy, expiry.ttl) == (CacheStrategy.TEMPORARY, 300)
+
+
+def test_data_expiry_requires_last_bar():
+    assert get_data_expiry(Country.US, date(2025, 3, 31), 60, date(2025, 3, 31)).strategy == CacheStrategy.PERMANENT
+    assert get_data_expiry(Country.US, date(2025, 3, 30), 60, date(2025, 3, 28)).strategy == CacheStrategy.PERMANENT
+    assert get_data_expiry(Country.US, date(2025, 3, 31), 60, date(2025, 3, 28)).strategy == CacheStrategy.TEMPORARY
+    assert get_data_expiry(Country.US, date(2025, 3, 31), 60, None).strategy == CacheStrategy.TEMPORARY
+
+
+def test_data_expiry_before_holiday_coverage():
+    # KRX 연말 휴장(2023-12-29)은 휴장일 표 이전이므로 마지막 거래일을 확인하지 않음
+    assert KRX.expected_last_session(date(2023, 12, 31)) is None
+    assert get_data_expiry(Country.KR, date(2023, 12, 31), 60, date(2023, 12, 28)).strategy == CacheStrategy.PERMANENT
+    assert get_data_expiry(Country.KR, date(2023, 12, 31), 60, None).strategy == CacheStrategy.TEMPORARY
+    assert KRX.expected_last_session(date(2024, 12, 31)) == date(2024, 12, 30)
+
+
+def test_load_holidays(tmp_path):
+    path = tmp_path / "holidays.json"
+    path.write_text(
+        json.dumps(
+            {"X": {"covered_until": "2027-12-31", "holidays": ["2027-01-01"], "early_closes": {"2027-11-26": "13:00"}}}
+        )
+    )
+
+    assert load_holidays(str(path)) == {
+        "X": {
+            "covered_from": None,
+            "covered_until": date(2027, 12, 31),
+            "holidays": frozenset({date(2027, 1, 1)}),
+            "early_closes": {date(2027, 11, 26): time(13, 0)},
+        }
+    }
+
+
+def test_check_holiday_coverage():
+    assert check_holiday_coverage(90, today=date(2026, 10, 16)) == ["KRX", "NYSE"]
+    assert check_holiday_coverage(90, today=date(2026, 1, 1)) == []
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from app.modules.common.cache import MemoryCache
+from app.modules.common.range_cache import RangeCache, merge_ranges, subtract_ranges
+
+SETTLED = date(2024, 1, 10)
+
+
+def d(day: int) -> date:
+    return date(2024, 1, day)
+
+
+class Loader:
+    """요청 구간의 매일 행을 반환하고 호출 구간을 기록 (skip 일자는 행 없음)"""
+
+    def __init__(self, skip: tuple = ()):
+        self.calls = []
+        self.skip = skip
+
+    async def __call__(self, start: date, end: date) -> pd.DataFrame:
+        self.calls.append((start, end))
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        days = [day for day in days if day not in self.skip]
+        return pd.DataFrame({"Date": pd.to_datetime(days), "Close": [float(day.day) for day in days]})
+
+
+def _get(cache: RangeCache, loader: Loader, start: date, end: date, tail_ttl: int = 60, **kwargs) -> pd.DataFrame:
+    return asyncio.run(cache.get("k", start, end, loader, SETTLED, tail_ttl, **kwargs))
+
+
+@pytest.fixture
+def cache() -> RangeCache:
+    return RangeCache(MemoryCache(namespace="test"))
+
+
+def test_merge_ranges():
+    assert merge_ranges([(d(5), d(6)), (d(1), d(2)), (d(3), d(3)), (d(8), d(9))]) == [
+        (d(1), d(3)),
+        (d(5), d(6)),
+        (d(8), d(9)),
+    ]
+
+
+def test_subtract_ranges():
+    covered = [(d(3), d(4)), (d(7), d(8))]
+
+    assert subtract_ranges(d(1), d(10), covered) == [(d(1), d(2)), (d(5), d(6)), (d(9), d(10))]
+    assert subtract_ranges(d(3), d(4), covered) == []
+    assert subtract_ranges(d(2), d(3), covered) == [(d(2), d(2))]
+
+
+def test_only_gaps_are_loaded(cache):
+    loader = Loader()
+    _get(cache, loader, d(3), d(5))
+    _get(cache, loader, d(7), d(8))
+
+    df = _get(cache, loader, d(1), d(9))
+
+    assert loader.calls == [(d(3), d(5)), (d(7), d(8)), (d(1), d(2)), (d(6), d(6)), (d(9), d(9))]
+    assert df["Close"].tolist() == [float(day) for day in range(1, 10)]
+    assert _get(cache, loader, d(2), d(8))["Close"].tolist() == [float(day) for day in range(2, 9)]
+    assert len(loader.calls) == 5
+
+
+def test_expired_tail_is_reloaded(cache):
+    loader = Loader()
+    _get(cache, loader, d(9), d(12), tail_ttl=0)
+
+    _get(cache, loader, d(9), d(12), tail_ttl=0)
+
+    # 확정 구간(~10일)은 유지, tail(11~12일)만 다시 조회
+    assert loader.calls == [(d(9), d(12)), (d(11), d(12))]
+
+
+def test_non_contiguous_tails_are_kept(cache):
+    loader = Loader()
+    _get(cache, loader, d(12), d(13))
+    _get(cache, loader, d(15), d(16))
+
+    df = _get(cache, loader, d(12), d(16))
+
+    assert loader.calls == [(d(12), d(13)), (d(15), d(16)), (d(14), d(14))]
+    assert df["Close"].tolist() == [12.0, 13.0, 14.0, 15.0, 16.0]
+
+
+def test_missing_last_session_is_not_settled(cache):
+    late = Loader(skip=(d(10),))
+    _get(cache, late, d(8), d(10), tail_ttl=0, last_session=d(10))
+
+    loader = Loader()
+    df = _get(cache, loader, d(8), d(10), tail_ttl=0, last_session=d(10))
+
+    assert loader.calls == [(d(10), d(10))]
+    assert df["Close"].tolist() == [8.0, 9.0, 10.0]
+
+
+def test_empty_load_is_not_settled(cache):
+    _get(cache, Loader(), d(1), d(3))
+    empty = Loader(skip=(d(5), d(6)))
+    _get(cache, empty, d(5), d(6), tail_ttl=0)
+
+    # 행이 없던 확정 구간(5~6일)은 만료 후 다시 조회
+    loader = Loader()
+    df = _get(cache, loader, d(1), d(6))
+
+    assert loader.calls == [(d(4), d(6))]
+    assert df["Close"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_loader_pieces_are_merged(cache):
+    loader = Loader()
+
+    async def pieces(start: date, end: date) -> list:
+        return [await loader(start, d(2)), pd.DataFrame(columns=["Date", "Close"]), await loader(d(3), end)]
+
+    df = asyncio.run(cache.get("k", d(1), d(4), pieces, SETTLED, 60))
+
+    assert df["Close"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert not df["Close"].to_numpy().flags.writeable
@@ -0,0 +1,77 @@
+from datetime import time
+
+import numpy as np
+import pandas as pd
+
+from app.modules.common.enum import Frequency, Interval
+from app.modules.common.resample import bucket_starts, resample_ohlcv, source_frequency
+
+
+def _starts(values: list, interval: Interval, session_open: time | None = None) -> list:
+    dates = pd.to_datetime(values).to_numpy(dtype="datetime64[ns]")
+    return [str(pd.Timestamp(value)) for value in bucket_starts(dates, interval, session_open)]
+
+
+def test_source_frequency():
+    assert source_frequency(Interval.MINUTE_15) == Frequency.MINUTE
+    assert source_frequency(Interval.WEEK) == Frequency.DAILY
+
+
+def test_week_starts_on_monday():
+    assert _starts(["2026-10-12", "2026-10-16", "2026-10-18", "2026-10-19"], Interval.WEEK) == [
+        "2026-10-12 00:00:00",
+        "2026-10-12 00:00:00",
+        "2026-10-12 00:00:00",
+        "2026-10-19 00:00:00",
+    ]
+
+
+def test_month_and_year():
+    assert _starts(["2024-02-29", "2024-03-01"], Interval.MONTH) == ["2024-02-01 00:00:00", "2024-03-01 00:00:00"]
+    assert _starts(["2024-12-31", "2025-01-02"], Interval.YEAR) == ["2024-01-01 00:00:00", "2025-01-01 00:00:00"]
+
+
+def test_intraday_anchored_to_session_open():
+    values = ["2026-10-15 09:30", "2026-10-15 10:29", "2026-10-15 10:30", "2026-10-15 15:59"]
+
+    assert _starts(values, Interval.MINUTE_60, time(9, 30)) == [
+        "2026-10-15 09:30:00",
+        "2026-10-15 09:30:00",
+        "2026-10-15 10:30:00",
+        "2026-10-15 15:30:00",
+    ]
+    assert _starts(values, Interval.MINUTE_60) == [
+        "2026-10-15 09:00:00",
+        "2026-10-15 10:00:00",
+        "2026-10-15 10:00:00",
+        "2026-10-15 15:00:00",
+    ]
+    assert _starts(["2026-10-15 09:44", "2026-10-15 09:45"], Interval.MINUTE_15, time(9, 30)) == [
+        "2026-10-15 09:30:00",
+        "2026-10-15 09:45:00",
+    ]
+
+
+def test_resample_ohlcv():
+    df = pd.DataFrame(
+        {
+            "Date": pd.date_range("2026-10-15 09:30", periods=6, freq="min"),
+            "Open": [10.0, 11.0, np.nan, 12.0, 13.0, 14.0],
+            "High": [10.5, 11.5, 99.0, 12.5, 13.5, 14.5],
+            "Low": [9.5, 10.5, 0.0, 11.5, 12.5, 13.5],
+            "Close": [10.2, 11.2, 12.2, 12.2, 13.2, 14.2],
+            "Volume": [1, 2, 3, 4, np.nan, 6],
+            "Ticker": ["AAPL"] * 6,
+        }
+    )
+
+    bars = resample_ohlcv(df, Interval.MINUTE_5, time(9, 30))
+
+    # 시가가 없는 09:32 봉은 제외
+    assert bars["Date"].tolist() == [pd.Timestamp("2026-10-15 09:30"), pd.Timestamp("2026-10-15 09:35")]
+    assert bars["Open"].tolist() == [10.0, 14.0]
+    assert bars["High"].tolist() == [13.5, 14.5]
+    assert bars["Low"].tolist() == [9.5, 13.5]
+    assert bars["Close"].tolist() == [13.2, 14.2]
+    assert bars["Volume"].tolist() == [7.0, 6.0]
+    assert bars["Ticker"].tolist() == ["AAPL", "AAPL"]
@@ -0,0 +1,50 @@
+import json
+import os
+
+import pytest
+from sqlalchemy import MetaData, text
+from sqlalchemy.dialects import mysql
+
+from app.database.schema import SchemaCache, _build_type, _type_spec
+
+
+@pytest.mark.parametrize(
+    "column_type",
+    [
+        mysql.VARCHAR(20, collation="utf8mb4_bin"),
+        mysql.BIGINT(unsigned=True),
+        mysql.DOUBLE(),
+        mysql.DECIMAL(10, 2),
+        mysql.DATETIME(fsp=6),
+        mysql.TINYINT(display_width=1),
+        mysql.ENUM("10-K", "10-Q"),
+    ],
+)
+def test_type_spec_round_trip(column_type):
+    spec = json.loads(json.dumps(_type_spec(column_type)))
+
+    assert repr(_build_type(spec)) == repr(column_type)
+
+
+def test_build_type_rejects_other_modules():
+    with pytest.raises(ValueError):
+        _build_type({"module": "os", "name": "system", "args": ["true"], "kwargs": {}})
+
+
+def test_schema_cache_file(sqlite_database, tmp_path):
+    with sqlite_database.get_connection() as connection:
+        connection.execute(
+            text("CREATE TABLE stock_kr_1d (Date TIMESTAMP, Ticker VARCHAR(10), Close REAL, PRIMARY KEY (Ticker, Date))")
+        )
+
+    reflected = SchemaCache(MetaData(), sqlite_database.conn, "1", root=str(tmp_path))
+    expected = reflected.table("stock_kr_1d")
+    assert reflected.reflected == 1
+    assert os.listdir(reflected.directory) == ["stock_kr_1d.json"]
+
+    cached = SchemaCache(MetaData(), sqlite_database.conn, "1", root=str(tmp_path))
+    table = cached.table("stock_kr_1d")
+    assert (cached.reflected, cached.file_loads) == (0, 1)
+    assert [column.name for column in table.columns] == [column.name for column in expected.columns]
+    assert [repr(column.type) for column in table.columns] == [repr(column.type) for column in expected.columns]
+    assert [column.name for column in table.primary_key.columns] == ["Ticker", "Date"]
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from app.modules.common.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_load():
+    flight = SingleFlight()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    async def main():
+        return await asyncio.gather(*[flight.do("k", loader) for _ in range(5)])
+
+    assert asyncio.run(main()) == [1] * 5
+    assert (flight.loads, flight.coalesced, flight.inflight) == (1, 4, 0)
+
+
+def test_exception_reaches_every_waiter():
+    flight = SingleFlight()
+
+    async def loader():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        return await asyncio.gather(*[flight.do("k", loader) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert [type(result) for result in results] == [RuntimeError] * 3
+    assert flight.loads == 1
+
+
+def test_completed_load_is_not_reused():
+    flight = SingleFlight()
+
+    async def loader():
+        return object()
+
+    async def main():
+        return await flight.do("k", loader), await flight.do("k", loader)
+
+    first, second = asyncio.run(main())
+    assert first is not second
+    assert flight.loads == 2
+
+
+def test_cancelled_caller_does_not_cancel_load():
+    flight = SingleFlight()
+
+    async def loader():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("k", loader))
+        second = asyncio.ensure_future(flight.do("k", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "done"
@@ -0,0 +1,80 @@
+import json
+import time
+
+from app.core.warmup import AccessStats, WarmupLock
+from app.modules.common.enum import Country
+
+DAY = 60 * 60 * 24
+
+
+def test_decay_prefers_recent(tmp_path):
+    stats = AccessStats(str(tmp_path / "stats.json"), DAY)
+    now = time.time()
+    for _ in range(8):
+        stats.record(Country.US, "OLD")
+    stats.decay(now + 3 * DAY)
+    for _ in range(2):
+        stats.record(Country.US, "NEW")
+
+    assert round(stats._counts[(Country.US, "OLD")], 4) == 1.0
+    assert stats.top(1) == [(Country.US, "NEW")]
+
+
+def test_decay_drops_small_counts(tmp_path):
+    stats = AccessStats(str(tmp_path / "stats.json"), DAY)
+    stats.record(Country.KR, "005930")
+
+    stats.decay(time.time() + 10 * DAY)
+
+    assert stats.top(10) == []
+
+
+def test_save_and_load_decays_downtime(tmp_path):
+    path = tmp_path / "warmup" / "stats.json"
+    stats = AccessStats(str(path), DAY)
+    for _ in range(4):
+        stats.record(Country.KR, "005930")
+    stats.save()
+
+    saved = json.loads(path.read_text())
+    saved["saved_at"] -= DAY
+    path.write_text(json.dumps(saved))
+    loaded = AccessStats(str(path), DAY)
+    loaded.load()
+
+    assert round(loaded._counts[(Country.KR, "005930")], 2) == 2.0
+    assert [p.name for p in path.parent.iterdir()] == ["stats.json"]
+
+
+def test_workers_merge_saved_stats(tmp_path):
+    path = str(tmp_path / "warmup" / "stats.json")
+    first, second = AccessStats(path, DAY), AccessStats(path, DAY)
+    for _ in range(3):
+        first.record(Country.US, "AAPL")
+    second.record(Country.KR, "005930")
+
+    first.save()
+    second.save()
+    first.save()
+
+    loaded = AccessStats(path, DAY)
+    loaded.load()
+    assert {target: round(count) for target, count in loaded._counts.items()} == {
+        (Country.US, "AAPL"): 3,
+        (Country.KR, "005930"): 1,
+    }
+    assert second.top(2) == [(Country.US, "AAPL"), (Country.KR, "005930")]
+
+
+def test_warmup_lock_single_holder(tmp_path):
+    path = str(tmp_path / "warmup" / "warmup.lock")
+    leader, follower = WarmupLock(path), WarmupLock(path)
+
+    assert leader.acquire()
+    assert leader.acquire()
+    assert not follower.acquire()
+
+    leader.release()
+    assert follower.acquire()
+    assert not leader.acquire()
+    follower.release()